@@ -1,7 +1,13 @@
 """Streamlit web frontend for Document Translator."""
 
 import streamlit as st
+import atexit
+import gc
+import hashlib
 import tempfile
+import shutil
+import threading
+import time
 import os
 import sys
 from pathlib import Path
@@ -10,65 +16,126 @@ from dotenv import load_dotenv
 # Load environment variables from .env
 load_dotenv()
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add src to path once (already present when run as a script; Streamlit
+# re-executes this module on every rerun)
+SRC_DIR = str(Path(__file__).resolve().parent)
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 from models.config import TranslationConfig
+from models.languages import LANGUAGES
 from services.document_translator import DocumentTranslator
 
-# Language options
-LANGUAGES = {
-    "Auto-detect": None,
-    "English": "en",
-    "Spanish": "es",
-    "French": "fr",
-    "German": "de",
-    "Italian": "it",
-    "Portuguese": "pt",
-    "Russian": "ru",
-    "Chinese (Simplified)": "zh-cn",
-    "Chinese (Traditional)": "zh-tw",
-    "Japanese": "ja",
-    "Korean": "ko",
-    "Arabic": "ar",
-    "Hindi": "hi",
-    "Dutch": "nl",
-    "Polish": "pl",
-    "Turkish": "tr",
-    "Vietnamese": "vi",
-    "Thai": "th",
-    "Swedish": "sv",
-    "Danish": "da",
-    "Finnish": "fi",
-    "Norwegian": "no",
-    "Czech": "cs",
-    "Greek": "el",
-    "Hebrew": "he",
-    "Hungarian": "hu",
-    "Indonesian": "id",
-    "Malay": "ms",
-    "Romanian": "ro",
-    "Slovak": "sk",
-    "Ukrainian": "uk",
-    "Bengali": "bn",
-    "Tamil": "ta",
-    "Telugu": "te",
-}
+# Selectbox options, built once per script run. Selections are stored as
+# indices into these tuples, so lookups never walk the option lists.
+LANGUAGE_NAMES = tuple(LANGUAGES)
+LANGUAGE_CODES_BY_INDEX = tuple(LANGUAGES.values())
 
 # Target languages (without auto-detect)
-TARGET_LANGUAGES = {k: v for k, v in LANGUAGES.items() if v is not None}
+TARGET_LANGUAGE_NAMES = tuple(k for k, v in LANGUAGES.items() if v is not None)
+TARGET_LANGUAGE_CODES_BY_INDEX = tuple(LANGUAGES[k] for k in TARGET_LANGUAGE_NAMES)
+
+# Outputs larger than this stay on disk instead of in session state
+LARGE_OUTPUT_BYTES = 50 * 1024 * 1024
+
+# Outputs kept on disk live here; files older than the max age belong to
+# ended sessions and are swept on startup and before each translation
+OUTPUT_DIR = Path(tempfile.gettempdir()) / "doclayout_outputs"
+OUTPUT_MAX_AGE_SECONDS = 60 * 60
+
+
+def api_key_digest(api_key: str) -> str:
+    """Digest identifying an API key in cache keys without storing the key itself."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+@st.cache_resource
+def get_translator(
+    target_language: str,
+    key_digest: str,
+    source_language: str,
+    use_gpu: bool,
+    min_font_size: float,
+    _api_key: str,
+) -> DocumentTranslator:
+    """
+    Get a DocumentTranslator reused across reruns for the same settings.
+    
+    The cache is keyed on key_digest; the leading underscore keeps the raw
+    _api_key out of Streamlit's cache key. Each translator's service owns a
+    Gemini client built with its own key, so translators for different keys
+    never share a client. Cached translators live as long as the server
+    process, so their translation resources are released when it exits.
+    """
+    config = TranslationConfig(
+        target_language=target_language,
+        gemini_api_key=_api_key,
+        source_language=source_language,
+        use_gpu=use_gpu,
+        min_font_size=min_font_size,
+    )
+    translator = DocumentTranslator(config)
+    atexit.register(translator.close)
+    return translator
+
+
+@st.cache_resource
+def get_translator_lock(
+    target_language: str,
+    key_digest: str,
+    source_language: str,
+    use_gpu: bool,
+    min_font_size: float,
+) -> threading.Lock:
+    """
+    Get the lock for the translator cached under the same settings.
+    
+    A DocumentTranslator runs one document at a time, so sessions sharing
+    a translator take turns while sessions with other settings run freely.
+    """
+    return threading.Lock()
+
+
+def sweep_output_dir() -> Path:
+    """Create the output directory and delete outputs past their max age."""
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    cutoff = time.time() - OUTPUT_MAX_AGE_SECONDS
+    for path in OUTPUT_DIR.glob("*.pdf"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass  # Removed by another session's sweep
+    return OUTPUT_DIR
+
+
+@st.cache_resource
+def init_output_dir() -> Path:
+    """Sweep outputs left by a previous server run, once per process."""
+    return sweep_output_dir()
 
 
 def init_session_state():
     """Initialize session state variables."""
     if "translated_pdf" not in st.session_state:
         st.session_state.translated_pdf = None
+    if "translated_pdf_path" not in st.session_state:
+        st.session_state.translated_pdf_path = None
     if "translation_complete" not in st.session_state:
         st.session_state.translation_complete = False
     if "summary" not in st.session_state:
         st.session_state.summary = None
 
 
+def clear_translated_output():
+    """Drop the previous translation result and any file kept on disk for it."""
+    path = st.session_state.translated_pdf_path
+    if path and os.path.exists(path):
+        os.remove(path)
+    st.session_state.translated_pdf = None
+    st.session_state.translated_pdf_path = None
+
+
 def main():
     """Main Streamlit app."""
     st.set_page_config(
@@ -78,6 +145,7 @@ def main():
     )
     
     init_session_state()
+    init_output_dir()
     
     # Header
     st.title("📄 Document Translator")
@@ -111,22 +179,28 @@ def main():
     col1, col2 = st.columns(2)
     
     with col1:
-        source_lang_name = st.selectbox(
+        src_idx = st.selectbox(
             "Source Language",
-            options=list(LANGUAGES.keys()),
+            options=range(len(LANGUAGE_NAMES)),
+            format_func=LANGUAGE_NAMES.__getitem__,
             index=0,  # Default to Auto-detect
+            key="src_idx",
             help="Select the language of the input document, or choose Auto-detect",
         )
-        source_lang = LANGUAGES[source_lang_name]
+        source_lang_name = LANGUAGE_NAMES[src_idx]
+        source_lang = LANGUAGE_CODES_BY_INDEX[src_idx]
     
     with col2:
-        target_lang_name = st.selectbox(
+        tgt_idx = st.selectbox(
             "Target Language",
-            options=list(TARGET_LANGUAGES.keys()),
+            options=range(len(TARGET_LANGUAGE_NAMES)),
+            format_func=TARGET_LANGUAGE_NAMES.__getitem__,
             index=1,  # Default to Spanish
+            key="tgt_idx",
             help="Select the language to translate to",
         )
-        target_lang = TARGET_LANGUAGES[target_lang_name]
+        target_lang_name = TARGET_LANGUAGE_NAMES[tgt_idx]
+        target_lang = TARGET_LANGUAGE_CODES_BY_INDEX[tgt_idx]
     
     # Show selected options
     if source_lang:
@@ -165,7 +239,8 @@ def main():
         )
     
     # Show results
-    if st.session_state.translation_complete and st.session_state.translated_pdf:
+    has_output = st.session_state.translated_pdf or st.session_state.translated_pdf_path
+    if st.session_state.translation_complete and has_output:
         st.divider()
         st.success("✅ Translation Complete!")
         
@@ -181,21 +256,31 @@ def main():
                 st.metric("Time", f"{summary.processing_time_seconds:.1f}s")
             
             if summary.errors:
-                with st.expander(f"⚠️ Warnings ({len(summary.errors)})"):
+                with st.expander(f"⚠️ Warnings ({summary.error_count})"):
                     for error in summary.errors:
                         st.warning(error)
         
         # Download button
         output_filename = uploaded_file.name.replace(".pdf", f"_{target_lang}.pdf")
         
-        st.download_button(
+        download_kwargs = dict(
             label="📥 Download Translated PDF",
-            data=st.session_state.translated_pdf,
             file_name=output_filename,
             mime="application/pdf",
             type="primary",
             use_container_width=True,
         )
+        if st.session_state.translated_pdf_path:
+            # Large output: hand Streamlit the file instead of bytes held in state
+            if not os.path.exists(st.session_state.translated_pdf_path):
+                st.info("The translated file has expired. Please translate the document again.")
+                clear_translated_output()
+                st.session_state.translation_complete = False
+                return
+            with open(st.session_state.translated_pdf_path, "rb") as f:
+                st.download_button(data=f, **download_kwargs)
+        else:
+            st.download_button(data=st.session_state.translated_pdf, **download_kwargs)
 
 
 def translate_document(
@@ -208,31 +293,34 @@ def translate_document(
 ):
     """Translate the uploaded document."""
     # Reset state
-    st.session_state.translated_pdf = None
+    clear_translated_output()
     st.session_state.translation_complete = False
     st.session_state.summary = None
     
+    # Output lives outside the temp dir so large results can be served from disk
+    fd, output_path = tempfile.mkstemp(suffix=".pdf", dir=sweep_output_dir())
+    os.close(fd)
+    
     # Create temp files
     with tempfile.TemporaryDirectory() as temp_dir:
         input_path = os.path.join(temp_dir, "input.pdf")
-        output_path = os.path.join(temp_dir, "output.pdf")
         
-        # Save uploaded file
+        # Save uploaded file (streamed in chunks to avoid an extra in-memory copy)
+        uploaded_file.seek(0)
         with open(input_path, "wb") as f:
-            f.write(uploaded_file.getvalue())
+            shutil.copyfileobj(uploaded_file, f, length=1024 * 1024)
         
-        # Create config
-        config = TranslationConfig(
-            target_language=target_lang,
-            gemini_api_key=api_key,
-            source_language=source_lang,
-            use_gpu=use_gpu,
-            min_font_size=min_font_size,
+        # Get cached translator
+        key_digest = api_key_digest(api_key)
+        translator = get_translator(
+            target_lang,
+            key_digest,
+            source_lang,
+            use_gpu,
+            min_font_size,
+            _api_key=api_key,
         )
         
-        # Create translator
-        translator = DocumentTranslator(config)
-        
         # Progress indicators
         progress_bar = st.progress(0, text="Initializing...")
         status_text = st.empty()
@@ -246,14 +334,29 @@ def translate_document(
             status_text.text("🔍 Detecting language and extracting text...")
             progress_bar.progress(30, text="Extracting text...")
             
-            summary = translator.translate_document(input_path, output_path)
+            def on_translation_progress(completed: int, total: int) -> None:
+                percent = 30 + int(60 * completed / max(total, 1))
+                progress_bar.progress(percent, text=f"Translating... ({completed}/{total})")
+            
+            with get_translator_lock(
+                target_lang,
+                key_digest,
+                source_lang,
+                use_gpu,
+                min_font_size,
+            ):
+                summary = translator.translate_document(
+                    input_path, output_path, progress_callback=on_translation_progress
+                )
             
             progress_bar.progress(90, text="Finalizing...")
             
             if summary.success:
-                # Read output file
-                with open(output_path, "rb") as f:
-                    st.session_state.translated_pdf = f.read()
+                if os.path.getsize(output_path) > LARGE_OUTPUT_BYTES:
+                    st.session_state.translated_pdf_path = output_path
+                else:
+                    with open(output_path, "rb") as f:
+                        st.session_state.translated_pdf = f.read()
                 
                 st.session_state.translation_complete = True
                 st.session_state.summary = summary
@@ -269,6 +372,12 @@ def translate_document(
             progress_bar.empty()
             status_text.empty()
             st.error(f"Error: {str(e)}")
+    
+    if output_path != st.session_state.translated_pdf_path and os.path.exists(output_path):
+        os.remove(output_path)
+    
+    # Release parser/OCR buffers from this run before the next rerun
+    gc.collect()
 
 
 if __name__ == "__main__":
@@ -2,16 +2,22 @@
 """CLI interface for the Document Translator."""
 
 import argparse
+import io
 import sys
 import os
 import logging
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add src to path unless already present (it is when run as a script)
+SRC_DIR = str(Path(__file__).resolve().parent)
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 from models.config import TranslationConfig
+from models.languages import LANGUAGE_CODES
 from services.document_translator import DocumentTranslator
 
 
@@ -25,8 +31,9 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments."""
+@lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; repeated calls share the same instance."""
     parser = argparse.ArgumentParser(
         description="Translate PDF documents while preserving layout.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -43,6 +50,9 @@ Examples:
 
   # Use GPU acceleration
   python main.py input.pdf output.pdf --target ja --api-key YOUR_API_KEY --gpu
+
+  # Submit translations through the Gemini Batch API (slower turnaround, lower cost)
+  python main.py --batch input1.pdf:output1.pdf input2.pdf:output2.pdf --target de --async-batch
         """,
     )
     
@@ -81,21 +91,34 @@ Examples:
     # API configuration
     parser.add_argument(
         "--api-key", "-k",
-        default=os.environ.get("GEMINI_API_KEY"),
+        default=None,
         help="Gemini API key (or set GEMINI_API_KEY env var)",
     )
     
     # Processing options
     parser.add_argument(
         "--gpu",
-        action="store_true",
+        action=argparse.BooleanOptionalAction,
+        default=False,
         help="Enable GPU acceleration for OCR",
     )
+    parser.add_argument(
+        "--fast-ocr",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Use FP16/TensorRT OCR inference on GPU (faster; may differ on low-contrast scans)",
+    )
     parser.add_argument(
         "--batch-size",
         type=int,
         default=10,
-        help="Batch size for translation API calls (default: 10)",
+        help="Maximum concurrent translation API calls (default: 10)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Worker processes for --batch; each loads its own OCR model (default: 2)",
     )
     parser.add_argument(
         "--min-font-size",
@@ -103,78 +126,104 @@ Examples:
         default=6.0,
         help="Minimum font size in points (default: 6.0)",
     )
+    parser.add_argument(
+        "--async-batch",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Route translations through the Gemini Batch API (non-interactive, lower cost)",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        default=None,
+        help="SQLite file of translations reused across runs (created if missing)",
+    )
     
     # Output options
     parser.add_argument(
         "--verbose", "-v",
-        action="store_true",
+        action=argparse.BooleanOptionalAction,
+        default=False,
         help="Enable verbose output",
     )
     parser.add_argument(
         "--quiet", "-q",
-        action="store_true",
+        action=argparse.BooleanOptionalAction,
+        default=False,
         help="Suppress non-error output",
     )
     
-    return parser.parse_args()
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    args = build_parser().parse_args(argv)
+    # Resolved per call so the cached parser never holds a stale key
+    if args.api_key is None:
+        args.api_key = os.environ.get("GEMINI_API_KEY")
+    return args
 
 
-def validate_args(args: argparse.Namespace) -> bool:
-    """Validate command-line arguments."""
+def parse_batch_pairs(batch: List[str]) -> List[Tuple[str, str]]:
+    """Split INPUT:OUTPUT batch arguments into (input, output) pairs."""
+    pairs = []
+    for pair in batch:
+        input_path, _, output_path = pair.partition(":")
+        pairs.append((input_path, output_path))
+    return pairs
+
+
+def validate_args(args: argparse.Namespace, pairs: List[Tuple[str, str]]) -> bool:
+    """Validate command-line arguments and the resolved input/output pairs."""
     # Check API key
     if not args.api_key:
         print("Error: Gemini API key is required. Use --api-key or set GEMINI_API_KEY env var.")
         return False
     
+    # Check language codes before any API calls are made
+    if args.target not in LANGUAGE_CODES:
+        print(f"Error: Unsupported target language: {args.target}")
+        return False
+    if args.source and args.source not in LANGUAGE_CODES:
+        print(f"Error: Unsupported source language: {args.source}")
+        return False
+    
     # Check input/output for single file mode
-    if not args.batch:
-        if not args.input or not args.output:
-            print("Error: Input and output paths are required (or use --batch for batch mode).")
-            return False
-        
-        if not os.path.exists(args.input):
-            print(f"Error: Input file not found: {args.input}")
-            return False
+    if not args.batch and (not args.input or not args.output):
+        print("Error: Input and output paths are required (or use --batch for batch mode).")
+        return False
+    
+    # Validate every pair, reporting all problems at once
+    errors: List[str] = []
+    for input_path, output_path in pairs:
+        if not output_path:
+            errors.append(f"Error: Invalid batch format '{input_path}'. Use INPUT:OUTPUT format.")
+            continue
         
-        if not args.input.lower().endswith(".pdf"):
-            print(f"Error: Input file must be a PDF: {args.input}")
-            return False
+        path = Path(input_path)
+        if not path.is_file():
+            errors.append(f"Error: Input file not found: {input_path}")
+        elif path.suffix.lower() != ".pdf":
+            errors.append(f"Error: Input file must be a PDF: {input_path}")
     
-    # Validate batch mode
-    if args.batch:
-        for pair in args.batch:
-            if ":" not in pair:
-                print(f"Error: Invalid batch format '{pair}'. Use INPUT:OUTPUT format.")
-                return False
-            
-            input_path, output_path = pair.split(":", 1)
-            if not os.path.exists(input_path):
-                print(f"Error: Input file not found: {input_path}")
-                return False
+    if errors:
+        print("\n".join(errors))
+        return False
     
     return True
 
 
-def get_input_output_pairs(args: argparse.Namespace) -> List[Tuple[str, str]]:
-    """Get list of input/output file pairs."""
-    if args.batch:
-        pairs = []
-        for pair in args.batch:
-            input_path, output_path = pair.split(":", 1)
-            pairs.append((input_path, output_path))
-        return pairs
-    else:
-        return [(args.input, args.output)]
-
-
 def print_summary(summaries: list, quiet: bool = False) -> None:
-    """Print translation summary."""
+    """Print translation summary as a single buffered write."""
     if quiet:
         return
     
-    print("\n" + "=" * 60)
-    print("TRANSLATION SUMMARY")
-    print("=" * 60)
+    buf = io.StringIO()
+    
+    print("\n" + "=" * 60, file=buf)
+    print("TRANSLATION SUMMARY", file=buf)
+    print("=" * 60, file=buf)
     
     total_pages = 0
     total_blocks = 0
@@ -184,18 +233,21 @@ def print_summary(summaries: list, quiet: bool = False) -> None:
     
     for summary in summaries:
         status = "✓" if summary.success else "✗"
-        print(f"\n{status} {summary.input_file} -> {summary.output_file}")
-        print(f"  Pages: {summary.pages_processed}")
-        print(f"  Text blocks: {summary.text_blocks_translated}")
-        print(f"  Images processed: {summary.images_processed}")
-        print(f"  Time: {summary.processing_time_seconds:.2f}s")
+        print(f"\n{status} {summary.input_file} -> {summary.output_file}", file=buf)
+        print(f"  Pages: {summary.pages_processed}", file=buf)
+        print(f"  Text blocks: {summary.text_blocks_translated}", file=buf)
+        print(f"  Images processed: {summary.images_processed}", file=buf)
+        print(f"  Time: {summary.processing_time_seconds:.2f}s", file=buf)
         
         if summary.errors:
-            print(f"  Errors: {len(summary.errors)}")
-            for error in summary.errors[:3]:  # Show first 3 errors
-                print(f"    - {error}")
-            if len(summary.errors) > 3:
-                print(f"    ... and {len(summary.errors) - 3} more")
+            # Show last 3 errors; summary.errors keeps the most recent ones
+            shown = list(islice(summary.errors, max(len(summary.errors) - 3, 0), None))
+            if summary.error_count > len(shown):
+                print(f"  Errors: {summary.error_count} (showing last {len(shown)})", file=buf)
+            else:
+                print(f"  Errors: {summary.error_count}", file=buf)
+            for error in shown:
+                print(f"    - {error}", file=buf)
         
         total_pages += summary.pages_processed
         total_blocks += summary.text_blocks_translated
@@ -204,13 +256,16 @@ def print_summary(summaries: list, quiet: bool = False) -> None:
         if not summary.success:
             failed += 1
     
-    print("\n" + "-" * 60)
+    print("\n" + "-" * 60, file=buf)
     print(f"Total: {len(summaries)} documents, {total_pages} pages, "
-          f"{total_blocks} text blocks, {total_images} images")
-    print(f"Time: {total_time:.2f}s")
+          f"{total_blocks} text blocks, {total_images} images", file=buf)
+    print(f"Time: {total_time:.2f}s", file=buf)
     if failed > 0:
-        print(f"Failed: {failed} documents")
-    print("=" * 60)
+        print(f"Failed: {failed} documents", file=buf)
+    print("=" * 60, file=buf)
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 
 def main() -> int:
@@ -223,8 +278,14 @@ def main() -> int:
     else:
         setup_logging(args.verbose)
     
+    # Get input/output pairs
+    if args.batch:
+        pairs = parse_batch_pairs(args.batch)
+    else:
+        pairs = [(args.input, args.output)]
+    
     # Validate arguments
-    if not validate_args(args):
+    if not validate_args(args, pairs):
         return 1
     
     # Create configuration
@@ -235,11 +296,12 @@ def main() -> int:
         use_gpu=args.gpu,
         batch_size=args.batch_size,
         min_font_size=args.min_font_size,
+        use_batch_api=args.async_batch,
+        enable_hpi=args.fast_ocr,
+        translation_cache_path=args.cache,
+        max_batch_workers=args.workers,
     )
     
-    # Get input/output pairs
-    pairs = get_input_output_pairs(args)
-    
     if not args.quiet:
         print(f"Document Translator")
         print(f"Target language: {args.target}")
@@ -248,20 +310,21 @@ def main() -> int:
         else:
             print("Source language: auto-detect")
         print(f"GPU: {'enabled' if args.gpu else 'disabled'}")
+        if args.async_batch:
+            print("Translation mode: Gemini Batch API")
         print(f"Documents to process: {len(pairs)}")
         print()
     
     # Create translator and process
-    translator = DocumentTranslator(config)
-    
-    if len(pairs) == 1:
-        input_path, output_path = pairs[0]
-        if not args.quiet:
-            print(f"Translating: {input_path}")
-        summary = translator.translate_document(input_path, output_path)
-        summaries = [summary]
-    else:
-        summaries = translator.translate_batch(pairs)
+    with DocumentTranslator(config) as translator:
+        if len(pairs) == 1:
+            input_path, output_path = pairs[0]
+            if not args.quiet:
+                print(f"Translating: {input_path}")
+            summary = translator.translate_document(input_path, output_path)
+            summaries = [summary]
+        else:
+            summaries = translator.translate_batch(pairs)
     
     # Print summary
     print_summary(summaries, args.quiet)
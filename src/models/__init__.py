@@ -1,6 +1,7 @@
 # Models package
 from .data_models import (
     BoundingBox,
+    BBoxArray,
     TextBlock,
     ImageRegion,
     PageContent,
@@ -13,9 +14,16 @@ from .data_models import (
     LanguageDetectionResult,
 )
 from .config import TranslationConfig, TranslationSummary
+from .languages import (
+    LANGUAGES,
+    LANGUAGE_CODES,
+    SUPPORTED_LANGUAGES,
+    SUPPORTED_LANGUAGES_SET,
+)
 
 __all__ = [
     "BoundingBox",
+    "BBoxArray",
     "TextBlock",
     "ImageRegion",
     "PageContent",
@@ -28,4 +36,8 @@ __all__ = [
     "LanguageDetectionResult",
     "TranslationConfig",
     "TranslationSummary",
+    "LANGUAGES",
+    "LANGUAGE_CODES",
+    "SUPPORTED_LANGUAGES",
+    "SUPPORTED_LANGUAGES_SET",
 ]
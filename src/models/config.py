@@ -1,10 +1,11 @@
 """Configuration and summary models for the Document Translator."""
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Deque, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationConfig:
     """Configuration for the translation pipeline."""
     target_language: str
@@ -15,9 +16,18 @@ class TranslationConfig:
     min_font_size: float = 6.0
     max_retries: int = 3
     initial_retry_delay: float = 1.0
+    use_batch_api: bool = False
+    skip_ocr_if_native: bool = True
+    native_text_min_coverage: float = 0.5  # Fraction of an image's area under text-layer blocks
+    enable_hpi: bool = False  # FP16/TensorRT OCR inference on GPU; may shift text on low-contrast scans
+    translation_cache_path: Optional[str] = None  # SQLite translation memory reused across runs
+    max_batch_workers: int = 2  # Worker processes for multi-document batches; see DocumentTranslator.translate_batch
 
 
-@dataclass
+MAX_RECORDED_ERRORS = 1000
+
+
+@dataclass(slots=True)
 class TranslationSummary:
     """Summary of a document translation operation."""
     input_file: str
@@ -25,11 +35,13 @@ class TranslationSummary:
     pages_processed: int = 0
     text_blocks_translated: int = 0
     images_processed: int = 0
-    errors: List[str] = field(default_factory=list)
+    errors: Deque[str] = field(default_factory=lambda: deque(maxlen=MAX_RECORDED_ERRORS))
+    error_count: int = 0  # Total errors seen, including ones dropped from errors
     processing_time_seconds: float = 0.0
     success: bool = True
 
     def add_error(self, error: str) -> None:
-        """Add an error message to the summary."""
+        """Add an error message to the summary, keeping only the most recent ones."""
+        self.error_count += 1
         self.errors.append(error)
         self.success = False
@@ -1,9 +1,11 @@
 """Core data models for the Document Translator system."""
 
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Any
+from typing import List, Tuple, Optional, Any, Sequence
 from enum import Enum
 
+import numpy as np
+
 
 class ContentType(Enum):
     """Type of content in a PDF document."""
@@ -14,13 +16,22 @@ class ContentType(Enum):
     TABLE_CELL = "table_cell"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoundingBox:
-    """Represents a rectangular region with coordinates."""
+    """Represents a rectangular region with coordinates.
+
+    Instances are immutable and hashable, so identical boxes can be shared
+    through a dict. The tuple form is built once at construction and reused
+    by to_tuple() and every bbox_tuple property.
+    """
     x0: float
     y0: float
     x1: float
     y1: float
+    _tuple: Tuple[float, float, float, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_tuple", (self.x0, self.y0, self.x1, self.y1))
 
     @property
     def width(self) -> float:
@@ -39,7 +50,7 @@ class BoundingBox:
 
     def to_tuple(self) -> Tuple[float, float, float, float]:
         """Convert to tuple format (x0, y0, x1, y1)."""
-        return (self.x0, self.y0, self.x1, self.y1)
+        return self._tuple
 
     @classmethod
     def from_tuple(cls, t: Tuple[float, float, float, float]) -> 'BoundingBox':
@@ -47,9 +58,30 @@ class BoundingBox:
         return cls(x0=t[0], y0=t[1], x1=t[2], y1=t[3])
 
 
-@dataclass
+@dataclass(slots=True)
+class BBoxArray:
+    """Struct-of-arrays storage for many bounding boxes, for vectorized geometry."""
+    xyxy: np.ndarray  # Shape (N, 4), columns x0, y0, x1, y1
+
+    def __post_init__(self) -> None:
+        self.xyxy = np.asarray(self.xyxy, dtype=np.float64).reshape(-1, 4)
+
+    def __len__(self) -> int:
+        return self.xyxy.shape[0]
+
+    def to_boxes(self) -> List[BoundingBox]:
+        """Convert back to a list of BoundingBox objects."""
+        return [BoundingBox.from_tuple(row) for row in self.xyxy.tolist()]
+
+    @classmethod
+    def from_boxes(cls, boxes: Sequence[BoundingBox]) -> 'BBoxArray':
+        """Create BBoxArray from a sequence of BoundingBox objects."""
+        return cls(xyxy=np.array([box.to_tuple() for box in boxes], dtype=np.float64))
+
+
+@dataclass(frozen=True, slots=True)
 class FontInfo:
-    """Font information for text styling."""
+    """Font information for text styling (immutable and hashable)."""
     name: str
     size: float
     color: Tuple[int, int, int] = (0, 0, 0)  # RGB, default black
@@ -57,7 +89,7 @@ class FontInfo:
     is_italic: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     """A bounded region containing text with position and styling."""
     text: str
@@ -75,13 +107,16 @@ class TextBlock:
         return self.bbox.to_tuple()
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageRegion:
     """An area in the PDF containing an image."""
     image_data: bytes
     bbox: BoundingBox
     page_number: int
     index: int
+    pixel_width: int = 0  # Decoded image size; 0 if unknown
+    pixel_height: int = 0
+    covered_by_text: bool = False  # The native text layer already holds this image's text
 
     @property
     def bbox_tuple(self) -> Tuple[float, float, float, float]:
@@ -89,7 +124,7 @@ class ImageRegion:
         return self.bbox.to_tuple()
 
 
-@dataclass
+@dataclass(slots=True)
 class PageContent:
     """Content extracted from a single PDF page."""
     page_number: int
@@ -98,9 +133,10 @@ class PageContent:
     text_blocks: List[TextBlock] = field(default_factory=list)
     image_regions: List[ImageRegion] = field(default_factory=list)
     raw_elements: List[Any] = field(default_factory=list)
+    content_type: Optional[ContentType] = None  # Set once text-layer coverage is known
 
 
-@dataclass
+@dataclass(slots=True)
 class OCRResult:
     """Result from OCR text extraction."""
     text: str
@@ -113,7 +149,7 @@ class OCRResult:
         return self.bbox.to_tuple()
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationUnit:
     """A unit of text to be translated with all metadata."""
     id: str
@@ -127,7 +163,7 @@ class TranslationUnit:
     table_cell_info: Optional[Tuple[int, int, int]] = None  # (table_index, row, col)
 
 
-@dataclass
+@dataclass(slots=True)
 class TableCell:
     """A single cell within a table."""
     text: str
@@ -144,7 +180,7 @@ class TableCell:
         return self.bbox.to_tuple()
 
 
-@dataclass
+@dataclass(slots=True)
 class TableStructure:
     """Complete table representation."""
     bbox: BoundingBox
@@ -162,7 +198,7 @@ class TableStructure:
         return self.bbox.to_tuple()
 
 
-@dataclass
+@dataclass(slots=True)
 class LanguageDetectionResult:
     """Result of automatic language detection."""
     primary_language: str
@@ -0,0 +1,58 @@
+"""Language tables shared by the CLI and the web frontend."""
+
+import types
+from typing import FrozenSet, Mapping, Optional, Tuple
+
+
+# Display name -> language code (None means auto-detect)
+LANGUAGES: Mapping[str, Optional[str]] = types.MappingProxyType({
+    "Auto-detect": None,
+    "English": "en",
+    "Spanish": "es",
+    "French": "fr",
+    "German": "de",
+    "Italian": "it",
+    "Portuguese": "pt",
+    "Russian": "ru",
+    "Chinese (Simplified)": "zh-cn",
+    "Chinese (Traditional)": "zh-tw",
+    "Japanese": "ja",
+    "Korean": "ko",
+    "Arabic": "ar",
+    "Hindi": "hi",
+    "Dutch": "nl",
+    "Polish": "pl",
+    "Turkish": "tr",
+    "Vietnamese": "vi",
+    "Thai": "th",
+    "Swedish": "sv",
+    "Danish": "da",
+    "Finnish": "fi",
+    "Norwegian": "no",
+    "Czech": "cs",
+    "Greek": "el",
+    "Hebrew": "he",
+    "Hungarian": "hu",
+    "Indonesian": "id",
+    "Malay": "ms",
+    "Romanian": "ro",
+    "Slovak": "sk",
+    "Ukrainian": "uk",
+    "Bengali": "bn",
+    "Tamil": "ta",
+    "Telugu": "te",
+})
+
+# Every accepted language code, for O(1) validation. "zh" is kept as the
+# generic Chinese code the CLI has always documented.
+LANGUAGE_CODES: FrozenSet[str] = frozenset(
+    code for code in LANGUAGES.values() if code
+) | frozenset({"zh"})
+
+# Target languages the translator advertises (DocumentTranslator.get_supported_languages)
+SUPPORTED_LANGUAGES: Tuple[str, ...] = (
+    "en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ko",
+    "ar", "hi", "nl", "pl", "tr", "vi", "th", "sv", "da", "fi",
+    "no", "cs", "el", "he", "hu", "id", "ms", "ro", "sk", "uk",
+)
+SUPPORTED_LANGUAGES_SET: FrozenSet[str] = frozenset(SUPPORTED_LANGUAGES)
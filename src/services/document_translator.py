@@ -1,23 +1,47 @@
 """Document Translator orchestrator - main entry point for the translation pipeline."""
 
+import os
 import time
+import hashlib
+import queue
 import logging
-from typing import List, Tuple, Optional
+import threading
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from itertools import compress
+from typing import Callable, Dict, Iterator, List, Tuple, Optional
 import uuid
 
+import fitz  # PyMuPDF
+import numpy as np
+
 from models.data_models import (
+    BBoxArray,
+    ImageRegion,
+    LanguageDetectionResult,
+    OCRResult,
     TextBlock,
     PageContent,
+    TableCell,
     TableStructure,
     ContentType,
 )
 from models.config import TranslationConfig, TranslationSummary
+from models.languages import SUPPORTED_LANGUAGES
 from services.pdf_parser import PDFParser, PDFParseError
 from services.table_detector import TableDetector
 from services.language_detector import LanguageDetector, LanguageDetectionError
 from services.ocr_engine import OCREngine, OCRError
-from services.translation_service import TranslationService, TranslationRequest, TranslationError
+from services.translation_service import (
+    TranslationService,
+    TranslationRequest,
+    TranslationResult,
+    TranslationError,
+)
 from services.font_adjuster import FontAdjuster
+from services.geometry import overlap_fraction_matrix
 from services.layout_reconstructor import LayoutReconstructor, ReconstructedBlock
 
 
@@ -29,9 +53,22 @@ class DocumentTranslationError(Exception):
     pass
 
 
+# Sentinel passed down the extraction pipeline once the last page is sent
+_PIPELINE_DONE = object()
+
+
 class DocumentTranslator:
     """Main orchestrator that coordinates the entire translation pipeline."""
 
+    # Extraction pipeline configuration
+    PIPELINE_QUEUE_SIZE = 4  # Pages buffered between stages
+    PIPELINE_POLL_INTERVAL = 0.1  # Seconds between stop/timeout checks
+    STREAM_FLUSH_TIMEOUT = 2.0  # Max seconds a block waits before translation starts
+    TABLE_OVERLAP_THRESHOLD = 0.8  # Fraction of a block inside a table to treat it as table text
+    
+    # Result cache, kept across documents translated by the same instance
+    TRANSLATION_CACHE_MAX_ENTRIES = 100_000
+
     def __init__(self, config: TranslationConfig):
         """
         Initialize translator with configuration.
@@ -49,12 +86,15 @@ class DocumentTranslator:
         
         # Initialize GPU-dependent components lazily
         self._gpu_available: Optional[bool] = None
+        
+        # (sha1 of normalized text, source_lang, target_lang) -> translated text
+        self._translation_cache: Dict[Tuple[str, str, str], str] = {}
 
     def _initialize_components(self) -> None:
         """Initialize GPU-dependent components."""
         if self._ocr_engine is None:
             use_gpu = self._config.use_gpu and self._is_gpu_available()
-            self._ocr_engine = OCREngine(use_gpu=use_gpu)
+            self._ocr_engine = OCREngine(use_gpu=use_gpu, enable_hpi=self._config.enable_hpi)
             
             if self._config.use_gpu and not use_gpu:
                 logger.warning("GPU requested but not available, falling back to CPU")
@@ -64,8 +104,26 @@ class DocumentTranslator:
                 api_key=self._config.gemini_api_key,
                 target_lang=self._config.target_language,
                 source_lang=self._config.source_language,
+                use_batch_api=self._config.use_batch_api,
+                max_concurrency=self._config.batch_size,
+                cache_path=self._config.translation_cache_path,
             )
 
+    def close(self) -> None:
+        """
+        Release the translation service's event loop, API clients and translation memory.
+        
+        The translator may be used again afterwards; the service reopens on next use.
+        """
+        if self._translation_service is not None:
+            self._translation_service.close()
+
+    def __enter__(self) -> "DocumentTranslator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _is_gpu_available(self) -> bool:
         """Check if GPU is available."""
         if self._gpu_available is None:
@@ -81,13 +139,19 @@ class DocumentTranslator:
                 self._gpu_available = False
         return self._gpu_available
 
-    def translate_document(self, input_path: str, output_path: str) -> TranslationSummary:
+    def translate_document(
+        self,
+        input_path: str,
+        output_path: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> TranslationSummary:
         """
         Translate a single PDF document.
         
         Args:
             input_path: Path to input PDF
             output_path: Path for output PDF
+            progress_callback: Called with (completed, total) units as translation batches finish
             
         Returns:
             TranslationSummary with statistics
@@ -101,73 +165,102 @@ class DocumentTranslator:
         try:
             self._initialize_components()
             
-            # Step 1: Parse PDF
-            logger.info(f"Parsing PDF: {input_path}")
-            pages = self._pdf_parser.parse(input_path)
-            summary.pages_processed = len(pages)
-            
-            # Step 2: Detect tables
-            logger.info("Detecting tables...")
-            all_tables: List[TableStructure] = []
-            import fitz
-            doc = fitz.open(input_path)
-            for page_num, page_content in enumerate(pages):
-                page = doc[page_num]
-                tables = self._table_detector.detect_tables(page, page_num)
-                all_tables.extend(tables)
-            doc.close()
-            
-            # Step 3: Collect all text blocks (excluding those inside tables)
-            logger.info("Collecting text blocks...")
-            all_text_blocks: List[TextBlock] = []
-            for page in pages:
-                for block in page.text_blocks:
-                    # Check if block is inside a table
-                    is_in_table = self._is_block_in_table(block, all_tables)
-                    if not is_in_table:
-                        all_text_blocks.append(block)
-            
-            # Step 4: Extract text from images (OCR)
-            logger.info("Processing images with OCR...")
-            ocr_blocks = self._process_images(pages)
-            all_text_blocks.extend(ocr_blocks)
-            summary.images_processed = sum(len(p.image_regions) for p in pages)
-            
-            # Step 5: Collect table cell text
-            table_cell_blocks = self._collect_table_cells(all_tables)
-            
-            # Step 6: Detect source language (if not specified)
-            source_lang = self._config.source_language
-            if not source_lang:
-                logger.info("Detecting source language...")
-                detection_result = self._language_detector.detect_language(all_text_blocks)
-                source_lang = detection_result.primary_language
-                logger.info(f"Detected language: {source_lang} (confidence: {detection_result.confidence:.2f})")
+            # The PDF is opened once: the parse stage reads it, then (after that
+            # thread has finished) the reconstructor edits the same document.
+            doc = self._pdf_parser.open_document(input_path)
+            try:
+                # One reconstructor serves both table-cell preparation and Step 8;
+                # it only touches the document when reconstruct() runs.
+                reconstructor = LayoutReconstructor(
+                    doc,
+                    self._config.target_language,
+                    font_adjuster=self._font_adjuster,
+                )
                 
-                if detection_result.secondary_languages:
-                    logger.info(f"Secondary languages: {detection_result.secondary_languages}")
+                # Steps 1-5 run as a pipeline: PDF parsing + table detection and OCR
+                # each run on a worker thread, while this thread collects pages and,
+                # when the source language is known up front, starts translating.
+                # Text blocks and table cells share one stream of translation requests.
+                logger.info(f"Parsing PDF: {input_path}")
+                pages: List[PageContent] = []
+                all_tables: List[TableStructure] = []
+                all_text_blocks: List[TextBlock] = []
+                table_cell_blocks: List[Tuple[str, TableStructure, int, int]] = []
+            
+                # Interim flushes would each start their own Batch API job, so with
+                # the Batch API everything is submitted once, after extraction
+                stream_translation = bool(self._config.source_language) and not self._config.use_batch_api
+                buffer = _TranslationBuffer(
+                    self._translation_service,
+                    self._translation_cache,
+                    max_cache_entries=self.TRANSLATION_CACHE_MAX_ENTRIES,
+                    threshold=TranslationService.BATCH_SIZE * self._config.batch_size,
+                    timeout=self.STREAM_FLUSH_TIMEOUT,
+                    progress_callback=progress_callback,
+                )
+            
+                for item in self._iter_extracted_pages(doc):
+                    if item is not None:
+                        page, tables, ocr_blocks = item
+                        pages.append(page)
+                        summary.pages_processed += 1
+                        all_tables.extend(tables)
+                    
+                        # Collect text blocks (excluding those inside tables) plus OCR text
+                        start = len(all_text_blocks)
+                        all_text_blocks.extend(self._filter_blocks_outside_tables(page.text_blocks, tables))
+                        all_text_blocks.extend(ocr_blocks)
+                        buffer.add(self._build_block_requests(all_text_blocks, start))
+                    
+                        # Collect table cell text
+                        cell_start = len(table_cell_blocks)
+                        table_cell_blocks.extend(self._collect_table_cells(tables))
+                        buffer.add(self._build_cell_requests(table_cell_blocks, cell_start))
+                
+                    if stream_translation and buffer.is_due():
+                        buffer.flush()
+            
+                summary.images_processed = sum(
+                    not region.covered_by_text for p in pages for region in p.image_regions
+                )
+            
+                # Step 6: Detect source language (if not specified)
+                source_lang = self._config.source_language
+                if not source_lang:
+                    logger.info("Detecting source language...")
+                    detection_result = self._language_detector.detect_language(all_text_blocks)
+                    source_lang = detection_result.primary_language
+                    logger.info(f"Detected language: {source_lang} (confidence: {detection_result.confidence:.2f})")
                 
-                self._translation_service.set_source_language(source_lang)
+                    if detection_result.secondary_languages:
+                        logger.info(f"Secondary languages: {detection_result.secondary_languages}")
+                
+                    self._translation_service.set_source_language(source_lang)
             
-            # Step 7: Translate all text
-            logger.info("Translating text...")
-            translated_blocks = self._translate_blocks(all_text_blocks)
-            translated_table_cells = self._translate_table_cells(table_cell_blocks, all_tables)
-            summary.text_blocks_translated = len(translated_blocks) + len(translated_table_cells)
+                # Step 7: Translate remaining text and cells in one batch
+                logger.info("Translating text...")
+                buffer.flush()
+                translated_blocks = self._apply_block_translations(all_text_blocks, buffer.results)
+                translated_table_cells = self._apply_table_cell_translations(
+                    table_cell_blocks, buffer.results, reconstructor
+                )
+                summary.text_blocks_translated = len(translated_blocks) + len(translated_table_cells)
             
-            # Step 8: Reconstruct PDF
-            logger.info("Reconstructing PDF...")
-            reconstructor = LayoutReconstructor(input_path, self._config.target_language)
+                # Step 8: Reconstruct PDF
+                logger.info("Reconstructing PDF...")
             
-            # Prepare blocks for reconstruction
-            reconstructed_blocks = self._prepare_reconstructed_blocks(
-                all_text_blocks, translated_blocks, pages
-            )
-            reconstructed_blocks.extend(translated_table_cells)
+                # Prepare blocks for reconstruction
+                reconstructed_blocks = self._prepare_reconstructed_blocks(
+                    all_text_blocks, translated_blocks, pages
+                )
+                reconstructed_blocks.extend(translated_table_cells)
+            
+                # Reconstruct and save
+                pdf_bytes = reconstructor.reconstruct(pages, reconstructed_blocks, all_tables)
+                reconstructor.save(output_path, pdf_bytes)
             
-            # Reconstruct and save
-            pdf_bytes = reconstructor.reconstruct(pages, reconstructed_blocks, all_tables)
-            reconstructor.save(output_path, pdf_bytes)
+            finally:
+                doc.close()
             
             logger.info(f"Translation complete: {output_path}")
             
@@ -191,31 +284,281 @@ class DocumentTranslator:
         """
         Translate multiple PDF documents.
         
+        Documents run in up to config.max_batch_workers spawned processes. Each
+        worker loads its own OCR model (PaddleOCR takes on the order of 1-2 GB),
+        keeps up to batch_size Gemini calls in flight and has its own in-memory
+        translation cache, so memory use and API concurrency grow with every
+        worker added.
+        
         Args:
             input_output_pairs: List of (input_path, output_path) tuples
             
         Returns:
             List of TranslationSummary objects
         """
-        summaries: List[TranslationSummary] = []
         total = len(input_output_pairs)
+        max_workers = self._batch_worker_count(total)
+        
+        if max_workers <= 1:
+            summaries: List[TranslationSummary] = []
+            for i, (input_path, output_path) in enumerate(input_output_pairs):
+                logger.info(f"Processing document {i + 1}/{total}: {input_path}")
+                summary = self.translate_document(input_path, output_path)
+                summaries.append(summary)
+                self._log_batch_result(summary)
+            return summaries
+        
+        # One process per document slot, each with its own translator. "spawn"
+        # keeps workers clear of CUDA/PyMuPDF state initialized in this process.
+        logger.info(f"Processing {total} documents with {max_workers} worker processes")
+        context = multiprocessing.get_context("spawn")
+        device_queue = None
+        if self._config.use_gpu and self._is_gpu_available():
+            # Give each worker its own GPU
+            device_queue = context.Queue()
+            for device_id in range(max_workers):
+                device_queue.put(device_id)
+        
+        results: Dict[int, TranslationSummary] = {}
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=_init_batch_worker,
+            initargs=(self._config, device_queue, logging.getLogger().level),
+        ) as executor:
+            futures = {
+                executor.submit(_translate_in_worker, input_path, output_path): i
+                for i, (input_path, output_path) in enumerate(input_output_pairs)
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                input_path, output_path = input_output_pairs[i]
+                try:
+                    summary = future.result()
+                except Exception as e:
+                    summary = TranslationSummary(input_file=input_path, output_file=output_path)
+                    summary.add_error(f"Worker error: {str(e)}")
+                results[i] = summary
+                self._log_batch_result(summary)
+        
+        return [results[i] for i in range(total)]
+
+    def _batch_worker_count(self, num_documents: int) -> int:
+        """
+        Decide how many worker processes translate_batch should use.
         
-        for i, (input_path, output_path) in enumerate(input_output_pairs):
-            logger.info(f"Processing document {i + 1}/{total}: {input_path}")
-            summary = self.translate_document(input_path, output_path)
-            summaries.append(summary)
+        Args:
+            num_documents: Number of documents in the batch
             
-            if summary.success:
-                logger.info(f"Completed: {input_path} -> {output_path}")
-            else:
-                logger.warning(f"Failed: {input_path}, errors: {summary.errors}")
+        Returns:
+            Worker count; 1 means translate in this process
+        """
+        workers = min(os.cpu_count() or 1, num_documents, self._config.max_batch_workers)
+        if self._config.use_gpu and self._is_gpu_available():
+            # One worker per GPU avoids contention on a shared device
+            workers = min(workers, self._gpu_device_count())
+        return max(1, workers)
+
+    def _gpu_device_count(self) -> int:
+        """Number of CUDA devices visible to Paddle."""
+        try:
+            import paddle
+            return paddle.device.cuda.device_count()
+        except Exception:
+            return 1
+
+    def _log_batch_result(self, summary: TranslationSummary) -> None:
+        """Log the outcome of one document in a batch."""
+        if summary.success:
+            logger.info(f"Completed: {summary.input_file} -> {summary.output_file}")
+        else:
+            logger.warning(f"Failed: {summary.input_file}, errors: {list(summary.errors)}")
+
+    def _iter_extracted_pages(
+        self,
+        doc: fitz.Document,
+    ) -> Iterator[Optional[Tuple[PageContent, List[TableStructure], List[TextBlock]]]]:
+        """
+        Run parsing and OCR as a threaded pipeline and yield pages as they finish.
+        
+        Stage 1 parses pages and detects tables; stage 2 runs OCR on each
+        parsed page. Stages are connected by bounded queues so a slow stage
+        applies back-pressure instead of buffering the whole document.
+        
+        Args:
+            doc: Open input PDF; only the parse stage touches it until this
+                generator finishes
+            
+        Yields:
+            (page, tables, ocr_blocks) per page in page order, or None when no
+            page arrived within PIPELINE_POLL_INTERVAL (lets the caller act on
+            timeouts while waiting)
+            
+        Raises:
+            Any exception raised by a pipeline stage
+        """
+        parsed_queue: queue.Queue = queue.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+        ocr_queue: queue.Queue = queue.Queue(maxsize=self.PIPELINE_QUEUE_SIZE)
+        stop = threading.Event()
         
-        return summaries
+        workers = [
+            threading.Thread(
+                target=self._parse_stage,
+                args=(doc, parsed_queue, stop),
+                name="pdf-parse",
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._ocr_stage,
+                args=(parsed_queue, ocr_queue, stop),
+                name="ocr",
+                daemon=True,
+            ),
+        ]
+        for worker in workers:
+            worker.start()
+        
+        try:
+            while True:
+                try:
+                    item = ocr_queue.get(timeout=self.PIPELINE_POLL_INTERVAL)
+                except queue.Empty:
+                    yield None
+                    continue
+                
+                if item is _PIPELINE_DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+    def _parse_stage(self, doc: fitz.Document, out_queue: queue.Queue, stop: threading.Event) -> None:
+        """
+        Pipeline stage 1: parse pages and detect their tables.
+        
+        While the pipeline runs, the PyMuPDF document is used on this thread only.
+        """
+        try:
+            page_iter = self._pdf_parser.iter_pages(doc)
+            try:
+                for page, page_content in page_iter:
+                    tables = self._table_detector.detect_tables(page, page_content.page_number)
+                    if not self._put_unless_stopped(out_queue, (page_content, tables), stop):
+                        return
+            finally:
+                page_iter.close()
+            self._put_unless_stopped(out_queue, _PIPELINE_DONE, stop)
+        except Exception as e:
+            self._put_unless_stopped(out_queue, e, stop)
+
+    def _ocr_stage(self, in_queue: queue.Queue, out_queue: queue.Queue, stop: threading.Event) -> None:
+        """
+        Pipeline stage 2: OCR the images of each parsed page.
+        
+        Pages already waiting in the queue are taken together so their images
+        share one batched OCR call.
+        """
+        while not stop.is_set():
+            try:
+                item = in_queue.get(timeout=self.PIPELINE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            
+            # Drain whatever else is ready, stopping at the end-of-stream marker
+            batch = []
+            while item is not _PIPELINE_DONE and not isinstance(item, BaseException):
+                batch.append(item)
+                try:
+                    item = in_queue.get_nowait()
+                except queue.Empty:
+                    item = None
+                    break
+            
+            if batch:
+                try:
+                    # Skip OCR on pages with a full text layer
+                    batch_pages = [page_content for page_content, _ in batch]
+                    self._classify_pages(batch_pages)
+                    ocr_blocks = self._process_images(batch_pages)
+                except Exception as e:
+                    self._put_unless_stopped(out_queue, e, stop)
+                    return
+                
+                blocks_by_page: Dict[int, List[TextBlock]] = {}
+                for block in ocr_blocks:
+                    blocks_by_page.setdefault(block.page_number, []).append(block)
+                
+                for page_content, tables in batch:
+                    page_blocks = blocks_by_page.get(page_content.page_number, [])
+                    if not self._put_unless_stopped(out_queue, (page_content, tables, page_blocks), stop):
+                        return
+            
+            if item is not None:
+                # End of stream or an upstream error
+                self._put_unless_stopped(out_queue, item, stop)
+                return
+
+    def _put_unless_stopped(self, q: queue.Queue, item, stop: threading.Event) -> bool:
+        """Put item on a bounded queue, giving up if the pipeline is stopped."""
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=self.PIPELINE_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _classify_pages(self, pages: List[PageContent]) -> None:
+        """
+        Mark image regions whose text the native text layer already holds.
+        
+        An image is covered when text-layer blocks overlap at least the configured
+        fraction of its area, as on a scan with an OCR text layer; covered images
+        are not sent to OCR. Pages whose images are all covered get
+        ContentType.NATIVE_TEXT; the rest get ContentType.IMAGE_TEXT.
+        
+        Args:
+            pages: List of parsed PageContent, updated in place
+        """
+        threshold = self._config.native_text_min_coverage
+        
+        for page in pages:
+            regions = page.image_regions
+            if self._config.skip_ocr_if_native and regions and page.text_blocks:
+                # Text blocks of a page rarely overlap, so per-block fractions add up
+                coverage = overlap_fraction_matrix(
+                    BBoxArray.from_boxes([region.bbox for region in regions]).xyxy,
+                    BBoxArray.from_boxes([block.bbox for block in page.text_blocks]).xyxy,
+                ).sum(axis=1)
+                for region, covered in zip(regions, (coverage >= threshold).tolist()):
+                    region.covered_by_text = covered
+            
+            skipped = sum(region.covered_by_text for region in regions)
+            if skipped:
+                logger.debug(
+                    f"Page {page.page_number}: text layer covers {skipped} of "
+                    f"{len(regions)} image(s), skipping OCR for them"
+                )
+            if regions and skipped == len(regions):
+                page.content_type = ContentType.NATIVE_TEXT
+            else:
+                page.content_type = ContentType.IMAGE_TEXT
 
     def _process_images(self, pages: List[PageContent]) -> List[TextBlock]:
         """
         Process images with OCR to extract text.
         
+        Regions marked covered_by_text by _classify_pages are skipped. All
+        remaining image regions go to the OCR engine in a single batch call.
+        
+        Encoded image bytes are not needed once OCR is done: they are dropped
+        from every region (skipped regions first, before OCR runs) so only the
+        pages in flight hold image data at any time.
+        
         Args:
             pages: List of PageContent with images
             
@@ -224,68 +567,98 @@ class DocumentTranslator:
         """
         ocr_blocks: List[TextBlock] = []
         
+        regions = []
         for page in pages:
             for image_region in page.image_regions:
-                try:
-                    ocr_results = self._ocr_engine.extract_text(image_region.image_data)
-                    
-                    for ocr_result in ocr_results:
-                        # Convert OCR bbox (relative to image) to page coordinates
-                        page_bbox = self._convert_ocr_bbox_to_page(
-                            ocr_result.bbox,
-                            image_region.bbox,
-                        )
-                        
-                        block = TextBlock(
-                            text=ocr_result.text,
-                            bbox=page_bbox,
-                            font_name="helv",  # Default for OCR text
-                            font_size=12.0,
-                            page_number=page.page_number,
-                            is_from_image=True,
-                            image_index=image_region.index,
-                        )
-                        ocr_blocks.append(block)
-                        
-                except OCRError as e:
-                    logger.warning(f"OCR failed for image {image_region.index}: {str(e)}")
-                except Exception as e:
-                    logger.warning(f"Error processing image: {str(e)}")
+                if image_region.covered_by_text:
+                    image_region.image_data = b""
+                else:
+                    regions.append((page, image_region))
+        if not regions:
+            return ocr_blocks
+        
+        try:
+            results_per_region = self._ocr_engine.extract_text_batch(
+                [image_region.image_data for _, image_region in regions]
+            )
+        except OCRError as e:
+            logger.warning(f"OCR failed for {len(regions)} image(s): {str(e)}")
+            return ocr_blocks
+        except Exception as e:
+            logger.warning(f"Error processing images: {str(e)}")
+            return ocr_blocks
+        finally:
+            for _, image_region in regions:
+                image_region.image_data = b""
+        
+        # Convert every OCR bbox (pixels, relative to its image) to page coordinates at once
+        counts = [len(ocr_results) for ocr_results in results_per_region]
+        if not sum(counts):
+            return ocr_blocks
+        
+        ocr_xyxy = BBoxArray.from_boxes(
+            [ocr_result.bbox for ocr_results in results_per_region for ocr_result in ocr_results]
+        ).xyxy
+        scale, offset = self._ocr_to_page_transforms(regions, results_per_region)
+        page_boxes = BBoxArray(
+            ocr_xyxy * np.repeat(scale, counts, axis=0) + np.repeat(offset, counts, axis=0)
+        ).to_boxes()
+        
+        box_iter = iter(page_boxes)
+        for (page, image_region), ocr_results in zip(regions, results_per_region):
+            for ocr_result in ocr_results:
+                block = TextBlock(
+                    text=ocr_result.text,
+                    bbox=next(box_iter),
+                    font_name="helv",  # Default for OCR text
+                    font_size=12.0,
+                    page_number=page.page_number,
+                    is_from_image=True,
+                    image_index=image_region.index,
+                )
+                ocr_blocks.append(block)
         
         return ocr_blocks
 
-    def _convert_ocr_bbox_to_page(
+    def _ocr_to_page_transforms(
         self,
-        ocr_bbox,
-        image_bbox
-    ):
+        regions: List[Tuple[PageContent, ImageRegion]],
+        results_per_region: List[List[OCRResult]],
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Convert OCR bounding box (relative to image) to page coordinates.
+        Build per-region affine transforms from image pixels to page coordinates.
+        
+        The scale is the image's placed size on the page divided by its pixel
+        size. When the pixel size is unknown, the extent of the region's OCR
+        boxes stands in for it.
         
         Args:
-            ocr_bbox: BoundingBox relative to image
-            image_bbox: BoundingBox of image on page
+            regions: (page, image_region) pairs
+            results_per_region: OCR results for each region
             
         Returns:
-            BoundingBox in page coordinates
+            (scale, offset) arrays of shape (R, 4) laid out as x0, y0, x1, y1
         """
-        from models.data_models import BoundingBox
-        
-        # OCR bbox is relative to image, need to scale and offset
-        image_width = image_bbox.width
-        image_height = image_bbox.height
+        scale = np.ones((len(regions), 4), dtype=np.float64)
+        offset = np.zeros((len(regions), 4), dtype=np.float64)
         
-        # Assuming OCR bbox is in pixel coordinates of the image
-        # Scale to page coordinates
-        scale_x = image_width / max(ocr_bbox.x1, 1)
-        scale_y = image_height / max(ocr_bbox.y1, 1)
+        for i, ((_, image_region), ocr_results) in enumerate(zip(regions, results_per_region)):
+            if not ocr_results:
+                continue
+            
+            image_bbox = image_region.bbox
+            pixel_width = image_region.pixel_width
+            pixel_height = image_region.pixel_height
+            if pixel_width <= 0 or pixel_height <= 0:
+                pixel_width = max(r.bbox.x1 for r in ocr_results)
+                pixel_height = max(r.bbox.y1 for r in ocr_results)
+            
+            scale_x = image_bbox.width / max(pixel_width, 1)
+            scale_y = image_bbox.height / max(pixel_height, 1)
+            scale[i] = (scale_x, scale_y, scale_x, scale_y)
+            offset[i] = (image_bbox.x0, image_bbox.y0, image_bbox.x0, image_bbox.y0)
         
-        return BoundingBox(
-            x0=image_bbox.x0 + ocr_bbox.x0 * scale_x,
-            y0=image_bbox.y0 + ocr_bbox.y0 * scale_y,
-            x1=image_bbox.x0 + ocr_bbox.x1 * scale_x,
-            y1=image_bbox.y0 + ocr_bbox.y1 * scale_y,
-        )
+        return scale, offset
 
     def _collect_table_cells(
         self, 
@@ -309,68 +682,96 @@ class DocumentTranslator:
         
         return cell_texts
 
-    def _translate_blocks(
-        self, 
-        text_blocks: List[TextBlock]
+    def _build_block_requests(
+        self,
+        text_blocks: List[TextBlock],
+        start: int = 0
+    ) -> List[TranslationRequest]:
+        """
+        Create translation requests for non-empty text blocks.
+        
+        Args:
+            text_blocks: All text blocks collected so far
+            start: Index of the first block that needs a request
+            
+        Returns:
+            TranslationRequests tagged "text_<index>"
+        """
+        return [
+            TranslationRequest(
+                text=text_blocks[i].text,
+                source_lang=self._config.source_language,
+                target_lang=self._config.target_language,
+                block_id=f"text_{i}",
+            )
+            for i in range(start, len(text_blocks))
+            if text_blocks[i].text.strip()
+        ]
+
+    def _build_cell_requests(
+        self,
+        cell_texts: List[Tuple[str, TableStructure, int, int]],
+        start: int = 0
+    ) -> List[TranslationRequest]:
+        """
+        Create translation requests for table cells.
+        
+        Args:
+            cell_texts: All (text, table, row, col) tuples collected so far
+            start: Index of the first cell that needs a request
+            
+        Returns:
+            TranslationRequests tagged "cell_<index>"
+        """
+        return [
+            TranslationRequest(
+                text=cell_texts[i][0],
+                source_lang=self._config.source_language,
+                target_lang=self._config.target_language,
+                block_id=f"cell_{i}",
+            )
+            for i in range(start, len(cell_texts))
+        ]
+
+    def _apply_block_translations(
+        self,
+        text_blocks: List[TextBlock],
+        results: Dict[str, TranslationResult]
     ) -> dict:
         """
-        Translate text blocks.
+        Map translation results back to text blocks.
         
         Args:
             text_blocks: List of TextBlock objects
+            results: Translation results keyed by block_id
             
         Returns:
             Dict mapping block index to translated text
         """
-        if not text_blocks:
-            return {}
-        
-        # Create translation requests for non-empty blocks
-        requests: List[TranslationRequest] = []
-        block_indices: List[int] = []  # Track which blocks have requests
-        
-        for i, block in enumerate(text_blocks):
-            if block.text.strip():
-                requests.append(TranslationRequest(
-                    text=block.text,
-                    source_lang=self._config.source_language,
-                    target_lang=self._config.target_language,
-                    block_id=str(i),
-                ))
-                block_indices.append(i)
-        
-        if not requests:
-            return {}
-        
-        # Translate in batches
-        results = self._translation_service.translate_batch(requests)
-        
-        # Map results back to blocks
         translations = {}
-        for j, result in enumerate(results):
-            if j < len(block_indices):
-                idx = block_indices[j]
-                # Use translated text if available, otherwise keep original
-                translated = result.translated_text.strip() if result.translated_text else ""
-                if translated:
-                    translations[idx] = translated
-                else:
-                    # Fallback to original text
-                    translations[idx] = text_blocks[idx].text
+        for i, block in enumerate(text_blocks):
+            result = results.get(f"text_{i}")
+            if result is None:
+                continue
+            # Use translated text if available, otherwise keep original
+            translated = result.translated_text.strip() if result.translated_text else ""
+            translations[i] = translated or block.text
         
         return translations
 
-    def _translate_table_cells(
+    def _apply_table_cell_translations(
         self,
         cell_texts: List[Tuple[str, TableStructure, int, int]],
-        tables: List[TableStructure]
+        results: Dict[str, TranslationResult],
+        reconstructor: LayoutReconstructor,
     ) -> List[ReconstructedBlock]:
         """
-        Translate table cells and prepare for reconstruction.
+        Map translation results back to table cells and prepare for reconstruction.
         
         Args:
             cell_texts: List of (text, table, row, col) tuples
-            tables: List of TableStructure objects
+            results: Translation results keyed by block_id
+            reconstructor: Reconstructor that will rebuild the document
             
         Returns:
             List of ReconstructedBlock for table cells
@@ -378,49 +779,35 @@ class DocumentTranslator:
         if not cell_texts:
             return []
         
-        # Create translation requests
-        requests: List[TranslationRequest] = []
-        for i, (text, table, row, col) in enumerate(cell_texts):
-            requests.append(TranslationRequest(
-                text=text,
-                source_lang=self._config.source_language,
-                target_lang=self._config.target_language,
-                block_id=f"cell_{i}",
-            ))
-        
-        # Translate
-        results = self._translation_service.translate_batch(requests)
-        
         # Prepare reconstructed blocks
         reconstructed: List[ReconstructedBlock] = []
-        reconstructor = LayoutReconstructor.__new__(LayoutReconstructor)
-        reconstructor._font_adjuster = self._font_adjuster
-        reconstructor._target_language = self._config.target_language
-        reconstructor._selected_font = None
-        reconstructor._font_cache = {}
-        
-        for i, result in enumerate(results):
-            if i < len(cell_texts):
-                original_text, table, row, col = cell_texts[i]
-                # Find the cell
-                cell = None
-                for c in table.cells:
-                    if c.row_index == row and c.col_index == col:
-                        cell = c
-                        break
+        
+        # (row, col) -> cell lookup per table, built once
+        cell_index: Dict[int, Dict[Tuple[int, int], TableCell]] = {}
+        
+        for i, (original_text, table, row, col) in enumerate(cell_texts):
+            result = results.get(f"cell_{i}")
+            if result is None:
+                continue
+            
+            table_cells = cell_index.get(id(table))
+            if table_cells is None:
+                table_cells = {(c.row_index, c.col_index): c for c in table.cells}
+                cell_index[id(table)] = table_cells
+            cell = table_cells.get((row, col))
+            
+            if cell:
+                # Use translated text if available, otherwise keep original
+                translated = result.translated_text.strip() if result.translated_text else ""
+                if not translated:
+                    translated = original_text
                 
-                if cell:
-                    # Use translated text if available, otherwise keep original
-                    translated = result.translated_text.strip() if result.translated_text else ""
-                    if not translated:
-                        translated = original_text
-                    
-                    block = reconstructor.prepare_table_cell_block(
-                        translated,
-                        cell,
-                        table.page_number,
-                    )
-                    reconstructed.append(block)
+                block = reconstructor.prepare_table_cell_block(
+                    translated,
+                    cell,
+                    table.page_number,
+                )
+                reconstructed.append(block)
         
         return reconstructed
 
@@ -443,17 +830,15 @@ class DocumentTranslator:
         """
         reconstructed: List[ReconstructedBlock] = []
         
-        for i, block in enumerate(text_blocks):
-            translated_text = translations.get(i, block.text)
-            
-            # Calculate font adjustment
-            font_adjustment = self._font_adjuster.calculate_fit(
-                translated_text,
-                block.bbox,
-                block.font_name,
-                block.font_size,
-            )
-            
+        translated_texts = [translations.get(i, block.text) for i, block in enumerate(text_blocks)]
+        
+        # Calculate font adjustments (identical blocks are fitted once)
+        font_adjustments = self._font_adjuster.calculate_fit_batch([
+            (translated_text, block.bbox, block.font_name, block.font_size, block.text)
+            for translated_text, block in zip(translated_texts, text_blocks)
+        ])
+        
+        for block, translated_text, font_adjustment in zip(text_blocks, translated_texts, font_adjustments):
             # Get original color
             color = (0, 0, 0)
             if block.font_info:
@@ -466,50 +851,194 @@ class DocumentTranslator:
                 page_number=block.page_number,
                 is_image_overlay=block.is_from_image,
                 original_font_color=color,
+                original_text=block.text,
             ))
         
         return reconstructed
 
-    def _is_block_in_table(self, block: TextBlock, tables: List[TableStructure]) -> bool:
+    def _filter_blocks_outside_tables(
+        self,
+        blocks: List[TextBlock],
+        tables: List[TableStructure],
+    ) -> List[TextBlock]:
         """
-        Check if a text block is significantly inside any table region.
+        Drop text blocks that lie significantly inside any table region.
+        
+        Blocks that do not touch the envelope of the page's tables are kept
+        without further work; overlap for the remaining (block, table) pairs
+        is computed in one batched pass.
         
         Args:
-            block: TextBlock to check
-            tables: List of detected tables
+            blocks: TextBlocks from a single page
+            tables: Tables detected on the same page
             
         Returns:
-            True if block is mostly inside a table
+            Blocks that are not mostly inside a table, in original order
         """
-        for table in tables:
-            if table.page_number != block.page_number:
-                continue
-            
-            # Calculate overlap between block and table
-            overlap_x0 = max(block.bbox.x0, table.bbox.x0)
-            overlap_y0 = max(block.bbox.y0, table.bbox.y0)
-            overlap_x1 = min(block.bbox.x1, table.bbox.x1)
-            overlap_y1 = min(block.bbox.y1, table.bbox.y1)
-            
-            if overlap_x1 > overlap_x0 and overlap_y1 > overlap_y0:
-                overlap_area = (overlap_x1 - overlap_x0) * (overlap_y1 - overlap_y0)
-                block_area = block.bbox.width * block.bbox.height
-                
-                # Only consider it "in table" if >80% of block is inside table
-                if block_area > 0 and overlap_area / block_area > 0.8:
-                    return True
+        if not blocks or not tables:
+            return list(blocks)
         
-        return False
+        block_xyxy = BBoxArray.from_boxes([block.bbox for block in blocks]).xyxy
+        table_xyxy = BBoxArray.from_boxes([table.bbox for table in tables]).xyxy
+        
+        # Coarse spatial prefilter: only blocks overlapping the tables' envelope
+        env_x0, env_y0 = table_xyxy[:, 0].min(), table_xyxy[:, 1].min()
+        env_x1, env_y1 = table_xyxy[:, 2].max(), table_xyxy[:, 3].max()
+        candidates = np.flatnonzero(
+            (block_xyxy[:, 2] > env_x0) & (block_xyxy[:, 0] < env_x1) &
+            (block_xyxy[:, 3] > env_y0) & (block_xyxy[:, 1] < env_y1)
+        )
+        
+        keep = np.ones(len(blocks), dtype=bool)
+        if candidates.size:
+            # One (candidates, tables) overlap-ratio matrix reduced to a per-block mask
+            overlap = overlap_fraction_matrix(block_xyxy[candidates], table_xyxy)
+            keep[candidates] = ~(overlap > self.TABLE_OVERLAP_THRESHOLD).any(axis=1)
+        
+        return list(compress(blocks, keep))
 
-    def get_supported_languages(self) -> List[str]:
+    def get_supported_languages(self) -> Tuple[str, ...]:
         """
-        Get list of supported target languages.
+        Get supported target languages.
         
         Returns:
-            List of language codes
+            Tuple of language codes (shared constant; use
+            SUPPORTED_LANGUAGES_SET for membership tests)
         """
-        return [
-            "en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja", "ko",
-            "ar", "hi", "nl", "pl", "tr", "vi", "th", "sv", "da", "fi",
-            "no", "cs", "el", "he", "hu", "id", "ms", "ro", "sk", "uk",
-        ]
+        return SUPPORTED_LANGUAGES
+
+
+# Per-process translator used by translate_batch worker processes
+_worker_translator: Optional[DocumentTranslator] = None
+
+
+def _init_batch_worker(config: TranslationConfig, device_queue=None, log_level: int = logging.INFO) -> None:
+    """ProcessPoolExecutor initializer: build this worker's DocumentTranslator."""
+    global _worker_translator
+    logging.basicConfig(level=log_level, format="%(asctime)s - %(levelname)s - %(message)s")
+    if device_queue is not None:
+        # Must be set before paddle is imported in this process
+        os.environ["CUDA_VISIBLE_DEVICES"] = str(device_queue.get())
+    _worker_translator = DocumentTranslator(config)
+    # Pool workers exit without running atexit handlers; multiprocessing finalizers do run
+    multiprocessing.util.Finalize(_worker_translator, _worker_translator.close, exitpriority=10)
+
+
+def _translate_in_worker(input_path: str, output_path: str) -> TranslationSummary:
+    """Translate one document with the worker's DocumentTranslator."""
+    return _worker_translator.translate_document(input_path, output_path)
+
+
+class _TranslationBuffer:
+    """
+    Collects translation requests and sends them in mini-batches.
+    
+    A flush is due once enough requests are pending or the oldest pending
+    request has waited longer than the timeout. Progress is reported
+    cumulatively across flushes.
+    
+    Translations are cached by content hash: cached texts are answered
+    without an API call, and identical texts within a flush are sent once.
+    """
+
+    def __init__(
+        self,
+        translation_service: TranslationService,
+        cache: Dict[Tuple[str, str, str], str],
+        max_cache_entries: int,
+        threshold: int,
+        timeout: float,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ):
+        self._translation_service = translation_service
+        self._cache = cache
+        self._max_cache_entries = max_cache_entries
+        self._threshold = max(1, threshold)
+        self._timeout = timeout
+        self._progress_callback = progress_callback
+        self._pending: List[TranslationRequest] = []
+        self._oldest_ts: Optional[float] = None
+        self._progress_offset = 0
+        self.results: Dict[str, TranslationResult] = {}
+
+    def add(self, requests: List[TranslationRequest]) -> None:
+        """Queue requests for translation."""
+        if not requests:
+            return
+        if not self._pending:
+            self._oldest_ts = time.monotonic()
+        self._pending.extend(requests)
+
+    def is_due(self) -> bool:
+        """Check whether pending requests should be sent now."""
+        if not self._pending:
+            return False
+        return (
+            len(self._pending) >= self._threshold or
+            time.monotonic() - self._oldest_ts > self._timeout
+        )
+
+    def flush(self) -> None:
+        """Translate every pending request and record the results by block_id."""
+        if not self._pending:
+            return
+        
+        pending, self._pending, self._oldest_ts = self._pending, [], None
+        
+        # Source language is resolved now, since auto-detection runs after requests are queued
+        source_lang = self._translation_service.source_language or "auto"
+        target_lang = self._translation_service.target_language
+        
+        # Answer cache hits directly and group misses by content
+        misses: Dict[Tuple[str, str, str], List[TranslationRequest]] = {}
+        for request in pending:
+            key = self._cache_key(request.text, source_lang, target_lang)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self.results[request.block_id] = TranslationResult(
+                    original_text=request.text,
+                    translated_text=cached,
+                    block_id=request.block_id,
+                    success=True,
+                )
+            else:
+                misses.setdefault(key, []).append(request)
+        
+        if not misses:
+            return
+        
+        last_total = 0
+        
+        def report(completed: int, total: int) -> None:
+            nonlocal last_total
+            last_total = total
+            if self._progress_callback:
+                self._progress_callback(self._progress_offset + completed, self._progress_offset + total)
+        
+        unique_requests = [requests[0] for requests in misses.values()]
+        logger.debug(
+            f"Translating {len(unique_requests)} unique text(s) for {len(pending)} request(s) "
+            f"({len(pending) - sum(len(requests) for requests in misses.values())} cached)"
+        )
+        results = self._translation_service.translate_batch(unique_requests, report)
+        self._progress_offset += last_total
+        
+        for (key, requests), result in zip(misses.items(), results):
+            if result.success and result.translated_text:
+                self._remember(key, result.translated_text)
+            for request in requests:
+                self.results[request.block_id] = replace(
+                    result, original_text=request.text, block_id=request.block_id
+                )
+
+    def _remember(self, key: Tuple[str, str, str], translated_text: str) -> None:
+        """Store a translation, evicting the oldest entry when the cache is full."""
+        if len(self._cache) >= self._max_cache_entries:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = translated_text
+
+    @staticmethod
+    def _cache_key(text: str, source_lang: str, target_lang: str) -> Tuple[str, str, str]:
+        """Content-addressed cache key; whitespace differences do not matter."""
+        normalized = " ".join(text.split())
+        return (hashlib.sha1(normalized.encode("utf-8")).hexdigest(), source_lang, target_lang)
@@ -1,7 +1,10 @@
 """Font Adjuster component for fitting translated text within original text boxes."""
 
 import logging
-from typing import List, Tuple, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
 import fitz  # PyMuPDF
@@ -12,6 +15,64 @@ from models.data_models import BoundingBox
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _load_font(font_name: str) -> Optional[fitz.Font]:
+    """
+    Load a font once per process and share it across FontAdjuster instances.
+    
+    Args:
+        font_name: Font name to load
+        
+    Returns:
+        The fitz.Font, or None if the font is not available
+    """
+    try:
+        return fitz.Font(font_name)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=256)
+def _usable_font_name(font_name: str, fallbacks: Tuple[str, ...]) -> str:
+    """Resolve font_name to itself or the first loadable fallback (see FontAdjuster._get_usable_font)."""
+    if _load_font(font_name) is not None:
+        return font_name
+    for fallback in fallbacks:
+        if _load_font(fallback) is not None:
+            return fallback
+    return "helv"
+
+
+def text_advance(
+    font: fitz.Font,
+    advances: Dict[str, float],
+    text: str,
+    start: float = 0.0
+) -> float:
+    """
+    Width of text at font size 1, measuring each distinct character once.
+    
+    Advances are summed in text order, exactly as fitz.Font.text_length
+    does, so scaling the result by the font size gives the same value.
+    
+    Args:
+        font: Font to measure with
+        advances: Per-character advance cache for that font, filled as needed
+        text: Text to measure
+        start: Width already accumulated (to extend a measured prefix)
+        
+    Returns:
+        Width at font size 1
+    """
+    total = start
+    for char in text:
+        advance = advances.get(char)
+        if advance is None:
+            advance = advances[char] = font.text_length(char, fontsize=1)
+        total += advance
+    return total
+
+
 @dataclass
 class FontAdjustment:
     """Result of font adjustment calculation."""
@@ -30,6 +91,7 @@ class FontAdjuster:
     ELLIPSIS: str = "..."
     LINE_SPACING: float = 1.2  # Line height multiplier
     PADDING: float = 2.0  # Padding inside text box
+    WORD_CACHE_MAX_ENTRIES: int = 50_000  # Measured (font, word) widths kept per adjuster
 
     # Fallback fonts in order of preference
     FALLBACK_FONTS: List[str] = [
@@ -46,13 +108,64 @@ class FontAdjuster:
             min_font_size: Minimum allowed font size
         """
         self.MIN_FONT_SIZE = min_font_size
+        # font name -> character -> advance width at font size 1
+        self._advance_cache: Dict[str, Dict[str, float]] = {}
+        # (font name, word) -> advance width at font size 1
+        self._word_cache: Dict[Tuple[str, str], float] = {}
+
+    def _font_metrics(self, font_name: str) -> Tuple[str, fitz.Font, Dict[str, float]]:
+        """
+        Get a font (falling back to Helvetica) and its per-character advance cache.
+        
+        Args:
+            font_name: Requested font name
+            
+        Returns:
+            Tuple of (resolved font name, font, advances) where advances maps
+            characters to their width at font size 1
+        """
+        if _load_font(font_name) is None:
+            font_name = "helv"
+        return font_name, _load_font(font_name), self._advance_cache.setdefault(font_name, {})
+
+    def _word_advance(
+        self,
+        font: fitz.Font,
+        font_name: str,
+        advances: Dict[str, float],
+        word: str
+    ) -> float:
+        """
+        Width of a word at font size 1, measured once per font.
+        
+        Widths scale linearly with font size, so one measurement serves every
+        size the fit search tries.
+        
+        Args:
+            font: Font to measure with
+            font_name: Name the font's caches are keyed by
+            advances: Character advance cache for that font
+            word: Word to measure
+            
+        Returns:
+            Width at font size 1
+        """
+        key = (font_name, word)
+        width = self._word_cache.get(key)
+        if width is None:
+            width = text_advance(font, advances, word)
+            if len(self._word_cache) >= self.WORD_CACHE_MAX_ENTRIES:
+                self._word_cache.pop(next(iter(self._word_cache)))
+            self._word_cache[key] = width
+        return width
 
     def calculate_fit(
         self,
         text: str,
         bbox: BoundingBox,
         original_font_name: str,
-        original_font_size: float
+        original_font_size: float,
+        original_text: Optional[str] = None
     ) -> FontAdjustment:
         """
         Calculate font size and line breaks to fit text in bbox.
@@ -62,11 +175,13 @@ class FontAdjuster:
             bbox: Target bounding box
             original_font_name: Original font name
             original_font_size: Original font size
+            original_text: Source text of the block; text left unchanged by
+                translation already fits at the original size
             
         Returns:
             FontAdjustment with calculated parameters
         """
-        if not text or not text.strip():
+        if not text or not text.strip() or text == original_text:
             return FontAdjustment(
                 original_font_size=original_font_size,
                 adjusted_font_size=original_font_size,
@@ -102,6 +217,32 @@ class FontAdjuster:
         
         return result
 
+    def calculate_fit_batch(
+        self,
+        items: List[Tuple]
+    ) -> List[FontAdjustment]:
+        """
+        Calculate fits for many blocks, computing each distinct input once.
+        
+        Repeated page furniture (headers, footers, running titles) has the same
+        text, box and font on every page and shares one FontAdjustment.
+        
+        Args:
+            items: (text, bbox, original_font_name, original_font_size) tuples,
+                optionally followed by original_text (see calculate_fit)
+            
+        Returns:
+            FontAdjustment per item, in input order
+        """
+        fits: Dict[Tuple, FontAdjustment] = {}
+        adjustments: List[FontAdjustment] = []
+        for item in items:
+            adjustment = fits.get(item)
+            if adjustment is None:
+                adjustment = fits[item] = self.calculate_fit(*item)
+            adjustments.append(adjustment)
+        return adjustments
+
     def calculate_cell_fit(
         self,
         text: str,
@@ -147,6 +288,9 @@ class FontAdjuster:
         """
         Find optimal font size using binary search.
         
+        Sizes that provably cannot fit (see _cannot_fit) are rejected in
+        constant time; only the remaining candidates run a full line wrap.
+        
         Args:
             text: Text to fit
             font_name: Font name to use
@@ -157,10 +301,19 @@ class FontAdjuster:
         Returns:
             FontAdjustment with optimal parameters
         """
+        # Words are measured once; every candidate size reuses the widths
+        words, widths, space = self._measure_words(text, font_name)
+        extent = self._text_extent(widths, space)
+        
+        def wrap(font_size: float) -> Tuple[List[int], bool]:
+            if self._cannot_fit(extent, font_size, available_width, available_height):
+                return [], False
+            return self._wrap_with_widths(
+                words, widths, space, font_size, available_width, available_height
+            )
+        
         # Try original size first
-        line_breaks, fits = self._calculate_line_breaks(
-            text, font_name, original_font_size, available_width, available_height
-        )
+        line_breaks, fits = wrap(original_font_size)
         
         if fits:
             return FontAdjustment(
@@ -179,9 +332,7 @@ class FontAdjuster:
         
         while max_size - min_size > 0.5:
             mid_size = (min_size + max_size) / 2
-            line_breaks, fits = self._calculate_line_breaks(
-                text, font_name, mid_size, available_width, available_height
-            )
+            line_breaks, fits = wrap(mid_size)
             
             if fits:
                 best_size = mid_size
@@ -192,18 +343,13 @@ class FontAdjuster:
         
         # Check if minimum font size works
         if best_size <= self.MIN_FONT_SIZE:
-            line_breaks, fits = self._calculate_line_breaks(
-                text, font_name, self.MIN_FONT_SIZE, available_width, available_height
-            )
+            line_breaks, fits = wrap(self.MIN_FONT_SIZE)
             
             if not fits:
                 # Need to truncate
-                truncated_text = self._truncate_text(
+                truncated_text, truncated_breaks = self._truncate_text(
                     text, font_name, self.MIN_FONT_SIZE, available_width, available_height
                 )
-                truncated_breaks, _ = self._calculate_line_breaks(
-                    truncated_text, font_name, self.MIN_FONT_SIZE, available_width, available_height
-                )
                 
                 return FontAdjustment(
                     original_font_size=original_font_size,
@@ -225,6 +371,67 @@ class FontAdjuster:
             is_truncated=False,
         )
 
+    def _measure_words(self, text: str, font_name: str) -> Tuple[List[str], List[float], float]:
+        """
+        Split text into words and measure each distinct word once.
+        
+        Args:
+            text: Text to measure
+            font_name: Font name to use
+            
+        Returns:
+            Tuple of (words, word widths, space width), widths at font size 1
+        """
+        font_name, font, advances = self._font_metrics(font_name)
+        words = text.split()
+        widths = [self._word_advance(font, font_name, advances, word) for word in words]
+        return words, widths, text_advance(font, advances, " ")
+
+    @staticmethod
+    def _text_extent(widths: List[float], space: float) -> Tuple[float, float, float, int]:
+        """
+        Size-independent quantities the fit bounds need.
+        
+        Args:
+            widths: Word widths at font size 1
+            space: Space width at font size 1
+            
+        Returns:
+            Tuple of (widest word, sum of word widths, space width, word count)
+        """
+        if not widths:
+            return (0.0, 0.0, 0.0, 0)
+        return (max(widths), sum(widths), space, len(widths))
+
+    def _cannot_fit(
+        self,
+        extent: Tuple[float, float, float, int],
+        font_size: float,
+        available_width: float,
+        available_height: float
+    ) -> bool:
+        """
+        Cheap necessary conditions for the text to fit at font_size.
+        
+        Text widths are linear in font size, so a greedy wrap into L lines of
+        at most available_width needs W + (n - L) * space <= L * available_width / size,
+        i.e. L >= (W + n * space) / (available_width / size + space). When even
+        that many lines exceed the height, or the widest word exceeds the
+        width, no wrap can succeed. True means "certainly does not fit"; False
+        means a full wrap is still needed.
+        """
+        widest, total, space, count = extent
+        if not count:
+            return False
+        if widest * font_size > available_width:
+            return True
+        max_lines = int(available_height / (font_size * self.LINE_SPACING))
+        if max_lines < 1:
+            return True
+        min_lines = (total + count * space) / (available_width / font_size + space)
+        # Small margin so rounding never rejects a size the wrap would accept
+        return min_lines > max_lines * (1 + 1e-9) + 1e-9
+
     def measure_text(
         self, 
         text: str, 
@@ -243,8 +450,9 @@ class FontAdjuster:
             Tuple of (width, height)
         """
         try:
-            font = fitz.Font(font_name)
-            text_length = font.text_length(text, fontsize=font_size)
+            font = _load_font(font_name)
+            advances = self._advance_cache.setdefault(font_name, {})
+            text_length = text_advance(font, advances, text) * font_size
             # Approximate height based on font size
             height = font_size * self.LINE_SPACING
             return (text_length, height)
@@ -279,18 +487,41 @@ class FontAdjuster:
         if not text:
             return [], True
         
-        line_breaks: List[int] = []
-        words = text.split()
+        words, widths, space = self._measure_words(text, font_name)
+        return self._wrap_with_widths(
+            words, widths, space, font_size, available_width, available_height
+        )
+
+    def _wrap_with_widths(
+        self,
+        words: List[str],
+        widths: List[float],
+        space: float,
+        font_size: float,
+        available_width: float,
+        available_height: float
+    ) -> Tuple[List[int], bool]:
+        """
+        Greedy word wrap over pre-measured words, using only float arithmetic.
         
+        Args:
+            words: Words of the text
+            widths: Width of each word at font size 1
+            space: Width of a space at font size 1
+            font_size: Font size
+            available_width: Available width
+            available_height: Available height
+            
+        Returns:
+            Tuple of (line_break_positions, fits_in_box); positions index
+            the words joined by single spaces
+        """
         if not words:
             return [], True
         
-        try:
-            font = fitz.Font(font_name)
-        except Exception:
-            font = fitz.Font("helv")  # Fallback
-        
-        current_line = ""
+        line_breaks: List[int] = []
+        current_len = 0  # Characters in the current line; 0 means empty
+        current_advance = 0.0  # Width of the current line at size 1
         current_pos = 0
         line_count = 0
         line_height = font_size * self.LINE_SPACING
@@ -299,32 +530,37 @@ class FontAdjuster:
         if max_lines < 1:
             return [], False
         
-        for word in words:
-            test_line = f"{current_line} {word}".strip() if current_line else word
-            width = font.text_length(test_line, fontsize=font_size)
+        for word, word_advance in zip(words, widths):
+            if current_len:
+                test_len = current_len + 1 + len(word)
+                test_advance = current_advance + space + word_advance
+            else:
+                test_len = len(word)
+                test_advance = word_advance
             
-            if width <= available_width:
-                current_line = test_line
+            if test_advance * font_size <= available_width:
+                current_len = test_len
+                current_advance = test_advance
             else:
                 # Need line break
-                if current_line:
+                if current_len:
                     line_count += 1
                     if line_count >= max_lines:
                         return line_breaks, False
                     
                     # Record break position
-                    current_pos += len(current_line) + 1
+                    current_pos += current_len + 1
                     line_breaks.append(current_pos - 1)
                 
-                current_line = word
+                current_len = len(word)
+                current_advance = word_advance
                 
                 # Check if single word is too wide
-                word_width = font.text_length(word, fontsize=font_size)
-                if word_width > available_width:
+                if word_advance * font_size > available_width:
                     return line_breaks, False
         
         # Check final line
-        if current_line:
+        if current_len:
             line_count += 1
         
         fits = line_count <= max_lines
@@ -337,10 +573,13 @@ class FontAdjuster:
         font_size: float,
         available_width: float,
         available_height: float
-    ) -> str:
+    ) -> Tuple[str, List[int]]:
         """
         Truncate text with ellipsis to fit in box.
         
+        Lines break at word boundaries; characters are only cut inside the
+        word that ends the last line (or one wider than a whole line).
+        
         Args:
             text: Text to truncate
             font_name: Font name
@@ -349,43 +588,90 @@ class FontAdjuster:
             available_height: Available height
             
         Returns:
-            Truncated text with ellipsis
+            Tuple of (truncated text with ellipsis, line break positions);
+            the breaks are the indices of the newlines joining its lines
         """
-        try:
-            font = fitz.Font(font_name)
-        except Exception:
-            font = fitz.Font("helv")
+        font_name, font, advances = self._font_metrics(font_name)
+        words, widths, space = self._measure_words(text, font_name)
         
-        ellipsis_width = font.text_length(self.ELLIPSIS, fontsize=font_size)
+        ellipsis_width = text_advance(font, advances, self.ELLIPSIS)
         line_height = font_size * self.LINE_SPACING
         max_lines = max(1, int(available_height / line_height))
+        # Compare at font size 1 so word widths are used as measured
+        line_limit = available_width / font_size
         
-        # Calculate approximate characters that fit
         lines: List[str] = []
-        remaining_text = text
+        index = 0  # Next word to place
         
         for line_num in range(max_lines):
             is_last_line = (line_num == max_lines - 1)
-            target_width = available_width - (ellipsis_width if is_last_line else 0)
+            limit = line_limit - ellipsis_width if is_last_line else line_limit
             
-            # Find how much text fits on this line
-            line_text = ""
-            for char in remaining_text:
-                test_text = line_text + char
-                if font.text_length(test_text, fontsize=font_size) > target_width:
+            # Greedy word fill
+            line_words: List[str] = []
+            line_width = 0.0
+            while index < len(words):
+                width = widths[index] if not line_words else line_width + space + widths[index]
+                if width > limit:
                     break
-                line_text = test_text
+                line_words.append(words[index])
+                line_width = width
+                index += 1
             
-            if is_last_line and remaining_text[len(line_text):].strip():
-                line_text = line_text.rstrip() + self.ELLIPSIS
+            if index < len(words) and (is_last_line or not line_words):
+                # Character fill only inside the word being cut: the tail of
+                # the last line or a word wider than a whole line
+                offset = line_width + space if line_words else 0.0
+                word = words[index]
+                count = self._fitting_prefix(font, advances, word, limit - offset)
+                if not is_last_line:
+                    count = max(count, 1)  # Always make progress
+                if count:
+                    line_words.append(word[:count])
+                    if count < len(word):
+                        words[index] = word[count:]
+                        widths[index] = text_advance(font, advances, words[index])
+                    else:
+                        index += 1
             
+            line_text = " ".join(line_words)
+            if index < len(words) and is_last_line:
+                line_text += self.ELLIPSIS
             lines.append(line_text)
-            remaining_text = remaining_text[len(line_text.rstrip(self.ELLIPSIS)):]
             
-            if not remaining_text.strip():
+            if index >= len(words):
                 break
         
-        return "\n".join(lines)
+        line_breaks: List[int] = []
+        position = 0
+        for line in lines[:-1]:
+            position += len(line)
+            line_breaks.append(position)
+            position += 1
+        
+        return "\n".join(lines), line_breaks
+
+    @staticmethod
+    def _fitting_prefix(
+        font: fitz.Font,
+        advances: Dict[str, float],
+        word: str,
+        limit: float
+    ) -> int:
+        """
+        Number of leading characters of a word that fit within a width.
+        
+        Args:
+            font: Font to measure with
+            advances: Character advance cache for that font
+            word: Word being cut
+            limit: Width available at font size 1
+            
+        Returns:
+            Length of the longest prefix no wider than limit
+        """
+        cumulative = list(accumulate(text_advance(font, advances, char) for char in word))
+        return bisect_right(cumulative, limit)
 
     def _get_usable_font(self, font_name: str) -> str:
         """
@@ -397,20 +683,5 @@ class FontAdjuster:
         Returns:
             Usable font name
         """
-        # Try the requested font
-        try:
-            fitz.Font(font_name)
-            return font_name
-        except Exception:
-            pass
-        
-        # Try fallback fonts
-        for fallback in self.FALLBACK_FONTS:
-            try:
-                fitz.Font(fallback)
-                return fallback
-            except Exception:
-                continue
-        
-        # Default to Helvetica
-        return "helv"
+        # The requested font, else the first loadable fallback, else Helvetica
+        return _usable_font_name(font_name, tuple(self.FALLBACK_FONTS))
@@ -0,0 +1,94 @@
+"""Batched bounding-box geometry kernels.
+
+Boxes are passed as (N, 4) arrays of x0, y0, x1, y1 (see BBoxArray.xyxy).
+When numba is installed the pairwise pass runs as a compiled loop that avoids
+NumPy's broadcast temporaries; otherwise NumPy broadcasting is used. The loop
+is serial: per-page matrices of a few dozen boxes cost less than starting
+numba's worker threads.
+"""
+
+import logging
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    NUMBA_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+def _as_xyxy(boxes) -> np.ndarray:
+    """Coerce input to a C-contiguous float64 (N, 4) array."""
+    return np.ascontiguousarray(np.asarray(boxes, dtype=np.float64).reshape(-1, 4))
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _overlap_fraction_kernel(a, b):
+        n = a.shape[0]
+        m = b.shape[0]
+        out = np.zeros((n, m), dtype=np.float64)
+        for i in range(n):
+            area = (a[i, 2] - a[i, 0]) * (a[i, 3] - a[i, 1])
+            if area <= 0:
+                continue
+            for j in range(m):
+                w = min(a[i, 2], b[j, 2]) - max(a[i, 0], b[j, 0])
+                h = min(a[i, 3], b[j, 3]) - max(a[i, 1], b[j, 1])
+                if w > 0 and h > 0:
+                    out[i, j] = (w * h) / area
+        return out
+
+else:
+
+    def _overlap_fraction_kernel(a, b):
+        areas = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+        a = a[:, None, :]
+        b = b[None, :, :]
+        w = np.minimum(a[..., 2], b[..., 2]) - np.maximum(a[..., 0], b[..., 0])
+        h = np.minimum(a[..., 3], b[..., 3]) - np.maximum(a[..., 1], b[..., 1])
+        inter = np.clip(w, 0, None) * np.clip(h, 0, None)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraction = inter / areas[:, None]
+        fraction[~(areas > 0)] = 0.0
+        return fraction
+
+
+def overlap_fraction_matrix(a_xyxy, b_xyxy) -> np.ndarray:
+    """
+    Fraction of each box in a covered by each box in b.
+
+    Args:
+        a_xyxy: (N, 4) array of boxes being tested
+        b_xyxy: (M, 4) array of covering regions
+
+    Returns:
+        (N, M) float matrix of overlap_area(a[i], b[j]) / area(a[i]);
+        rows for zero-area boxes are 0
+    """
+    return _overlap_fraction_kernel(_as_xyxy(a_xyxy), _as_xyxy(b_xyxy))
+
+
+def reading_order(y0, x0, tolerance: float) -> np.ndarray:
+    """
+    Stable reading order: top to bottom in bands of tolerance, then left to right.
+    
+    Matches sorted(key=lambda b: (round(b.y0 / tolerance) * tolerance, b.x0));
+    np.round rounds halves to even like round().
+    
+    Args:
+        y0: (N,) top coordinates
+        x0: (N,) left coordinates
+        tolerance: Height of a line band
+        
+    Returns:
+        (N,) int array of indices in reading order
+    """
+    y0 = np.asarray(y0, dtype=np.float64)
+    x0 = np.asarray(x0, dtype=np.float64)
+    return np.lexsort((x0, np.round(y0 / tolerance)))
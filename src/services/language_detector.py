@@ -1,14 +1,83 @@
 """Language Detector component for automatic source language detection."""
 
-from typing import List, Tuple, Optional
-from collections import Counter
+import hashlib
+import heapq
+import logging
+import threading
+from types import MappingProxyType
+from typing import DefaultDict, Dict, List, Mapping, Tuple, Optional
+from collections import Counter, defaultdict
 
-from langdetect import detect, detect_langs, LangDetectException
+from langdetect import DetectorFactory, LangDetectException
+from langdetect.detector_factory import PROFILES_DIRECTORY
+from langdetect.language import Language
 from langdetect.lang_detect_exception import ErrorCode
 
 from models.data_models import TextBlock, LanguageDetectionResult
 
 
+logger = logging.getLogger(__name__)
+
+
+# ISO 639-1 code -> human-readable name, built once at import
+_LANGUAGE_NAMES: Mapping[str, str] = MappingProxyType({
+    "en": "English",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+    "it": "Italian",
+    "pt": "Portuguese",
+    "ru": "Russian",
+    "zh-cn": "Chinese (Simplified)",
+    "zh-tw": "Chinese (Traditional)",
+    "ja": "Japanese",
+    "ko": "Korean",
+    "ar": "Arabic",
+    "hi": "Hindi",
+    "nl": "Dutch",
+    "pl": "Polish",
+    "tr": "Turkish",
+    "vi": "Vietnamese",
+    "th": "Thai",
+    "sv": "Swedish",
+    "da": "Danish",
+    "fi": "Finnish",
+    "no": "Norwegian",
+    "cs": "Czech",
+    "el": "Greek",
+    "he": "Hebrew",
+    "hu": "Hungarian",
+    "id": "Indonesian",
+    "ms": "Malay",
+    "ro": "Romanian",
+    "sk": "Slovak",
+    "uk": "Ukrainian",
+    "bg": "Bulgarian",
+    "hr": "Croatian",
+    "lt": "Lithuanian",
+    "lv": "Latvian",
+    "sl": "Slovenian",
+    "et": "Estonian",
+    "bn": "Bengali",
+    "ta": "Tamil",
+    "te": "Telugu",
+    "mr": "Marathi",
+    "gu": "Gujarati",
+    "kn": "Kannada",
+    "ml": "Malayalam",
+    "pa": "Punjabi",
+    "ur": "Urdu",
+    "fa": "Persian",
+    "af": "Afrikaans",
+    "sw": "Swahili",
+    "tl": "Tagalog",
+    "ca": "Catalan",
+    "cy": "Welsh",
+    "eu": "Basque",
+    "gl": "Galician",
+})
+
+
 class LanguageDetectionError(Exception):
     """Exception raised when language detection fails."""
     pass
@@ -20,6 +89,15 @@ class LanguageDetector:
     CONFIDENCE_THRESHOLD: float = 0.7
     MIN_TEXT_LENGTH: int = 20  # Minimum characters for reliable detection
     MAX_SAMPLES: int = 10  # Maximum text blocks to sample
+    CACHE_MAX_ENTRIES: int = 256  # Detection results kept per detector
+    MAX_DETECTION_CHARS: int = 2000  # Longer input costs more without helping accuracy; <= 0 disables
+    
+    # Shared across instances: profiles are read-only once loaded
+    _factory: Optional[DetectorFactory] = None
+    _factory_lock = threading.Lock()
+    # lingua detector when the optional package is installed; False once
+    # the import has failed, so it is only attempted once
+    _lingua_detector = None
 
     def __init__(self, confidence_threshold: float = 0.7):
         """
@@ -29,6 +107,8 @@ class LanguageDetector:
             confidence_threshold: Minimum confidence for reliable detection
         """
         self.confidence_threshold = confidence_threshold
+        # blake2b digest of analyzed text -> detected languages
+        self._cache: Dict[bytes, Tuple[Language, ...]] = {}
 
     def detect_language(self, text_blocks: List[TextBlock]) -> LanguageDetectionResult:
         """
@@ -51,7 +131,7 @@ class LanguageDetector:
             )
         
         # Sample text from blocks
-        sampled_text = self._sample_text(text_blocks, self.MAX_SAMPLES)
+        sampled_text = self._limit_text(self._sample_text(text_blocks, self.MAX_SAMPLES))
         
         if len(sampled_text) < self.MIN_TEXT_LENGTH:
             return LanguageDetectionResult(
@@ -63,7 +143,7 @@ class LanguageDetector:
         
         try:
             # Detect languages with probabilities
-            detected_langs = detect_langs(sampled_text)
+            detected_langs = self._detect_langs(sampled_text)
             
             if not detected_langs:
                 return LanguageDetectionResult(
@@ -105,6 +185,104 @@ class LanguageDetector:
         except Exception as e:
             raise LanguageDetectionError(f"Language detection failed: {str(e)}")
 
+    @classmethod
+    def _get_factory(cls) -> DetectorFactory:
+        """
+        Load the detector profiles once per process.
+        
+        Every profile is loaded, not just the languages the app offers as
+        targets: with a subset, text in any other language would be reported
+        as the nearest loaded one and sent to Gemini as a wrong source.
+        
+        Returns:
+            DetectorFactory holding all profiles that ship with langdetect
+        """
+        if cls._factory is None:
+            with cls._factory_lock:
+                if cls._factory is None:
+                    factory = DetectorFactory()
+                    factory.load_profile(PROFILES_DIRECTORY)
+                    logger.debug(f"Loaded {len(factory.get_lang_list())} language profiles")
+                    cls._factory = factory
+        return cls._factory
+
+    @classmethod
+    def _get_lingua_detector(cls):
+        """
+        Build the native lingua detector once per process, if available.
+        
+        lingua (pip install lingua-language-detector) classifies in Rust and
+        is much faster than langdetect's pure-Python scoring. Like the
+        langdetect factory, it considers every language it knows.
+        
+        Returns:
+            lingua LanguageDetector, or None when lingua is not installed
+        """
+        if cls._lingua_detector is None:
+            with cls._factory_lock:
+                if cls._lingua_detector is None:
+                    try:
+                        from lingua import LanguageDetectorBuilder
+                    except ImportError:
+                        logger.debug(
+                            "lingua not installed, using langdetect "
+                            "(pip install lingua-language-detector for faster detection)"
+                        )
+                        cls._lingua_detector = False
+                    else:
+                        cls._lingua_detector = LanguageDetectorBuilder.from_all_languages().build()
+        return cls._lingua_detector or None
+
+    def _detect_langs(self, text: str) -> List[Language]:
+        """
+        Detect languages in text, reusing the result for previously seen text.
+        
+        The cache is keyed by a digest so large samples are not retained.
+        Failures are not cached.
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Languages ordered by descending probability
+        """
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = tuple(self._classify(text))
+            if len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = cached
+        return list(cached)
+
+    def _classify(self, text: str) -> List[Language]:
+        """
+        Run lingua over text, falling back to langdetect.
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Languages ordered by descending probability
+        """
+        lingua_detector = self._get_lingua_detector()
+        if lingua_detector is not None:
+            return [
+                Language(value.language.iso_code_639_1.name.lower(), value.value)
+                for value in lingua_detector.compute_language_confidence_values(text)
+                if value.value > 0
+            ]
+        
+        detector = self._get_factory().create()
+        detector.append(text)
+        return detector.get_probabilities()
+
+    def _limit_text(self, text: str) -> str:
+        """Cap text at MAX_DETECTION_CHARS characters (no cap if the limit is <= 0)."""
+        if self.MAX_DETECTION_CHARS > 0:
+            return text[:self.MAX_DETECTION_CHARS]
+        return text
+
     def _sample_text(self, text_blocks: List[TextBlock], max_samples: int = 10) -> str:
         """
         Sample text from blocks for detection.
@@ -121,33 +299,28 @@ class LanguageDetector:
         if not text_blocks:
             return ""
         
-        # Group blocks by page
-        pages: dict = {}
+        # Group blocks by page in one pass
+        pages: DefaultDict[int, List[TextBlock]] = defaultdict(list)
         for block in text_blocks:
-            page_num = block.page_number
-            if page_num not in pages:
-                pages[page_num] = []
-            pages[page_num].append(block)
+            pages[block.page_number].append(block)
         
         # Sample evenly from different pages
         sampled_blocks: List[TextBlock] = []
-        page_numbers = sorted(pages.keys())
         
         # Calculate samples per page
-        samples_per_page = max(1, max_samples // len(page_numbers))
+        samples_per_page = max(1, max_samples // len(pages))
         
-        for page_num in page_numbers:
-            page_blocks = pages[page_num]
-            # Sort by text length (prefer longer blocks for better detection)
-            page_blocks_sorted = sorted(
-                page_blocks, 
-                key=lambda b: len(b.text), 
-                reverse=True
-            )
-            # Take top blocks from this page
-            sampled_blocks.extend(page_blocks_sorted[:samples_per_page])
+        # Enough text for a reliable detection; stop sampling once reached
+        enough_chars = self.MIN_TEXT_LENGTH * 5
+        sampled_chars = 0
+        
+        for _, page_blocks in sorted(pages.items()):
+            # Take the longest blocks from this page (better for detection)
+            top_blocks = heapq.nlargest(samples_per_page, page_blocks, key=lambda b: len(b.text))
+            sampled_blocks.extend(top_blocks)
+            sampled_chars += sum(len(block.text) for block in top_blocks)
             
-            if len(sampled_blocks) >= max_samples:
+            if len(sampled_blocks) >= max_samples or sampled_chars >= enough_chars:
                 break
         
         # Combine text from sampled blocks
@@ -172,8 +345,10 @@ class LanguageDetector:
                 sample_size=len(text) if text else 0,
             )
         
+        text = self._limit_text(text)
+        
         try:
-            detected_langs = detect_langs(text)
+            detected_langs = self._detect_langs(text)
             
             if not detected_langs:
                 return LanguageDetectionResult(
@@ -220,7 +395,8 @@ class LanguageDetector:
             result.confidence >= self.confidence_threshold
         )
 
-    def get_language_name(self, lang_code: str) -> str:
+    @staticmethod
+    def get_language_name(lang_code: str) -> str:
         """
         Get human-readable language name from ISO 639-1 code.
         
@@ -230,60 +406,4 @@ class LanguageDetector:
         Returns:
             Human-readable language name
         """
-        language_names = {
-            "en": "English",
-            "es": "Spanish",
-            "fr": "French",
-            "de": "German",
-            "it": "Italian",
-            "pt": "Portuguese",
-            "ru": "Russian",
-            "zh-cn": "Chinese (Simplified)",
-            "zh-tw": "Chinese (Traditional)",
-            "ja": "Japanese",
-            "ko": "Korean",
-            "ar": "Arabic",
-            "hi": "Hindi",
-            "nl": "Dutch",
-            "pl": "Polish",
-            "tr": "Turkish",
-            "vi": "Vietnamese",
-            "th": "Thai",
-            "sv": "Swedish",
-            "da": "Danish",
-            "fi": "Finnish",
-            "no": "Norwegian",
-            "cs": "Czech",
-            "el": "Greek",
-            "he": "Hebrew",
-            "hu": "Hungarian",
-            "id": "Indonesian",
-            "ms": "Malay",
-            "ro": "Romanian",
-            "sk": "Slovak",
-            "uk": "Ukrainian",
-            "bg": "Bulgarian",
-            "hr": "Croatian",
-            "lt": "Lithuanian",
-            "lv": "Latvian",
-            "sl": "Slovenian",
-            "et": "Estonian",
-            "bn": "Bengali",
-            "ta": "Tamil",
-            "te": "Telugu",
-            "mr": "Marathi",
-            "gu": "Gujarati",
-            "kn": "Kannada",
-            "ml": "Malayalam",
-            "pa": "Punjabi",
-            "ur": "Urdu",
-            "fa": "Persian",
-            "af": "Afrikaans",
-            "sw": "Swahili",
-            "tl": "Tagalog",
-            "ca": "Catalan",
-            "cy": "Welsh",
-            "eu": "Basque",
-            "gl": "Galician",
-        }
-        return language_names.get(lang_code, lang_code.upper())
+        return _LANGUAGE_NAMES.get(lang_code, lang_code.upper())
@@ -1,8 +1,10 @@
 """Layout Reconstructor component for rebuilding PDFs with translated content."""
 
 import logging
-from typing import List, Optional, Tuple, Dict
-from dataclasses import dataclass
+import math
+from collections import defaultdict
+from typing import List, Optional, Tuple, Dict, Union
+from dataclasses import dataclass, field
 
 import fitz  # PyMuPDF
 
@@ -13,7 +15,7 @@ from models.data_models import (
     TableStructure,
     TableCell,
 )
-from services.font_adjuster import FontAdjuster, FontAdjustment
+from services.font_adjuster import FontAdjuster, FontAdjustment, text_advance
 
 
 logger = logging.getLogger(__name__)
@@ -31,6 +33,16 @@ class ReconstructedBlock:
     original_font_color: Tuple[int, int, int] = (0, 0, 0)
     original_font_name: str = "helv"
     original_font_size: float = 12.0
+    # Source text; a block translated to the same text is left untouched
+    original_text: Optional[str] = None
+
+
+@dataclass(slots=True)
+class _PageTextBatch:
+    """Lines of one colour queued for a page, written with a single TextWriter."""
+    writer: fitz.TextWriter
+    # (rect, text, font_size) per block, for insert_textbox if writing fails
+    fallbacks: List[Tuple[fitz.Rect, str, float]] = field(default_factory=list)
 
 
 class LayoutReconstructionError(Exception):
@@ -41,13 +53,41 @@ class LayoutReconstructionError(Exception):
 class LayoutReconstructor:
     """Rebuilds the PDF with translated content while preserving layout."""
 
-    def __init__(self, original_pdf_path: str, target_language: str = "en"):
-        self._original_path = original_pdf_path
+    # Memoized wraps kept (oldest evicted first)
+    WRAP_CACHE_MAX_ENTRIES = 4096
+
+    def __init__(
+        self,
+        original_pdf: Union[str, fitz.Document],
+        target_language: str = "en",
+        font_adjuster: Optional[FontAdjuster] = None,
+    ):
+        """
+        Initialize the reconstructor.
+        
+        Args:
+            original_pdf: Path to the original PDF, or an open fitz.Document.
+                A document passed in is edited in place and left open for the
+                caller to close, avoiding a re-parse of the file.
+            target_language: Target language code
+            font_adjuster: FontAdjuster to share with the caller (a default one is created if omitted)
+        """
+        if isinstance(original_pdf, fitz.Document):
+            self._original_path = original_pdf.name
+            self._source_doc: Optional[fitz.Document] = original_pdf
+        else:
+            self._original_path = original_pdf
+            self._source_doc = None
         self._target_language = target_language.lower()
-        self._doc: Optional[fitz.Document] = None
         self._output_doc: Optional[fitz.Document] = None
-        self._font_adjuster = FontAdjuster()
+        # Original file contents, kept to open a fresh output per reconstruct call
+        self._template_bytes: Optional[bytes] = None
+        self._font_adjuster = font_adjuster or FontAdjuster()
         self._font_cache: Dict[str, fitz.Font] = {}
+        # font name -> character -> advance width at font size 1
+        self._advance_cache: Dict[str, Dict[str, float]] = {}
+        # (text, font name, font size, max width, line limit) -> wrapped lines
+        self._wrap_cache: Dict[Tuple[str, str, float, float, Optional[int]], Tuple[str, ...]] = {}
 
     def _get_font(self, font_name: str = "helv") -> fitz.Font:
         """Get or create a font object."""
@@ -61,16 +101,24 @@ class LayoutReconstructor:
         return self._font_cache[font_name]
 
     def _open_documents(self) -> None:
-        """Open the original PDF and create output document."""
-        if self._doc is None:
-            self._doc = fitz.open(self._original_path)
-            self._output_doc = fitz.open(self._original_path)
+        """Open the document that is edited into the output."""
+        if self._output_doc is None:
+            if self._source_doc is not None:
+                # Reuse the caller's document
+                self._output_doc = self._source_doc
+            else:
+                # Each call edits a fresh copy; the file is read from disk once
+                if self._template_bytes is None:
+                    with open(self._original_path, "rb") as f:
+                        self._template_bytes = f.read()
+                self._output_doc = fitz.open("pdf", self._template_bytes)
 
     def _close_documents(self) -> None:
         """Close opened documents."""
-        if self._doc:
-            self._doc.close()
-            self._doc = None
+        if self._source_doc is not None:
+            # Owned by the caller
+            self._output_doc = None
+            return
         if self._output_doc:
             self._output_doc.close()
             self._output_doc = None
@@ -92,52 +140,86 @@ class LayoutReconstructor:
         self._open_documents()
         
         try:
-            # Group blocks by page
-            blocks_by_page: Dict[int, List[ReconstructedBlock]] = {}
-            for block in translated_blocks:
-                if block.page_number not in blocks_by_page:
-                    blocks_by_page[block.page_number] = []
+            # Group blocks by page, sorted once by position (top to bottom,
+            # left to right); the stable sort keeps each page's order
+            blocks_by_page: Dict[int, List[ReconstructedBlock]] = defaultdict(list)
+            for block in sorted(translated_blocks, key=lambda b: (b.bbox.y0, b.bbox.x0)):
                 blocks_by_page[block.page_number].append(block)
             
-            # Process each page
-            for page_num in range(len(self._output_doc)):
-                page = self._output_doc[page_num]
-                page_blocks = blocks_by_page.get(page_num, [])
-                
-                if not page_blocks:
-                    continue
-                
-                # Sort blocks by position (top to bottom, left to right)
-                page_blocks.sort(key=lambda b: (b.bbox.y0, b.bbox.x0))
-                
-                # Process each block
-                for block in page_blocks:
-                    self._replace_text_block(page, block)
+            # Process each page that has blocks
+            font = self._get_font()
+            page_count = len(self._output_doc)
+            for page_num in sorted(blocks_by_page):
+                if 0 <= page_num < page_count:
+                    self._replace_page_blocks(self._output_doc[page_num], blocks_by_page[page_num], font)
             
             return self._output_doc.tobytes()
             
         finally:
             self._close_documents()
 
-    def _replace_text_block(self, page: fitz.Page, block: ReconstructedBlock) -> None:
-        """Replace original text with translated text at the same position."""
-        if not block.translated_text or not block.translated_text.strip():
-            return
+    def _replace_page_blocks(
+        self,
+        page: fitz.Page,
+        blocks: List[ReconstructedBlock],
+        font: fitz.Font
+    ) -> None:
+        """
+        Replace original text with translated text for all blocks on a page.
         
-        # Create rectangle for the text area
-        rect = fitz.Rect(block.bbox.x0, block.bbox.y0, block.bbox.x1, block.bbox.y1)
+        Every cover rectangle goes into one shape and every line into one
+        TextWriter per colour, so the page content stream is rewritten once
+        per batch instead of twice per block.
+        """
+        blocks = [b for b in blocks if self._needs_replacement(b)]
+        if not blocks:
+            return
         
-        # Step 1: Cover original text with white rectangle
+        # Step 1: Cover original text with white rectangles
         shape = page.new_shape()
-        shape.draw_rect(rect)
+        for block in blocks:
+            shape.draw_rect(fitz.Rect(block.bbox.x0, block.bbox.y0, block.bbox.x1, block.bbox.y1))
         shape.finish(color=(1, 1, 1), fill=(1, 1, 1))
         shape.commit()
         
-        # Step 2: Insert translated text
-        self._insert_fitted_text(page, block)
+        # Step 2: Insert translated text, batched by colour
+        writers: Dict[Tuple[float, ...], _PageTextBatch] = {}
+        for block in blocks:
+            self._insert_fitted_text(page, block, writers, font)
+        
+        for color, batch in writers.items():
+            try:
+                batch.writer.write_text(page, color=color)
+            except Exception as e:
+                # Fallback: use insert_textbox for each block of the batch
+                for rect, text, font_size in batch.fallbacks:
+                    try:
+                        page.insert_textbox(
+                            rect,
+                            text,
+                            fontsize=font_size,
+                            color=color,
+                            align=fitz.TEXT_ALIGN_LEFT,
+                        )
+                    except:
+                        logger.debug(f"Text insertion failed: {e}")
+
+    @staticmethod
+    def _needs_replacement(block: ReconstructedBlock) -> bool:
+        """Whether a block has text to write that differs from what the page already shows."""
+        text = block.translated_text.strip() if block.translated_text else ""
+        if not text:
+            return False
+        return block.original_text is None or text != block.original_text.strip()
 
-    def _insert_fitted_text(self, page: fitz.Page, block: ReconstructedBlock) -> None:
-        """Insert text that fits within the bounding box."""
+    def _insert_fitted_text(
+        self,
+        page: fitz.Page,
+        block: ReconstructedBlock,
+        writers: Dict[Tuple[float, ...], "_PageTextBatch"],
+        font: fitz.Font
+    ) -> None:
+        """Lay out text that fits within the bounding box into the page's text batches."""
         text = block.translated_text.strip()
         if not text:
             return
@@ -155,73 +237,144 @@ class LayoutReconstructor:
         if available_width <= 0 or available_height <= 0:
             return
         
-        # Get font and initial size
-        font = self._get_font()
+        # Initial size
         font_size = min(block.original_font_size, block.font_adjustment.adjusted_font_size)
         
+        # Shrinking stops just above 4.5pt, so no baseline can fit a box
+        # lower than this and the text is not laid out at all
+        if available_height < min(font_size, 4.5):
+            return
+        
         # Convert color
         color = tuple(c / 255.0 for c in block.original_font_color)
         
-        # Calculate how many lines we can fit
+        # Wrap text to fit width, reducing font size if too many lines
+        font_size, lines = self._shrink_to_fit(
+            text, font, font_size, available_width, available_height
+        )
         line_height = font_size * 1.15
         max_lines = max(1, int(available_height / line_height))
         
-        # Wrap text to fit width
-        lines = self._wrap_text_smart(text, font, font_size, available_width)
-        
-        # If too many lines, reduce font size
-        while len(lines) > max_lines and font_size > 5:
-            font_size -= 0.5
-            line_height = font_size * 1.15
-            max_lines = max(1, int(available_height / line_height))
-            lines = self._wrap_text_smart(text, font, font_size, available_width)
-        
         # Truncate if still too many lines
         if len(lines) > max_lines:
             lines = lines[:max_lines]
             if lines and len(lines[-1]) > 3:
                 lines[-1] = lines[-1][:-3] + "..."
         
-        # Insert text using TextWriter
-        try:
-            tw = fitz.TextWriter(page.rect)
-            y = y0 + font_size  # Start at baseline
-            
-            for line in lines:
-                if y > y1:
-                    break
-                try:
-                    tw.append((x0, y), line, font=font, fontsize=font_size)
-                except:
-                    pass
-                y += line_height
-            
-            tw.write_text(page, color=color)
-        except Exception as e:
-            # Fallback: use insert_textbox
+        batch = writers.get(color)
+        if batch is None:
+            batch = writers[color] = _PageTextBatch(fitz.TextWriter(page.rect))
+        batch.fallbacks.append((fitz.Rect(x0, y0, x1, y1), text, font_size))
+        
+        y = y0 + font_size  # Start at baseline
+        for line in lines:
+            if y > y1:
+                break
             try:
-                rect = fitz.Rect(x0, y0, x1, y1)
-                page.insert_textbox(
-                    rect,
-                    text,
-                    fontsize=font_size,
-                    color=color,
-                    align=fitz.TEXT_ALIGN_LEFT,
-                )
+                batch.writer.append((x0, y), line, font=font, fontsize=font_size)
             except:
-                logger.debug(f"Text insertion failed: {e}")
+                pass
+            y += line_height
+
+    def _shrink_to_fit(
+        self,
+        text: str,
+        font: fitz.Font,
+        font_size: float,
+        available_width: float,
+        available_height: float
+    ) -> Tuple[float, List[str]]:
+        """
+        Find the largest font size, in 0.5pt steps down to 5pt, whose wrapped lines fit the height.
+        
+        The steps are binary searched, so an oversized block is wrapped
+        about log2(steps) times instead of once per step.
+        
+        Returns:
+            Tuple of (font size, wrapped lines); the smallest step's lines
+            if none fits
+        """
+        def wrap(size: float) -> Tuple[List[str], bool]:
+            max_lines = max(1, int(available_height / (size * 1.15)))
+            # One line past the limit shows it overflows and is all truncation needs
+            lines = self._wrap_text_smart(text, font, size, available_width, max_lines + 1)
+            return lines, len(lines) <= max_lines
+        
+        lines, fits = wrap(font_size)
+        if fits or font_size <= 5:
+            return font_size, lines
+        
+        # Step k tries font_size - 0.5 * k; the last step is the first at or below 5pt
+        last_step = math.ceil((font_size - 5) / 0.5)
+        low, high = 1, last_step
+        best: Optional[Tuple[int, List[str]]] = None
+        while low <= high:
+            step = (low + high) // 2
+            step_lines, fits = wrap(font_size - 0.5 * step)
+            if fits:
+                best = (step, step_lines)
+                high = step - 1
+            else:
+                low = step + 1
+        
+        if best is None:
+            # Nothing fits; the caller truncates the smallest size's lines
+            smallest = font_size - 0.5 * last_step
+            return smallest, wrap(smallest)[0]
+        step, lines = best
+        return font_size - 0.5 * step, lines
 
     def _wrap_text_smart(
         self, 
         text: str, 
         font: fitz.Font, 
         font_size: float, 
-        max_width: float
+        max_width: float,
+        line_limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Wrap text intelligently to fit within max_width.
+        
+        Wraps are memoized, so text repeated across pages (headers, footers,
+        table labels) in the same box is only wrapped once per size.
+        
+        Args:
+            text: Text to wrap
+            font: Font to measure with
+            font_size: Font size
+            max_width: Available line width
+            line_limit: Stop after this many lines (None wraps everything)
+        """
+        key = (text, font.name, font_size, max_width, line_limit)
+        lines = self._wrap_cache.get(key)
+        if lines is None:
+            lines = tuple(self._wrap_lines(text, font, font_size, max_width, line_limit))
+            if len(self._wrap_cache) >= self.WRAP_CACHE_MAX_ENTRIES:
+                self._wrap_cache.pop(next(iter(self._wrap_cache)))
+            self._wrap_cache[key] = lines
+        return list(lines)
+
+    def _wrap_lines(
+        self,
+        text: str,
+        font: fitz.Font,
+        font_size: float,
+        max_width: float,
+        line_limit: Optional[int] = None
     ) -> List[str]:
-        """Wrap text intelligently to fit within max_width."""
+        """
+        Wrap text to max_width without consulting the wrap cache.
+        
+        Line widths are extended character by character from cached advances
+        (in the same order fitz.Font.text_length sums them), so each line is
+        measured once instead of once per word. Finished lines never change,
+        so wrapping stops as soon as line_limit of them exist.
+        """
         if not text:
             return []
         
+        advances = self._advance_cache.setdefault(font.name, {})
+        
         # Handle newlines in original text
         paragraphs = text.split('\n')
         all_lines = []
@@ -236,28 +389,26 @@ class LayoutReconstructor:
                 continue
             
             current_line = ""
+            current_advance = 0.0  # Width of current_line at size 1
             
             for word in words:
-                test_line = f"{current_line} {word}".strip() if current_line else word
-                
-                try:
-                    width = font.text_length(test_line, fontsize=font_size)
-                except:
-                    width = len(test_line) * font_size * 0.5
+                if current_line:
+                    test_line = f"{current_line} {word}"
+                    test_advance = text_advance(font, advances, " " + word, current_advance)
+                else:
+                    test_line = word
+                    test_advance = text_advance(font, advances, word)
                 
-                if width <= max_width:
+                if test_advance * font_size <= max_width:
                     current_line = test_line
+                    current_advance = test_advance
                 else:
                     if current_line:
                         all_lines.append(current_line)
                     
                     # Check if word itself is too long
-                    try:
-                        word_width = font.text_length(word, fontsize=font_size)
-                    except:
-                        word_width = len(word) * font_size * 0.5
-                    
-                    if word_width > max_width:
+                    word_advance = text_advance(font, advances, word)
+                    if word_advance * font_size > max_width:
                         # Break the word
                         broken = self._break_word(word, font, font_size, max_width)
                         if broken:
@@ -265,11 +416,18 @@ class LayoutReconstructor:
                             current_line = broken[-1] if broken else ""
                         else:
                             current_line = word[:1]
+                        current_advance = text_advance(font, advances, current_line)
                     else:
                         current_line = word
+                        current_advance = word_advance
+                    
+                    if line_limit is not None and len(all_lines) >= line_limit:
+                        return all_lines[:line_limit]
             
             if current_line:
                 all_lines.append(current_line)
+            if line_limit is not None and len(all_lines) >= line_limit:
+                return all_lines[:line_limit]
         
         return all_lines if all_lines else [text[:20] + "..." if len(text) > 20 else text]
 
@@ -280,26 +438,30 @@ class LayoutReconstructor:
         font_size: float, 
         max_width: float
     ) -> List[str]:
-        """Break a long word into multiple lines."""
+        """
+        Break a long word into multiple lines.
+        
+        Each part is sliced out of the word once its end is known, rather
+        than built up a character at a time.
+        """
+        advances = self._advance_cache.setdefault(font.name, {})
         parts = []
-        current = ""
+        start = 0  # Index where the current part begins
+        current_advance = 0.0
         
-        for char in word:
-            test = current + char
-            try:
-                width = font.text_length(test, fontsize=font_size)
-            except:
-                width = len(test) * font_size * 0.5
+        for index, char in enumerate(word):
+            test_advance = text_advance(font, advances, char, current_advance)
             
-            if width <= max_width:
-                current = test
+            if test_advance * font_size <= max_width:
+                current_advance = test_advance
             else:
-                if current:
-                    parts.append(current)
-                current = char
+                if index > start:
+                    parts.append(word[start:index])
+                start = index
+                current_advance = text_advance(font, advances, char)
         
-        if current:
-            parts.append(current)
+        if start < len(word):
+            parts.append(word[start:])
         
         return parts
 
@@ -316,9 +478,9 @@ class LayoutReconstructor:
     def get_page_dimensions(self, page_num: int) -> Tuple[float, float]:
         """Get dimensions of a specific page."""
         self._open_documents()
-        if page_num >= len(self._doc):
+        if page_num >= len(self._output_doc):
             raise LayoutReconstructionError(f"Page {page_num} does not exist")
-        page = self._doc[page_num]
+        page = self._output_doc[page_num]
         return (page.rect.width, page.rect.height)
 
     def prepare_block(
@@ -334,6 +496,7 @@ class LayoutReconstructor:
                 original_block.bbox,
                 original_block.font_name,
                 original_block.font_size,
+                original_block.text,
             )
         
         color = (0, 0, 0)
@@ -349,6 +512,7 @@ class LayoutReconstructor:
             original_font_color=color,
             original_font_name=original_block.font_name,
             original_font_size=original_block.font_size,
+            original_text=original_block.text,
         )
 
     def prepare_table_cell_block(
@@ -381,4 +545,5 @@ class LayoutReconstructor:
             original_font_color=color,
             original_font_name=original_font_name,
             original_font_size=original_font_size,
+            original_text=cell.text,
         )
@@ -0,0 +1,101 @@
+"""Per-page memo of PyMuPDF text extraction shared by the parser and table detector.
+
+Also holds the helpers both of them use to read span attributes from that
+extraction.
+"""
+
+import weakref
+from typing import Any, Dict, Tuple
+
+import fitz  # PyMuPDF
+
+
+# Flags the parser extracts text with; the table detector reuses that extraction
+TEXT_DICT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE
+
+# Span font flag bits (PyMuPDF TEXT_FONT_BOLD / TEXT_FONT_ITALIC)
+SPAN_FLAG_BOLD = 1 << 4
+SPAN_FLAG_ITALIC = 1 << 1
+
+# Span colour int -> (r, g, b); documents reuse a handful of colours
+_RGB_CACHE: Dict[int, Tuple[int, int, int]] = {}
+
+
+def span_rgb(color_int: int) -> Tuple[int, int, int]:
+    """
+    Convert a span's integer colour to an RGB tuple.
+
+    Args:
+        color_int: Colour as 0xRRGGBB integer
+
+    Returns:
+        RGB tuple (r, g, b), shared between calls with the same colour
+    """
+    rgb = _RGB_CACHE.get(color_int)
+    if rgb is None:
+        rgb = _RGB_CACHE.setdefault(color_int, (
+            (color_int >> 16) & 0xFF,
+            (color_int >> 8) & 0xFF,
+            color_int & 0xFF,
+        ))
+    return rgb
+
+
+class PageCache:
+    """
+    Lazily computed extractions of one fitz.Page.
+
+    Each get_text("dict") call re-parses the page's content stream, so the
+    result is kept for as long as the page object lives and handed to every
+    caller that asks for the same flags. Instances are looked up by page with
+    PageCache.of and are dropped together with the page.
+    """
+
+    __slots__ = ("_page_ref", "_text_dicts", "__weakref__")
+
+    _instances: "weakref.WeakKeyDictionary[fitz.Page, PageCache]" = weakref.WeakKeyDictionary()
+
+    def __init__(self, page: fitz.Page):
+        """
+        Args:
+            page: PyMuPDF page object (held weakly)
+        """
+        self._page_ref = weakref.ref(page)
+        self._text_dicts: Dict[int, Dict[str, Any]] = {}
+
+    @classmethod
+    def of(cls, page: fitz.Page) -> "PageCache":
+        """
+        Get the cache of a page, creating it on first use.
+
+        Args:
+            page: PyMuPDF page object
+
+        Returns:
+            PageCache shared by all callers holding the same page object
+        """
+        cache = cls._instances.get(page)
+        if cache is None:
+            cache = cls._instances.setdefault(page, cls(page))
+        return cache
+
+    def text_dict(self, flags: int = TEXT_DICT_FLAGS) -> Dict[str, Any]:
+        """
+        page.get_text("dict", flags=flags), extracted once per flags value.
+
+        Callers must treat the result as read-only.
+
+        Args:
+            flags: PyMuPDF TEXT_* extraction flags
+
+        Returns:
+            Text dictionary of the page
+        """
+        text_dict = self._text_dicts.get(flags)
+        if text_dict is None:
+            page = self._page_ref()
+            if page is None:
+                raise ReferenceError("page of this PageCache no longer exists")
+            text_dict = page.get_text("dict", flags=flags)
+            self._text_dicts[flags] = text_dict
+        return text_dict
@@ -1,8 +1,10 @@
 """PDF Parser component for extracting content from PDF documents."""
 
 import os
-from typing import List, Tuple, Optional, Any
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 import fitz  # PyMuPDF
+import numpy as np
 
 from models.data_models import (
     BoundingBox,
@@ -11,6 +13,14 @@ from models.data_models import (
     PageContent,
     FontInfo,
 )
+from services.geometry import reading_order
+from services.page_cache import (
+    SPAN_FLAG_BOLD,
+    SPAN_FLAG_ITALIC,
+    TEXT_DICT_FLAGS,
+    PageCache,
+    span_rgb,
+)
 
 
 class PDFParseError(Exception):
@@ -18,9 +28,64 @@ class PDFParseError(Exception):
     pass
 
 
+@dataclass(slots=True)
+class _MergedLine:
+    """Running union of same-line blocks; one TextBlock is built when the line ends."""
+    first: TextBlock
+    x0: float = 0.0
+    y0: float = 0.0
+    x1: float = 0.0
+    y1: float = 0.0
+    parts: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        bbox = self.first.bbox
+        self.x0, self.y0, self.x1, self.y1 = bbox.x0, bbox.y0, bbox.x1, bbox.y1
+        self.parts.append(self.first.text)
+
+    def add(self, block: TextBlock) -> None:
+        """Extend the line with a block to its right."""
+        bbox = block.bbox
+        self.x0 = min(self.x0, bbox.x0)
+        self.y0 = min(self.y0, bbox.y0)
+        self.x1 = max(self.x1, bbox.x1)
+        self.y1 = max(self.y1, bbox.y1)
+        self.parts.append(block.text)
+
+    def to_block(self) -> TextBlock:
+        """The merged TextBlock (the original block if nothing was merged)."""
+        if len(self.parts) == 1:
+            return self.first
+        return TextBlock(
+            text=" ".join(self.parts),
+            bbox=BoundingBox(x0=self.x0, y0=self.y0, x1=self.x1, y1=self.y1),
+            font_name=self.first.font_name,
+            font_size=self.first.font_size,
+            page_number=self.first.page_number,
+            font_info=self.first.font_info,
+        )
+
+
 class PDFParser:
     """Extracts content from PDF documents using PyMuPDF."""
 
+    # Below this many blocks a Python sort beats building NumPy keys
+    ARGSORT_MIN_BLOCKS = 32
+    # Extracted images kept per document, so an image repeated on many pages
+    # (logos, backgrounds) is decoded once and its bytes shared
+    IMAGE_CACHE_MAX_ENTRIES = 16
+
+    def __init__(self, extract_drawings: bool = False):
+        """
+        Initialize the parser.
+        
+        Args:
+            extract_drawings: Fill PageContent.raw_elements with the page's
+                vector drawings; page.get_drawings() decodes the whole content
+                stream, so it only runs when requested
+        """
+        self._extract_drawings = extract_drawings
+
     def validate_pdf(self, pdf_path: str) -> Tuple[bool, Optional[str]]:
         """
         Validate PDF file and return (is_valid, error_message).
@@ -31,35 +96,55 @@ class PDFParser:
         Returns:
             Tuple of (is_valid, error_message). error_message is None if valid.
         """
+        try:
+            self.open_document(pdf_path).close()
+            return True, None
+        except PDFParseError as e:
+            return False, str(e)
+
+    def open_document(self, pdf_path: str) -> fitz.Document:
+        """
+        Validate a PDF and return it opened, so callers only open it once.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            Open fitz.Document; the caller is responsible for closing it
+            
+        Raises:
+            PDFParseError: If the file is missing, not a PDF, corrupted or empty
+        """
         if not pdf_path:
-            return False, "PDF path is empty"
+            raise PDFParseError("PDF path is empty")
         
         if not os.path.exists(pdf_path):
-            return False, f"File not found: {pdf_path}"
+            raise PDFParseError(f"File not found: {pdf_path}")
         
         if not pdf_path.lower().endswith('.pdf'):
-            return False, f"File is not a PDF: {pdf_path}"
+            raise PDFParseError(f"File is not a PDF: {pdf_path}")
         
         try:
             doc = fitz.open(pdf_path)
-            if doc.page_count == 0:
-                doc.close()
-                return False, "PDF has no pages"
-            doc.close()
-            return True, None
         except fitz.FileDataError as e:
-            return False, f"Corrupted or invalid PDF: {str(e)}"
+            raise PDFParseError(f"Corrupted or invalid PDF: {str(e)}")
         except fitz.FileNotFoundError:
-            return False, f"File not found: {pdf_path}"
+            raise PDFParseError(f"File not found: {pdf_path}")
         except Exception as e:
-            return False, f"Error opening PDF: {str(e)}"
+            raise PDFParseError(f"Error opening PDF: {str(e)}")
+        
+        if doc.page_count == 0:
+            doc.close()
+            raise PDFParseError("PDF has no pages")
+        
+        return doc
 
-    def parse(self, pdf_path: str) -> List[PageContent]:
+    def parse(self, source: Union[str, fitz.Document]) -> List[PageContent]:
         """
         Extract all content from PDF with layout information.
         
         Args:
-            pdf_path: Path to the PDF file
+            source: Path to the PDF file, or an already open fitz.Document
             
         Returns:
             List of PageContent objects, one per page
@@ -67,35 +152,57 @@ class PDFParser:
         Raises:
             PDFParseError: If the PDF cannot be parsed
         """
-        is_valid, error_msg = self.validate_pdf(pdf_path)
-        if not is_valid:
-            raise PDFParseError(error_msg)
+        return [page_content for _, page_content in self.iter_pages(source)]
+
+    def iter_pages(self, source: Union[str, fitz.Document]) -> Iterator[Tuple[fitz.Page, PageContent]]:
+        """
+        Lazily extract content page by page, keeping the document open.
         
-        pages: List[PageContent] = []
+        Yields the live PyMuPDF page alongside its PageContent so callers can
+        run further page-level analysis (e.g. table detection) before moving
+        on. A document opened from a path is closed when the generator is
+        exhausted or closed; a document passed in stays open for the caller.
+        PyMuPDF documents must not be used from two threads at once, so
+        consume the generator from a single thread.
         
-        try:
-            doc = fitz.open(pdf_path)
+        Args:
+            source: Path to the PDF file, or an already open fitz.Document
+            
+        Yields:
+            Tuples of (fitz.Page, PageContent), one per page
             
+        Raises:
+            PDFParseError: If the PDF cannot be parsed
+        """
+        owns_document = isinstance(source, str)
+        doc = self.open_document(source) if owns_document else source
+        
+        image_cache: Dict[int, Dict[str, Any]] = {}
+        try:
             for page_num in range(doc.page_count):
                 page = doc[page_num]
-                page_content = self._extract_page_content(page, page_num)
-                pages.append(page_content)
-            
-            doc.close()
-            return pages
-            
-        except PDFParseError:
-            raise
-        except Exception as e:
-            raise PDFParseError(f"Error parsing PDF: {str(e)}")
+                try:
+                    page_content = self._extract_page_content(page, page_num, image_cache)
+                except Exception as e:
+                    raise PDFParseError(f"Error parsing PDF: {str(e)}")
+                yield page, page_content
+        finally:
+            if owns_document:
+                doc.close()
 
-    def _extract_page_content(self, page: fitz.Page, page_num: int) -> PageContent:
+    def _extract_page_content(
+        self,
+        page: fitz.Page,
+        page_num: int,
+        image_cache: Optional[Dict[int, Dict[str, Any]]] = None
+    ) -> PageContent:
         """
         Extract content from a single PDF page.
         
         Args:
             page: PyMuPDF page object
             page_num: Page number (0-indexed)
+            image_cache: Extracted images by xref, shared by the pages of one document
             
         Returns:
             PageContent object with extracted text blocks and images
@@ -106,10 +213,10 @@ class PDFParser:
         text_blocks = self._extract_text_blocks(page, page_num)
         
         # Extract images
-        image_regions = self._extract_images(page, page_num)
+        image_regions = self._extract_images(page, page_num, image_cache)
         
         # Extract raw elements for preservation
-        raw_elements = self._extract_raw_elements(page)
+        raw_elements = self._extract_raw_elements(page) if self._extract_drawings else []
         
         return PageContent(
             page_number=page_num,
@@ -134,8 +241,14 @@ class PDFParser:
         """
         text_blocks: List[TextBlock] = []
         
-        # Get text with detailed information using "dict" extraction
-        text_dict = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)
+        # Share identical boxes/fonts (table columns, common baselines) across lines
+        bbox_interner: Dict[BoundingBox, BoundingBox] = {}
+        font_interner: Dict[FontInfo, FontInfo] = {}
+        
+        # Get text with detailed information using "dict" extraction. Without
+        # TEXT_PRESERVE_IMAGES PyMuPDF emits no image blocks; images come from
+        # _extract_images
+        text_dict = PageCache.of(page).text_dict(TEXT_DICT_FLAGS)
         
         for block in text_dict.get("blocks", []):
             if block.get("type") != 0:  # 0 = text block
@@ -159,11 +272,10 @@ class PDFParser:
                         if line_font_name == "unknown":
                             line_font_name = span.get("font", "unknown")
                             line_font_size = span.get("size", 12.0)
-                            color_int = span.get("color", 0)
-                            line_color = self._int_to_rgb(color_int)
+                            line_color = span_rgb(span.get("color", 0))
                             flags = span.get("flags", 0)
-                            line_is_bold = bool(flags & 2 ** 4)
-                            line_is_italic = bool(flags & 2 ** 1)
+                            line_is_bold = (flags & SPAN_FLAG_BOLD) != 0
+                            line_is_italic = (flags & SPAN_FLAG_ITALIC) != 0
                 
                 full_text = "".join(line_text_parts).strip()
                 
@@ -177,8 +289,10 @@ class PDFParser:
                     is_bold=line_is_bold,
                     is_italic=line_is_italic,
                 )
+                font_info = font_interner.setdefault(font_info, font_info)
                 
                 bbox = BoundingBox.from_tuple(line_bbox)
+                bbox = bbox_interner.setdefault(bbox, bbox)
                 
                 text_block = TextBlock(
                     text=full_text,
@@ -190,11 +304,15 @@ class PDFParser:
                 )
                 text_blocks.append(text_block)
         
-        # Merge adjacent blocks that are on the same line
+        # Merge adjacent blocks that are on the same line. The merge pass
+        # already walks the blocks in reading order, so only re-sort when
+        # merging changed some bounding boxes
+        block_count = len(text_blocks)
         text_blocks = self._merge_adjacent_blocks(text_blocks)
         
         # Sort by reading order
-        text_blocks = self._sort_by_reading_order(text_blocks)
+        if len(text_blocks) != block_count:
+            text_blocks = self._sort_by_reading_order(text_blocks)
         
         return text_blocks
 
@@ -212,56 +330,55 @@ class PDFParser:
             return blocks
         
         # Sort by y position then x position
-        sorted_blocks = sorted(blocks, key=lambda b: (round(b.bbox.y0 / 5) * 5, b.bbox.x0))
+        sorted_blocks = self._sort_by_reading_order(blocks)
         
-        merged = []
-        current = None
+        merged: List[TextBlock] = []
+        current: Optional[_MergedLine] = None
         
         for block in sorted_blocks:
             if current is None:
-                current = block
+                current = _MergedLine(block)
                 continue
             
+            bbox = block.bbox
             # Check if blocks are on same line (similar y position)
-            same_line = abs(current.bbox.y0 - block.bbox.y0) < 5
+            same_line = abs(current.y0 - bbox.y0) < 5
             # Check if blocks are close horizontally
-            close = block.bbox.x0 - current.bbox.x1 < 20
+            close = bbox.x0 - current.x1 < 20
             # Check if same font
-            same_font = (current.font_name == block.font_name and 
-                        abs(current.font_size - block.font_size) < 1)
+            same_font = (current.first.font_name == block.font_name and 
+                        abs(current.first.font_size - block.font_size) < 1)
             
             if same_line and close and same_font:
                 # Merge blocks
-                merged_bbox = BoundingBox(
-                    x0=min(current.bbox.x0, block.bbox.x0),
-                    y0=min(current.bbox.y0, block.bbox.y0),
-                    x1=max(current.bbox.x1, block.bbox.x1),
-                    y1=max(current.bbox.y1, block.bbox.y1),
-                )
-                current = TextBlock(
-                    text=current.text + " " + block.text,
-                    bbox=merged_bbox,
-                    font_name=current.font_name,
-                    font_size=current.font_size,
-                    page_number=current.page_number,
-                    font_info=current.font_info,
-                )
+                current.add(block)
             else:
-                merged.append(current)
-                current = block
+                merged.append(current.to_block())
+                current = _MergedLine(block)
         
         if current:
-            merged.append(current)
+            merged.append(current.to_block())
         
         return merged
 
-    def _extract_images(self, page: fitz.Page, page_num: int) -> List[ImageRegion]:
+    def _extract_images(
+        self,
+        page: fitz.Page,
+        page_num: int,
+        image_cache: Optional[Dict[int, Dict[str, Any]]] = None
+    ) -> List[ImageRegion]:
         """
         Extract images with position metadata.
         
+        PyMuPDF re-extracts (and for PNG, re-encodes) an image on every
+        extract_image call, so results are looked up by xref in image_cache
+        first; regions of the same image then share one bytes object.
+        
         Args:
             page: PyMuPDF page object
             page_num: Page number
+            image_cache: Extracted images by xref for this document; holds at
+                most IMAGE_CACHE_MAX_ENTRIES, dropping the oldest first
             
         Returns:
             List of ImageRegion objects
@@ -282,7 +399,13 @@ class PDFParser:
                 img_rect = img_rects[0]  # Use first occurrence
                 
                 # Extract image data
-                base_image = page.parent.extract_image(xref)
+                base_image = image_cache.get(xref) if image_cache is not None else None
+                if base_image is None:
+                    base_image = page.parent.extract_image(xref)
+                    if image_cache is not None and base_image:
+                        if len(image_cache) >= self.IMAGE_CACHE_MAX_ENTRIES:
+                            image_cache.pop(next(iter(image_cache)))
+                        image_cache[xref] = base_image
                 if not base_image:
                     continue
                 
@@ -302,6 +425,8 @@ class PDFParser:
                     bbox=bbox,
                     page_number=page_num,
                     index=img_index,
+                    pixel_width=base_image.get("width", 0),
+                    pixel_height=base_image.get("height", 0),
                 )
                 image_regions.append(image_region)
                 
@@ -352,24 +477,15 @@ class PDFParser:
         # Group blocks by approximate vertical position (within tolerance)
         tolerance = 5.0  # pixels
         
-        def get_sort_key(block: TextBlock) -> Tuple[float, float]:
-            # Round y to group blocks on same line
-            y_rounded = round(block.bbox.y0 / tolerance) * tolerance
-            return (y_rounded, block.bbox.x0)
-        
-        return sorted(text_blocks, key=get_sort_key)
-
-    def _int_to_rgb(self, color_int: int) -> Tuple[int, int, int]:
-        """
-        Convert integer color to RGB tuple.
-        
-        Args:
-            color_int: Color as integer
+        if len(text_blocks) < self.ARGSORT_MIN_BLOCKS:
+            def get_sort_key(block: TextBlock) -> Tuple[float, float]:
+                # Round y to group blocks on same line
+                y_rounded = round(block.bbox.y0 / tolerance) * tolerance
+                return (y_rounded, block.bbox.x0)
             
-        Returns:
-            RGB tuple (r, g, b)
-        """
-        r = (color_int >> 16) & 0xFF
-        g = (color_int >> 8) & 0xFF
-        b = color_int & 0xFF
-        return (r, g, b)
+            return sorted(text_blocks, key=get_sort_key)
+        
+        count = len(text_blocks)
+        ys = np.fromiter((b.bbox.y0 for b in text_blocks), dtype=np.float64, count=count)
+        xs = np.fromiter((b.bbox.x0 for b in text_blocks), dtype=np.float64, count=count)
+        return [text_blocks[i] for i in reading_order(ys, xs, tolerance).tolist()]
@@ -1,8 +1,10 @@
 """Table Detector component for identifying and extracting table structures from PDFs."""
 
 import logging
+from bisect import bisect_left
 from typing import List, Tuple, Optional, Any
 import fitz  # PyMuPDF
+import numpy as np
 
 from models.data_models import (
     BoundingBox,
@@ -10,6 +12,7 @@ from models.data_models import (
     TableStructure,
     FontInfo,
 )
+from services.page_cache import SPAN_FLAG_BOLD, SPAN_FLAG_ITALIC, PageCache, span_rgb
 
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,63 @@ class TableDetectionError(Exception):
     pass
 
 
+class _SpanIndex:
+    """Text spans of a page sorted by top edge, for looking up the font inside a box."""
+
+    def __init__(self, spans: List[Tuple[float, float, float, float, int, FontInfo]]):
+        """
+        Args:
+            spans: (x0, y0, x1, y1, page order, FontInfo) per non-empty span
+        """
+        self._spans = sorted(spans, key=lambda span: span[1])
+        self._tops = [span[1] for span in self._spans]
+        self._max_height = max((span[3] - span[1] for span in self._spans), default=0.0)
+
+    @classmethod
+    def from_page(cls, page: fitz.Page) -> "_SpanIndex":
+        """Extract every text span of a page, reusing the parser's text extraction."""
+        spans = []
+        text_dict = PageCache.of(page).text_dict()
+        for block in text_dict.get("blocks", []):
+            if block.get("type") != 0:
+                continue
+            for line in block.get("lines", []):
+                for span in line.get("spans", []):
+                    if not span.get("text", "").strip():
+                        continue
+                    flags = span.get("flags", 0)
+                    font_info = FontInfo(
+                        name=span.get("font", "unknown"),
+                        size=span.get("size", 12.0),
+                        color=span_rgb(span.get("color", 0)),
+                        is_bold=(flags & SPAN_FLAG_BOLD) != 0,
+                        is_italic=(flags & SPAN_FLAG_ITALIC) != 0,
+                    )
+                    x0, y0, x1, y1 = span.get("bbox", (0, 0, 0, 0))
+                    spans.append((x0, y0, x1, y1, len(spans), font_info))
+        return cls(spans)
+
+    def font_at(self, bbox: BoundingBox) -> Optional[FontInfo]:
+        """
+        Font of the first span, in page order, that overlaps bbox.
+        
+        Args:
+            bbox: Region to look in
+            
+        Returns:
+            FontInfo or None if no span overlaps the region
+        """
+        # Only spans starting within one span height above the box can reach it
+        start = bisect_left(self._tops, bbox.y0 - self._max_height)
+        end = bisect_left(self._tops, bbox.y1)
+        best = None
+        for x0, y0, x1, y1, order, font_info in self._spans[start:end]:
+            if y1 > bbox.y0 and x0 < bbox.x1 and x1 > bbox.x0:
+                if best is None or order < best[0]:
+                    best = (order, font_info)
+        return best[1] if best else None
+
+
 class TableDetector:
     """Identifies and extracts table structures from PDF documents."""
 
@@ -45,8 +105,11 @@ class TableDetector:
             # Use PyMuPDF's built-in table finder
             table_finder = page.find_tables()
             
+            # Cell fonts are looked up in one text extraction shared by all tables
+            page_spans = _SpanIndex.from_page(page) if table_finder.tables else None
+            
             for table_idx, table in enumerate(table_finder.tables):
-                table_structure = self._process_table(table, page, page_num, table_idx)
+                table_structure = self._process_table(table, page, page_num, table_idx, page_spans)
                 if table_structure:
                     tables.append(table_structure)
                     
@@ -61,7 +124,8 @@ class TableDetector:
         table: Any, 
         page: fitz.Page, 
         page_num: int, 
-        table_idx: int
+        table_idx: int,
+        page_spans: Optional["_SpanIndex"] = None
     ) -> Optional[TableStructure]:
         """
         Process a detected table and extract its structure.
@@ -71,6 +135,7 @@ class TableDetector:
             page: PyMuPDF page object
             page_num: Page number
             table_idx: Index of the table on the page
+            page_spans: Span index of the page (built from page if omitted)
             
         Returns:
             TableStructure object or None if invalid
@@ -85,7 +150,7 @@ class TableDetector:
             )
             
             # Extract cells
-            cells = self.extract_cells(table, page)
+            cells = self.extract_cells(table, page, page_spans)
             
             if not cells:
                 return None
@@ -121,13 +186,19 @@ class TableDetector:
         except Exception:
             return None
 
-    def extract_cells(self, table: Any, page: fitz.Page) -> List[TableCell]:
+    def extract_cells(
+        self,
+        table: Any,
+        page: fitz.Page,
+        page_spans: Optional["_SpanIndex"] = None
+    ) -> List[TableCell]:
         """
         Extract cells from a detected table with row/column positions.
         
         Args:
             table: PyMuPDF Table object
             page: PyMuPDF page object
+            page_spans: Span index of the page (built from page if omitted)
             
         Returns:
             List of TableCell objects
@@ -135,6 +206,9 @@ class TableDetector:
         cells: List[TableCell] = []
         
         try:
+            if page_spans is None:
+                page_spans = _SpanIndex.from_page(page)
+            
             # Get table data as list of rows
             table_data = table.extract()
             
@@ -169,7 +243,7 @@ class TableDetector:
                     text = text.strip()
                     
                     # Extract font info from cell region
-                    font_info = self._extract_cell_font_info(page, bbox)
+                    font_info = self._extract_cell_font_info(page_spans, bbox)
                     
                     cell = TableCell(
                         text=text,
@@ -220,47 +294,21 @@ class TableDetector:
         
         return BoundingBox(x0=x0, y0=y0, x1=x1, y1=y1)
 
-    def _extract_cell_font_info(self, page: fitz.Page, bbox: BoundingBox) -> Optional[FontInfo]:
+    def _extract_cell_font_info(self, page_spans: "_SpanIndex", bbox: BoundingBox) -> Optional[FontInfo]:
         """
         Extract font information from text within a cell region.
         
         Args:
-            page: PyMuPDF page object
+            page_spans: Span index of the page
             bbox: Cell bounding box
             
         Returns:
             FontInfo or None if no text found
         """
         try:
-            rect = fitz.Rect(bbox.x0, bbox.y0, bbox.x1, bbox.y1)
-            text_dict = page.get_text("dict", clip=rect)
-            
-            for block in text_dict.get("blocks", []):
-                if block.get("type") != 0:
-                    continue
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        font_name = span.get("font", "unknown")
-                        font_size = span.get("size", 12.0)
-                        color_int = span.get("color", 0)
-                        flags = span.get("flags", 0)
-                        
-                        # Parse color
-                        r = (color_int >> 16) & 0xFF
-                        g = (color_int >> 8) & 0xFF
-                        b = color_int & 0xFF
-                        
-                        return FontInfo(
-                            name=font_name,
-                            size=font_size,
-                            color=(r, g, b),
-                            is_bold=bool(flags & 2 ** 4),
-                            is_italic=bool(flags & 2 ** 1),
-                        )
+            return page_spans.font_at(bbox)
         except Exception:
-            pass
-        
-        return None
+            return None
 
     def identify_merged_cells(self, cells: List[TableCell], table: Any) -> List[TableCell]:
         """
@@ -360,22 +408,18 @@ class TableDetector:
             
             # Try to get internal grid lines from cells
             if hasattr(table, 'cells') and table.cells:
-                seen_lines = set()
-                for cell_rect in table.cells:
-                    if cell_rect:
-                        x0, y0, x1, y1 = cell_rect
-                        # Add cell borders (avoiding duplicates)
-                        lines = [
-                            (x0, y0, x1, y0),  # Top
-                            (x0, y1, x1, y1),  # Bottom
-                            (x0, y0, x0, y1),  # Left
-                            (x1, y0, x1, y1),  # Right
-                        ]
-                        for line in lines:
-                            rounded = tuple(round(v, 1) for v in line)
-                            if rounded not in seen_lines:
-                                seen_lines.add(rounded)
-                                borders.append(line)
+                cell_rects = np.array([rect for rect in table.cells if rect], dtype=np.float64).reshape(-1, 4)
+                x0, y0, x1, y1 = cell_rects.T
+                # Top, bottom, left and right border of every cell, cell by cell
+                lines = np.stack([
+                    np.stack([x0, y0, x1, y0], axis=1),
+                    np.stack([x0, y1, x1, y1], axis=1),
+                    np.stack([x0, y0, x0, y1], axis=1),
+                    np.stack([x1, y0, x1, y1], axis=1),
+                ], axis=1).reshape(-1, 4)
+                # Keep the first line of each group equal to 0.1pt (avoiding duplicates)
+                _, first = np.unique(np.round(lines, 1), axis=0, return_index=True)
+                borders.extend(map(tuple, lines[np.sort(first)].tolist()))
                                 
         except Exception:
             pass
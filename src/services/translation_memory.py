@@ -0,0 +1,138 @@
+"""
+Persistent translation memory backed by SQLite.
+
+This is the second of two layers that keep a text from being translated twice:
+
+1. DocumentTranslator's in-memory cache (_TranslationBuffer) answers texts
+   already translated by the same translator object, across the documents it
+   handles, and sends identical texts of one flush once.
+2. TranslationMemory (--cache PATH) answers what reaches
+   TranslationService.translate_batch from earlier runs and other processes
+   sharing the file.
+
+Only layer 2 outlives the process; batch workers each have their own layer 1.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationMemory:
+    """
+    Maps (model, target, source, text) to a stored translation across runs.
+
+    Entries are keyed by a 16-byte BLAKE2b digest of the request, with
+    whitespace in the text normalized. The database uses WAL journaling so
+    several processes translating documents can share one file.
+    """
+
+    MAX_AGE_SECONDS: float = 90 * 24 * 3600  # Entries older than this are pruned on open
+    LOOKUP_CHUNK_SIZE: int = 500  # Keys per SELECT ... IN (...), below SQLite's variable limit
+
+    def __init__(self, path: str):
+        """
+        Open (creating if needed) the translation memory at path.
+
+        Args:
+            path: SQLite database file
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tm("
+            "h BLOB PRIMARY KEY, tgt TEXT, lang TEXT, model TEXT, ts INTEGER)"
+        )
+        self.prune(time.time() - self.MAX_AGE_SECONDS)
+
+    @staticmethod
+    def key(model: str, target_lang: str, source_lang: str, text: str) -> bytes:
+        """
+        Content-addressed key of a translation request.
+
+        Args:
+            model: Gemini model name
+            target_lang: Target language
+            source_lang: Source language
+            text: Text to translate
+
+        Returns:
+            16-byte digest
+        """
+        normalized = " ".join(text.split())
+        return hashlib.blake2b(
+            f"{model}|{target_lang}|{source_lang}|{normalized}".encode("utf-8"),
+            digest_size=16,
+        ).digest()
+
+    def lookup(self, keys: List[bytes]) -> Dict[bytes, str]:
+        """
+        Fetch stored translations.
+
+        Args:
+            keys: Request keys from key()
+
+        Returns:
+            Translations by key, for the keys that are stored
+        """
+        found: Dict[bytes, str] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock:
+            for i in range(0, len(unique_keys), self.LOOKUP_CHUNK_SIZE):
+                chunk = unique_keys[i:i + self.LOOKUP_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(self._conn.execute(
+                    f"SELECT h, tgt FROM tm WHERE h IN ({placeholders})", chunk
+                ))
+        return found
+
+    def store(self, entries: Iterable[Tuple[bytes, str]], target_lang: str, model: str) -> None:
+        """
+        Store translations, replacing existing entries with the same key.
+
+        Args:
+            entries: (key, translated text) pairs
+            target_lang: Target language
+            model: Gemini model name
+        """
+        now = int(time.time())
+        rows = [(key, text, target_lang, model, now) for key, text in entries]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany("INSERT OR REPLACE INTO tm VALUES(?,?,?,?,?)", rows)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def prune(self, older_than: float) -> int:
+        """
+        Delete entries stored before a point in time.
+
+        Args:
+            older_than: Unix timestamp
+
+        Returns:
+            Number of deleted entries
+        """
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM tm WHERE ts < ?", (int(older_than),)).rowcount
+        if deleted:
+            logger.debug("Pruned %d translation memory entries from %s", deleted, self._path)
+        return deleted
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,18 +1,29 @@
 """Translation Service component for translating text via Gemini API."""
 
+import os
+import json
 import time
+import asyncio
 import logging
-from typing import List, Optional
+import re
+import tempfile
+from typing import Callable, List, Optional
 from dataclasses import dataclass
 
+import google.ai.generativelanguage as glm
 import google.generativeai as genai
 from google.api_core import exceptions as google_exceptions
 
+from services.translation_memory import TranslationMemory
+
 
 logger = logging.getLogger(__name__)
 
+# "[n] text" line of a numbered translation response
+_NUMBERED_RE = re.compile(r'^\[(\d+)\]\s*(.*)')
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranslationRequest:
     """Request for translating a text block."""
     text: str
@@ -21,7 +32,7 @@ class TranslationRequest:
     block_id: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranslationResult:
     """Result of a translation operation."""
     original_text: str
@@ -37,19 +48,50 @@ class TranslationError(Exception):
 
 
 class TranslationService:
-    """Manages translation via Gemini API with batch processing and retry logic."""
+    """
+    Manages translation via Gemini API with batch processing and retry logic.
+    
+    The API connection, event loop and translation memory are set up on first
+    use and kept until close(), so one instance should be reused for all
+    documents of a run, e.g. as a context manager.
+    """
 
     MAX_RETRIES: int = 3
     INITIAL_DELAY: float = 0.5
     MAX_DELAY: float = 10.0
-    BATCH_SIZE: int = 50  # Increased from 10 for faster processing
+    BATCH_SIZE: int = 50  # Maximum requests per API call
+    MAX_TOKENS_PER_CALL: int = 6000  # Estimated input tokens per API call
+    PROMPT_OVERHEAD_TOKENS: int = 175  # JSON prompt instructions (~115) plus the response schema (~50)
+    ITEM_OVERHEAD_TOKENS: int = 3  # Quotes and separator per text in the JSON arrays
+    BATCH_POLL_INTERVAL: float = 30.0  # Seconds between Batch API status checks
+    BATCH_TERMINAL_STATES = (
+        "JOB_STATE_SUCCEEDED",
+        "JOB_STATE_FAILED",
+        "JOB_STATE_CANCELLED",
+        "JOB_STATE_EXPIRED",
+    )
+    # Responses are constrained to {"translations": [...]}
+    RESPONSE_SCHEMA = {
+        "type": "OBJECT",
+        "properties": {
+            "translations": {"type": "ARRAY", "items": {"type": "STRING"}},
+        },
+        "required": ["translations"],
+    }
+    GENERATION_CONFIG = {
+        "response_mime_type": "application/json",
+        "response_schema": RESPONSE_SCHEMA,
+    }
 
     def __init__(
         self, 
         api_key: str, 
         target_lang: str,
         source_lang: Optional[str] = None,
-        model_name: str = "gemini-2.5-pro"
+        model_name: str = "gemini-2.5-pro",
+        use_batch_api: bool = False,
+        max_concurrency: int = 10,
+        cache_path: Optional[str] = None
     ):
         """
         Initialize with Gemini API credentials.
@@ -59,12 +101,22 @@ class TranslationService:
             target_lang: Target language for translation
             source_lang: Source language (auto-detected if None)
             model_name: Gemini model to use
+            use_batch_api: Submit large workloads through the Gemini Batch API
+            max_concurrency: Maximum number of API calls in flight at once
+            cache_path: SQLite file of a TranslationMemory reused across runs;
+                stored translations are answered without an API call
         """
         self._api_key = api_key
         self._target_lang = target_lang
         self._source_lang = source_lang
         self._model_name = model_name
+        self._use_batch_api = use_batch_api
+        self._max_concurrency = max(1, max_concurrency)
+        self._cache_path = cache_path
+        self._memory: Optional[TranslationMemory] = None
+        self._async_client: Optional[glm.GenerativeServiceAsyncClient] = None
         self._model = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._initialized = False
 
     def _initialize(self) -> None:
@@ -73,11 +125,70 @@ class TranslationService:
             return
         
         try:
-            genai.configure(api_key=self._api_key)
+            self._loop = asyncio.new_event_loop()
+            # The async gRPC client is bound to the loop it is created on, so it
+            # is built on this service's loop with this service's key. Without
+            # an explicit client, GenerativeModel takes one from the
+            # process-wide genai.configure() cache, shared by every service.
+            self._async_client = self._loop.run_until_complete(self._create_async_client())
             self._model = genai.GenerativeModel(self._model_name)
-            self._initialized = True
+            self._model._async_client = self._async_client
         except Exception as e:
+            if self._loop is not None:
+                self._loop.close()
+                self._loop = None
+            self._async_client = None
             raise TranslationError(f"Failed to initialize Gemini API: {str(e)}")
+        
+        if self._cache_path:
+            try:
+                self._memory = TranslationMemory(self._cache_path)
+            except Exception as e:
+                raise TranslationError(f"Failed to open translation memory {self._cache_path}: {str(e)}")
+        self._initialized = True
+
+    async def _create_async_client(self) -> glm.GenerativeServiceAsyncClient:
+        """Create the Gemini client of this service on the running loop."""
+        return glm.GenerativeServiceAsyncClient(client_options={"api_key": self._api_key})
+
+    def close(self) -> None:
+        """
+        Release the event loop, the API client bound to it and the translation memory.
+        
+        The service may be used again afterwards; it is then initialized anew.
+        """
+        if not self._initialized:
+            return
+        
+        if self._memory is not None:
+            self._memory.close()
+            self._memory = None
+        if self._async_client is not None:
+            self._loop.run_until_complete(self._async_client.transport.close())
+            self._async_client = None
+        if self._loop is not None:
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
+            self._loop = None
+        self._model = None
+        self._initialized = False
+
+    def __enter__(self) -> "TranslationService":
+        self._initialize()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def source_language(self) -> Optional[str]:
+        """Source language currently used for requests without one."""
+        return self._source_lang
+
+    @property
+    def target_language(self) -> str:
+        """Target language for translation."""
+        return self._target_lang
 
     def set_source_language(self, source_lang: str) -> None:
         """
@@ -88,32 +199,255 @@ class TranslationService:
         """
         self._source_lang = source_lang
 
-    def translate_batch(self, requests: List[TranslationRequest]) -> List[TranslationResult]:
+    def translate_batch(
+        self,
+        requests: List[TranslationRequest],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[TranslationResult]:
         """
         Translate multiple text blocks in batched API calls.
         
+        Batches are dispatched concurrently (up to max_concurrency in flight)
+        on the service's event loop; see translate_batch_async. Every request
+        is sent as given: identical texts are merged by the caller, e.g.
+        DocumentTranslator's _TranslationBuffer. Requests whose source
+        language is the target language, or whose text is blank, are returned
+        unchanged without an API call.
+        
         Args:
             requests: List of TranslationRequest objects
+            progress_callback: Called with (completed, total) requests as batches finish
             
         Returns:
-            List of TranslationResult objects
+            List of TranslationResult objects in request order
         """
         self._initialize()
         
         if not requests:
             return []
         
-        results: List[TranslationResult] = []
+        results: List[Optional[TranslationResult]] = [None] * len(requests)
+        send_indices: List[int] = []
+        target_lang = self._target_lang.lower()
+        for i, req in enumerate(requests):
+            if self._resolve_source(req).lower() == target_lang or not req.text.strip():
+                # Translation would be the identity
+                results[i] = TranslationResult(
+                    original_text=req.text,
+                    translated_text=req.text,
+                    block_id=req.block_id,
+                    success=True,
+                )
+            else:
+                send_indices.append(i)
+        
+        if len(send_indices) == len(requests):
+            return self._translate_with_memory(requests, progress_callback)
+        if not send_indices:
+            return results
+        
+        sent_results = self._translate_with_memory(
+            [requests[i] for i in send_indices], progress_callback
+        )
+        for i, result in zip(send_indices, sent_results):
+            results[i] = result
+        return results
+
+    def _resolve_source(self, request: TranslationRequest) -> str:
+        """Source language sent for a request: its own, the service's, or auto-detect."""
+        return request.source_lang or self._source_lang or "auto-detect"
+
+    def _translate_with_memory(
+        self,
+        requests: List[TranslationRequest],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[TranslationResult]:
+        """
+        Answer requests from the translation memory, sending only the rest.
+        
+        Successful translations of sent requests are stored in the memory.
+        Without a memory every request is sent.
+        
+        Args:
+            requests: List of TranslationRequest objects
+            progress_callback: Called with (completed, total) requests as batches finish
+            
+        Returns:
+            List of TranslationResult objects in request order
+        """
+        if self._memory is None:
+            return self._translate_uncached(requests, progress_callback)
+        
+        keys = [
+            TranslationMemory.key(
+                self._model_name,
+                self._target_lang,
+                self._resolve_source(req),
+                req.text,
+            )
+            for req in requests
+        ]
+        try:
+            stored = self._memory.lookup(keys)
+        except Exception as e:
+            logger.warning("Translation memory lookup failed: %s", e)
+            stored = {}
+        
+        results: List[Optional[TranslationResult]] = [None] * len(requests)
+        miss_indices: List[int] = []
+        for i, (req, key) in enumerate(zip(requests, keys)):
+            translated = stored.get(key)
+            if translated is None:
+                miss_indices.append(i)
+            else:
+                results[i] = TranslationResult(
+                    original_text=req.text,
+                    translated_text=translated,
+                    block_id=req.block_id,
+                    success=True,
+                )
+        
+        hit_count = len(requests) - len(miss_indices)
+        if hit_count:
+            logger.debug("Translation memory answered %d of %d request(s)", hit_count, len(requests))
+            if progress_callback:
+                progress_callback(hit_count, len(requests))
+        
+        if miss_indices:
+            def report(completed: int, total: int) -> None:
+                if progress_callback:
+                    progress_callback(hit_count + completed, hit_count + total)
+            
+            miss_results = self._translate_uncached([requests[i] for i in miss_indices], report)
+            new_entries = []
+            for i, result in zip(miss_indices, miss_results):
+                results[i] = result
+                if result.success and result.translated_text:
+                    new_entries.append((keys[i], result.translated_text))
+            try:
+                self._memory.store(new_entries, self._target_lang, self._model_name)
+            except Exception as e:
+                logger.warning("Translation memory update failed: %s", e)
+        
+        return results
+
+    def _translate_uncached(
+        self,
+        requests: List[TranslationRequest],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[TranslationResult]:
+        """
+        Send requests to Gemini, through the Batch API or concurrent calls.
+        
+        Args:
+            requests: List of TranslationRequest objects
+            progress_callback: Called with (completed, total) requests as batches finish
+            
+        Returns:
+            List of TranslationResult objects in request order
+        """
+        # Batch API only pays off when the work spans several synchronous calls
+        if self._use_batch_api and len(requests) > self.BATCH_SIZE:
+            try:
+                return self._translate_with_batch_api(requests)
+            except TranslationError as e:
+                logger.warning("Batch API translation failed, falling back to synchronous calls: %s", e)
+        
+        return self._loop.run_until_complete(
+            self.translate_batch_async(requests, progress_callback)
+        )
+
+    async def translate_batch_async(
+        self,
+        requests: List[TranslationRequest],
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[TranslationResult]:
+        """
+        Translate multiple text blocks, keeping up to max_concurrency batches in flight.
+        
+        Args:
+            requests: List of TranslationRequest objects
+            progress_callback: Called with (completed, total) requests as batches finish
+            
+        Returns:
+            List of TranslationResult objects in request order
+        """
+        self._initialize()
+        
+        if not requests:
+            return []
+        
+        batches = self._make_batches(requests)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
         
-        # Process in batches
-        for i in range(0, len(requests), self.BATCH_SIZE):
-            batch = requests[i:i + self.BATCH_SIZE]
-            batch_results = self._translate_batch_internal(batch)
-            results.extend(batch_results)
+        async def run_batch(start: int, batch: List[TranslationRequest]):
+            async with semaphore:
+                return start, await self._translate_batch_internal_async(batch)
+        
+        tasks = []
+        start = 0
+        for batch in batches:
+            tasks.append(run_batch(start, batch))
+            start += len(batch)
+        
+        # Batches finish out of order; each fills its own slice of the output
+        results: List[Optional[TranslationResult]] = [None] * len(requests)
+        completed = 0
+        
+        for future in asyncio.as_completed(tasks):
+            start, batch_results = await future
+            results[start:start + len(batch_results)] = batch_results
+            completed += len(batch_results)
+            if progress_callback:
+                progress_callback(completed, len(requests))
         
         return results
 
-    def _translate_batch_internal(self, requests: List[TranslationRequest]) -> List[TranslationResult]:
+    def _make_batches(self, requests: List[TranslationRequest]) -> List[List[TranslationRequest]]:
+        """
+        Split requests into consecutive API-call batches by estimated prompt size.
+        
+        One prompt names one source language, so a batch is closed when the
+        next request's source language differs from the batch's. It is also
+        closed when adding the next text would exceed MAX_TOKENS_PER_CALL or
+        BATCH_SIZE texts. Tokens are estimated as
+        UTF-8 bytes / 4, which matches Latin text and stays conservative for
+        CJK and Indic scripts. A text larger than the budget gets its own batch.
+        
+        Args:
+            requests: List of TranslationRequest objects
+            
+        Returns:
+            Batches in request order
+        """
+        batches: List[List[TranslationRequest]] = []
+        batch: List[TranslationRequest] = []
+        batch_tokens = self.PROMPT_OVERHEAD_TOKENS
+        batch_source: Optional[str] = None
+        
+        for req in requests:
+            tokens = len(req.text.encode("utf-8")) // 4 + self.ITEM_OVERHEAD_TOKENS
+            source_lang = self._resolve_source(req)
+            if batch and (
+                source_lang != batch_source or
+                len(batch) >= self.BATCH_SIZE or
+                batch_tokens + tokens > self.MAX_TOKENS_PER_CALL
+            ):
+                batches.append(batch)
+                batch = []
+                batch_tokens = self.PROMPT_OVERHEAD_TOKENS
+            batch.append(req)
+            batch_tokens += tokens
+            batch_source = source_lang
+        
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def _translate_batch_internal_async(
+        self, 
+        requests: List[TranslationRequest]
+    ) -> List[TranslationResult]:
         """
         Translate a batch of requests in a single API call.
         
@@ -126,25 +460,176 @@ class TranslationService:
         if not requests:
             return []
         
-        # Build prompt for batch translation
         texts = [req.text for req in requests]
-        source_lang = requests[0].source_lang or self._source_lang or "auto-detect"
+        # _make_batches keeps one source language per batch
+        source_lang = self._resolve_source(requests[0])
+        
+        try:
+            translated_texts = await self._call_gemini_api_async(texts, self._target_lang, source_lang)
+            return self._match_results(requests, translated_texts)
+            
+        except Exception as e:
+            # Return original text with error flag for all requests
+            logger.error("Batch translation failed: %s", e)
+            return self._failed_results(requests, str(e))
+
+    def _match_results(
+        self, 
+        requests: List[TranslationRequest], 
+        translated_texts: List[str]
+    ) -> List[TranslationResult]:
+        """
+        Match parsed translations back to their requests.
+        
+        Args:
+            requests: Batch of TranslationRequest objects
+            translated_texts: Translations in request order
+            
+        Returns:
+            List of TranslationResult objects
+        """
+        results = []
+        for i, req in enumerate(requests):
+            if i < len(translated_texts):
+                results.append(TranslationResult(
+                    original_text=req.text,
+                    translated_text=translated_texts[i],
+                    block_id=req.block_id,
+                    success=True,
+                ))
+            else:
+                # Fallback if translation missing
+                results.append(TranslationResult(
+                    original_text=req.text,
+                    translated_text=req.text,
+                    block_id=req.block_id,
+                    success=False,
+                    error_message="Translation not returned",
+                ))
+        return results
+
+    def _failed_results(
+        self, 
+        requests: List[TranslationRequest], 
+        error_message: str
+    ) -> List[TranslationResult]:
+        """
+        Return original text with error flag for all requests.
+        
+        Args:
+            requests: Batch of TranslationRequest objects
+            error_message: Error to attach to every result
+            
+        Returns:
+            List of TranslationResult objects
+        """
+        return [
+            TranslationResult(
+                original_text=req.text,
+                translated_text=req.text,
+                block_id=req.block_id,
+                success=False,
+                error_message=error_message,
+            )
+            for req in requests
+        ]
+
+    def _translate_with_batch_api(self, requests: List[TranslationRequest]) -> List[TranslationResult]:
+        """
+        Translate requests through the Gemini Batch API.
+        
+        Each chunk from _make_batches becomes one line of the JSONL input file, keyed by
+        its chunk index, using the same JSON prompt and response schema as the
+        synchronous path.
+        Blocks until the batch job reaches a terminal state.
+        
+        Args:
+            requests: List of TranslationRequest objects
+            
+        Returns:
+            List of TranslationResult objects
+            
+        Raises:
+            TranslationError: If the batch job cannot be submitted or does not succeed
+        """
+        try:
+            from google import genai as genai_batch
+        except ImportError:
+            raise TranslationError("google-genai is not installed. Install with: pip install google-genai")
+        
+        chunks = self._make_batches(requests)
+        
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".jsonl", delete=False, encoding="utf-8"
+        ) as f:
+            for chunk_idx, chunk in enumerate(chunks):
+                source_lang = self._resolve_source(chunk[0])
+                prompt = self._build_translation_prompt(
+                    [req.text for req in chunk], self._target_lang, source_lang
+                )
+                line = {
+                    "key": str(chunk_idx),
+                    "request": {
+                        "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                        "generationConfig": {
+                            "responseMimeType": "application/json",
+                            "responseSchema": self.RESPONSE_SCHEMA,
+                        },
+                    },
+                }
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+            jsonl_path = f.name
         
         try:
-            translated_texts = self._call_gemini_api(texts, self._target_lang, source_lang)
+            client = genai_batch.Client(api_key=self._api_key)
+            uploaded = client.files.upload(file=jsonl_path, config={"mime_type": "jsonl"})
+            job = client.batches.create(model=self._model_name, src=uploaded.name)
+            logger.info("Submitted Gemini batch job %s (%d prompts)", job.name, len(chunks))
             
-            # Match results to requests
-            results = []
-            for i, req in enumerate(requests):
-                if i < len(translated_texts):
+            while job.state.name not in self.BATCH_TERMINAL_STATES:
+                time.sleep(self.BATCH_POLL_INTERVAL)
+                job = client.batches.get(name=job.name)
+            
+            if job.state.name != "JOB_STATE_SUCCEEDED":
+                raise TranslationError(f"Batch job {job.name} ended in state {job.state.name}")
+            
+            output = client.files.download(file=job.dest.file_name).decode("utf-8")
+        except TranslationError:
+            raise
+        except Exception as e:
+            raise TranslationError(f"Batch API request failed: {str(e)}")
+        finally:
+            os.remove(jsonl_path)
+        
+        # Map response lines back to their chunks
+        responses: dict = {}
+        for raw_line in output.splitlines():
+            if not raw_line.strip():
+                continue
+            entry = json.loads(raw_line)
+            try:
+                parts = entry["response"]["candidates"][0]["content"]["parts"]
+                responses[entry["key"]] = "".join(part.get("text", "") for part in parts)
+            except (KeyError, IndexError, TypeError):
+                logger.warning("Batch API returned no translation for chunk %s", entry.get('key'))
+        
+        results: List[TranslationResult] = []
+        for chunk_idx, chunk in enumerate(chunks):
+            response_text = responses.get(str(chunk_idx))
+            translated_texts = (
+                self._parse_translation_response(response_text, len(chunk))
+                if response_text else []
+            )
+            for i, req in enumerate(chunk):
+                translated = translated_texts[i] if i < len(translated_texts) else ""
+                if translated:
                     results.append(TranslationResult(
                         original_text=req.text,
-                        translated_text=translated_texts[i],
+                        translated_text=translated,
                         block_id=req.block_id,
                         success=True,
                     ))
                 else:
-                    # Fallback if translation missing
                     results.append(TranslationResult(
                         original_text=req.text,
                         translated_text=req.text,
@@ -152,31 +637,17 @@ class TranslationService:
                         success=False,
                         error_message="Translation not returned",
                     ))
-            
-            return results
-            
-        except Exception as e:
-            # Return original text with error flag for all requests
-            logger.error(f"Batch translation failed: {str(e)}")
-            return [
-                TranslationResult(
-                    original_text=req.text,
-                    translated_text=req.text,
-                    block_id=req.block_id,
-                    success=False,
-                    error_message=str(e),
-                )
-                for req in requests
-            ]
+        
+        return results
 
-    def _call_gemini_api(
+    async def _call_gemini_api_async(
         self, 
         texts: List[str], 
         target_lang: str,
         source_lang: str = "auto-detect"
     ) -> List[str]:
         """
-        Call Gemini API with retry logic.
+        Call Gemini API with retry logic, backing off without blocking the event loop.
         
         Args:
             texts: List of texts to translate
@@ -193,25 +664,21 @@ class TranslationService:
         
         for attempt in range(self.MAX_RETRIES):
             try:
-                response = self._model.generate_content(prompt)
+                response = await self._model.generate_content_async(
+                    prompt, generation_config=self.GENERATION_CONFIG
+                )
                 
                 if not response.text:
                     raise TranslationError("Empty response from Gemini API")
                 
-                # Parse response
-                translated_texts = self._parse_translation_response(response.text, len(texts))
-                return translated_texts
+                return self._parse_translation_response(response.text, len(texts))
                 
             except (google_exceptions.ResourceExhausted, 
                     google_exceptions.ServiceUnavailable,
                     google_exceptions.DeadlineExceeded) as e:
                 # Retryable errors
                 last_error = e
-                logger.warning(f"Gemini API error (attempt {attempt + 1}): {str(e)}")
-                
-                if attempt < self.MAX_RETRIES - 1:
-                    time.sleep(delay)
-                    delay = min(delay * 2, self.MAX_DELAY)
+                logger.warning("Gemini API error (attempt %d): %s", attempt + 1, e)
                     
             except google_exceptions.InvalidArgument as e:
                 # Non-retryable error
@@ -219,11 +686,12 @@ class TranslationService:
                 
             except Exception as e:
                 last_error = e
-                logger.warning(f"Translation error (attempt {attempt + 1}): {str(e)}")
-                
-                if attempt < self.MAX_RETRIES - 1:
-                    time.sleep(delay)
-                    delay = min(delay * 2, self.MAX_DELAY)
+                logger.warning("Translation error (attempt %d): %s", attempt + 1, e)
+            
+            # Back off without blocking the other batches in flight on the loop
+            if attempt < self.MAX_RETRIES - 1:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_DELAY)
         
         # All retries failed
         raise TranslationError(f"Translation failed after {self.MAX_RETRIES} attempts: {str(last_error)}")
@@ -245,36 +713,55 @@ class TranslationService:
         Returns:
             Formatted prompt string
         """
-        # Number each text for parsing
-        numbered_texts = "\n".join(
-            f"[{i+1}] {text}" 
-            for i, text in enumerate(texts)
-        )
-        
         source_instruction = f"from {source_lang}" if source_lang != "auto-detect" else ""
         
-        prompt = f"""Translate the following texts {source_instruction} to {target_lang}.
+        prompt = f"""Translate each string of the following JSON array {source_instruction} to {target_lang}.
 
 IMPORTANT RULES:
 1. Preserve any formatting markers, special characters, numbers, and punctuation
-2. Keep the same numbering format [1], [2], etc. in your response
-3. Translate ONLY the text content, not the numbers in brackets
-4. If a text is already in the target language, return it unchanged
-5. Maintain the original meaning and tone
+2. Return exactly {len(texts)} translations, in the same order as the input
+3. If a text is already in the target language, return it unchanged
+4. Maintain the original meaning and tone
 
 Texts to translate:
-{numbered_texts}
+{json.dumps(texts, ensure_ascii=False)}
 
-Respond with ONLY the translations in the same numbered format:
-[1] <translation>
-[2] <translation>
-..."""
+Respond with a JSON object {{"translations": [...]}} holding one translated string per text."""
 
         return prompt
 
     def _parse_translation_response(self, response: str, expected_count: int) -> List[str]:
         """
-        Parse the translation response from Gemini.
+        Parse the JSON translation response from Gemini.
+        
+        Missing translations are returned as empty strings and extra ones are
+        dropped. A response that is not the requested JSON object is parsed as
+        numbered lines instead.
+        
+        Args:
+            response: Raw response text
+            expected_count: Expected number of translations
+            
+        Returns:
+            List of translated texts
+        """
+        try:
+            parsed = json.loads(response)["translations"]
+        except (ValueError, KeyError, TypeError):
+            parsed = None
+        if not isinstance(parsed, list):
+            return self._parse_numbered_response(response, expected_count)
+        
+        translations = [
+            text.strip() if isinstance(text, str) else ""
+            for text in parsed[:expected_count]
+        ]
+        translations.extend([""] * (expected_count - len(translations)))
+        return translations
+
+    def _parse_numbered_response(self, response: str, expected_count: int) -> List[str]:
+        """
+        Parse a "[n] translation" per line response.
         
         Args:
             response: Raw response text
@@ -287,7 +774,7 @@ Respond with ONLY the translations in the same numbered format:
         lines = response.strip().split("\n")
         
         current_index = -1
-        current_translation = ""
+        current_parts: List[str] = []
         
         for line in lines:
             line = line.strip()
@@ -295,24 +782,23 @@ Respond with ONLY the translations in the same numbered format:
                 continue
             
             # Check if line starts with [number]
-            import re
-            match = re.match(r'^\[(\d+)\]\s*(.*)', line)
+            match = _NUMBERED_RE.match(line)
             if match:
                 # Save previous translation if exists
                 if current_index >= 0 and current_index < expected_count:
-                    translations[current_index] = current_translation.strip()
+                    translations[current_index] = " ".join(current_parts).strip()
                 
                 # Extract new translation
                 current_index = int(match.group(1)) - 1  # Convert to 0-indexed
-                current_translation = match.group(2)
+                current_parts = [match.group(2)]
             else:
                 # Continuation of previous translation
                 if current_index >= 0:
-                    current_translation += " " + line
+                    current_parts.append(line)
         
         # Add last translation
         if current_index >= 0 and current_index < expected_count:
-            translations[current_index] = current_translation.strip()
+            translations[current_index] = " ".join(current_parts).strip()
         
         return translations
 
@@ -2,7 +2,7 @@
 
 import logging
 import time
-from typing import Optional, Callable, Any, List, Type
+from typing import Optional, Callable, Any, Dict, List, Type
 from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
@@ -26,7 +26,7 @@ class ErrorType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessingError:
     """Represents an error that occurred during processing."""
     error_type: ErrorType
@@ -68,7 +68,31 @@ class ErrorHandler:
     def __init__(self):
         """Initialize the error handler."""
         self._errors: List[ProcessingError] = []
+        # Running counts, so summary and fatal checks do not rescan _errors
+        self._summary: Dict[str, Dict[str, int]] = {}
+        self._fatal_count = 0
         self._retry_config = RETRY_CONFIG.copy()
+        # Exception type -> whether its name contains a retryable error name
+        self._retryable_types: Dict[type, bool] = {}
+
+    def _record(self, processing_error: ProcessingError) -> None:
+        """
+        Store an error and update the running counts.
+        
+        Args:
+            processing_error: Error to record
+        """
+        self._errors.append(processing_error)
+        counts = self._summary.get(processing_error.error_type.value)
+        if counts is None:
+            counts = {"count": 0, "recoverable": 0, "fatal": 0}
+            self._summary[processing_error.error_type.value] = counts
+        counts["count"] += 1
+        if processing_error.recoverable:
+            counts["recoverable"] += 1
+        else:
+            counts["fatal"] += 1
+            self._fatal_count += 1
 
     def handle_pdf_error(
         self, 
@@ -97,8 +121,8 @@ class ErrorHandler:
             original_exception=error,
         )
         
-        self._errors.append(processing_error)
-        logger.error(str(processing_error))
+        self._record(processing_error)
+        logger.error("%s", processing_error)
         
         return processing_error
 
@@ -130,8 +154,8 @@ class ErrorHandler:
             original_exception=error,
         )
         
-        self._errors.append(processing_error)
-        logger.warning(str(processing_error))
+        self._record(processing_error)
+        logger.warning("%s", processing_error)
         
         return processing_error
 
@@ -155,10 +179,7 @@ class ErrorHandler:
         error_msg = f"Translation error for block {block_id}: {str(error)}"
         
         # Check if error is retryable
-        is_retryable = any(
-            err_type in type(error).__name__ 
-            for err_type in self._retry_config["retryable_errors"]
-        )
+        is_retryable = self._is_retryable(error)
         
         processing_error = ProcessingError(
             error_type=ErrorType.TRANSLATION,
@@ -169,11 +190,34 @@ class ErrorHandler:
             original_exception=error,
         )
         
-        self._errors.append(processing_error)
-        logger.warning(str(processing_error))
+        self._record(processing_error)
+        logger.warning("%s", processing_error)
         
         return processing_error
 
+    def _is_retryable(self, error: Exception) -> bool:
+        """
+        Check whether an error's type name contains a retryable error name.
+        
+        Substring matching also covers subclasses such as ReadTimeoutError;
+        the answer is cached per exception type.
+        
+        Args:
+            error: The exception that occurred
+            
+        Returns:
+            True if the error is retryable
+        """
+        error_class = type(error)
+        is_retryable = self._retryable_types.get(error_class)
+        if is_retryable is None:
+            name = error_class.__name__
+            is_retryable = any(
+                err_type in name for err_type in self._retry_config["retryable_errors"]
+            )
+            self._retryable_types[error_class] = is_retryable
+        return is_retryable
+
     def handle_table_detection_error(
         self,
         error: Exception,
@@ -199,8 +243,8 @@ class ErrorHandler:
             original_exception=error,
         )
         
-        self._errors.append(processing_error)
-        logger.warning(str(processing_error))
+        self._record(processing_error)
+        logger.warning("%s", processing_error)
         
         return processing_error
 
@@ -226,8 +270,8 @@ class ErrorHandler:
             original_exception=error,
         )
         
-        self._errors.append(processing_error)
-        logger.warning(str(processing_error))
+        self._record(processing_error)
+        logger.warning("%s", processing_error)
         
         return processing_error
 
@@ -258,12 +302,12 @@ class ErrorHandler:
             original_exception=error,
         )
         
-        self._errors.append(processing_error)
+        self._record(processing_error)
         
         if recoverable:
-            logger.warning(str(processing_error))
+            logger.warning("%s", processing_error)
         else:
-            logger.error(str(processing_error))
+            logger.error("%s", processing_error)
         
         return processing_error
 
@@ -278,25 +322,17 @@ class ErrorHandler:
         Returns:
             Dict with error counts by type
         """
-        summary = {}
-        for error in self._errors:
-            error_type = error.error_type.value
-            if error_type not in summary:
-                summary[error_type] = {"count": 0, "recoverable": 0, "fatal": 0}
-            summary[error_type]["count"] += 1
-            if error.recoverable:
-                summary[error_type]["recoverable"] += 1
-            else:
-                summary[error_type]["fatal"] += 1
-        return summary
+        return {error_type: dict(counts) for error_type, counts in self._summary.items()}
 
     def clear_errors(self) -> None:
         """Clear all recorded errors."""
         self._errors.clear()
+        self._summary.clear()
+        self._fatal_count = 0
 
     def has_fatal_errors(self) -> bool:
         """Check if any non-recoverable errors occurred."""
-        return any(not e.recoverable for e in self._errors)
+        return self._fatal_count > 0
 
 
 def retry_with_backoff(
@@ -333,14 +369,14 @@ def retry_with_backoff(
                     
                     if attempt < max_retries:
                         logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries + 1} failed: {str(e)}. "
-                            f"Retrying in {delay:.1f}s..."
+                            "Attempt %d/%d failed: %s. Retrying in %.1fs...",
+                            attempt + 1, max_retries + 1, e, delay
                         )
                         time.sleep(delay)
                         delay = min(delay * exponential_base, max_delay)
                     else:
                         logger.error(
-                            f"All {max_retries + 1} attempts failed for {func.__name__}"
+                            "All %d attempts failed for %s", max_retries + 1, func.__name__
                         )
             
             raise last_exception
@@ -380,6 +416,6 @@ def safe_execute(
             recoverable=True,
             original_exception=e,
         )
-        error_handler._errors.append(processing_error)
-        logger.warning(str(processing_error))
+        error_handler._record(processing_error)
+        logger.warning("%s", processing_error)
         return default_value
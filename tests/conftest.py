@@ -11,13 +11,15 @@ from models.data_models import BoundingBox, TextBlock, FontInfo, PageContent, Im
 from models.config import TranslationConfig
 
 
-@pytest.fixture
+# Frozen value objects are built once per session; mutable models are rebuilt per test
+
+@pytest.fixture(scope="session")
 def sample_bbox():
     """Create a sample bounding box."""
     return BoundingBox(x0=10.0, y0=20.0, x1=100.0, y1=50.0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_font_info():
     """Create sample font information."""
     return FontInfo(name="Arial", size=12.0, color=(0, 0, 0), is_bold=False, is_italic=False)
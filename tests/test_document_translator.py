@@ -0,0 +1,97 @@
+"""Tests for DocumentTranslator page classification and OCR dispatch."""
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from models.data_models import BoundingBox, ContentType, ImageRegion, PageContent, TextBlock
+from services.document_translator import DocumentTranslator
+
+
+class RecordingOCREngine:
+    """OCR engine double that records the images it is given."""
+
+    def __init__(self):
+        self.images = []
+
+    def extract_text_batch(self, images):
+        self.images.extend(images)
+        return [[] for _ in images]
+
+
+def make_block(x0, y0, x1, y1, text="Native text"):
+    return TextBlock(
+        text=text,
+        bbox=BoundingBox(x0=x0, y0=y0, x1=x1, y1=y1),
+        font_name="helv",
+        font_size=12.0,
+        page_number=0,
+    )
+
+
+def make_image(index, x0, y0, x1, y1):
+    return ImageRegion(
+        image_data=f"image-{index}".encode(),
+        bbox=BoundingBox(x0=x0, y0=y0, x1=x1, y1=y1),
+        page_number=0,
+        index=index,
+    )
+
+
+@pytest.fixture
+def mixed_page():
+    """A page with a long paragraph, a scanned image under a text layer and a figure."""
+    return PageContent(
+        page_number=0,
+        width=612.0,
+        height=792.0,
+        text_blocks=[
+            make_block(50, 50, 560, 300, text="Paragraph " * 200),
+            make_block(50, 420, 560, 560, text="OCR layer of the scan"),
+        ],
+        image_regions=[
+            make_image(0, 50, 400, 560, 580),  # Scan, mostly under the second block
+            make_image(1, 50, 600, 300, 750),  # Figure with text only in its pixels
+        ],
+    )
+
+
+class TestClassifyPages:
+    """Tests for per-image native text coverage."""
+
+    def test_mixed_page_keeps_uncovered_image(self, sample_config, mixed_page):
+        translator = DocumentTranslator(sample_config)
+        translator._classify_pages([mixed_page])
+
+        covered = [region.covered_by_text for region in mixed_page.image_regions]
+        assert covered == [True, False]
+        assert mixed_page.content_type == ContentType.IMAGE_TEXT
+
+    def test_page_with_all_images_covered_is_native(self, sample_config, mixed_page):
+        mixed_page.image_regions.pop()
+        translator = DocumentTranslator(sample_config)
+        translator._classify_pages([mixed_page])
+
+        assert mixed_page.content_type == ContentType.NATIVE_TEXT
+
+    def test_skip_disabled_covers_nothing(self, sample_config, mixed_page):
+        sample_config.skip_ocr_if_native = False
+        translator = DocumentTranslator(sample_config)
+        translator._classify_pages([mixed_page])
+
+        assert not any(region.covered_by_text for region in mixed_page.image_regions)
+
+
+class TestProcessImages:
+    """Tests for OCR dispatch of classified pages."""
+
+    def test_only_uncovered_images_are_ocred(self, sample_config, mixed_page):
+        translator = DocumentTranslator(sample_config)
+        engine = RecordingOCREngine()
+        translator._ocr_engine = engine
+
+        translator._classify_pages([mixed_page])
+        translator._process_images([mixed_page])
+
+        assert engine.images == [b"image-1"]
+        assert all(region.image_data == b"" for region in mixed_page.image_regions)
@@ -0,0 +1,89 @@
+"""Tests for FontAdjuster fitting and truncation."""
+
+import fitz
+import pytest
+
+from models.data_models import BoundingBox
+from services.font_adjuster import FontAdjuster
+
+
+FONT_SIZE = 10.0
+WIDTH = 120.0
+
+
+@pytest.fixture
+def adjuster():
+    return FontAdjuster(min_font_size=FONT_SIZE)
+
+
+def line_width(line):
+    return fitz.Font("helv").text_length(line, fontsize=FONT_SIZE)
+
+
+def truncate(adjuster, text, lines=3):
+    height = lines * FONT_SIZE * FontAdjuster.LINE_SPACING
+    return adjuster._truncate_text(text, "helv", FONT_SIZE, WIDTH, height)
+
+
+LONG_TEXT = " ".join(f"word{i}" for i in range(200))
+
+
+class TestTruncateText:
+    """Tests for _truncate_text."""
+
+    def test_overflow_is_cut_to_the_box(self, adjuster):
+        truncated, line_breaks = truncate(adjuster, LONG_TEXT)
+        lines = truncated.split("\n")
+
+        assert len(lines) == 3
+        assert all(line_width(line) <= WIDTH for line in lines)
+        assert line_breaks == [i for i, char in enumerate(truncated) if char == "\n"]
+
+    def test_ellipsis_ends_only_the_last_line(self, adjuster):
+        truncated, _ = truncate(adjuster, LONG_TEXT)
+        lines = truncated.split("\n")
+
+        assert lines[-1].endswith(FontAdjuster.ELLIPSIS)
+        assert not any(line.endswith(FontAdjuster.ELLIPSIS) for line in lines[:-1])
+
+    def test_lines_break_at_word_boundaries(self, adjuster):
+        truncated, _ = truncate(adjuster, LONG_TEXT)
+        lines = truncated.split("\n")
+        words = LONG_TEXT.split()
+
+        # Every line but the last holds whole words, in order
+        placed = " ".join(lines[:-1]).split()
+        assert placed == words[:len(placed)]
+        # The last line continues with whole words, except the one cut before the ellipsis
+        tail = lines[-1][:-len(FontAdjuster.ELLIPSIS)].split()
+        assert tail[:-1] == words[len(placed):len(placed) + len(tail) - 1]
+        assert words[len(placed) + len(tail) - 1].startswith(tail[-1])
+
+    def test_single_oversized_word_is_split_by_characters(self, adjuster):
+        word = "x" * 200
+        truncated, _ = truncate(adjuster, word)
+        lines = truncated.split("\n")
+
+        assert len(lines) == 3
+        assert all(line and line_width(line) <= WIDTH for line in lines)
+        assert lines[-1].endswith(FontAdjuster.ELLIPSIS)
+        assert word.startswith("".join(lines)[:-len(FontAdjuster.ELLIPSIS)])
+
+    def test_text_that_fits_has_no_ellipsis(self, adjuster):
+        truncated, line_breaks = truncate(adjuster, "short text")
+        assert truncated == "short text"
+        assert line_breaks == []
+
+
+class TestCalculateFit:
+    """Tests for calculate_fit on overflowing text."""
+
+    def test_overflow_is_truncated_at_minimum_size(self, adjuster):
+        bbox = BoundingBox(x0=0, y0=0, x1=WIDTH + 2 * FontAdjuster.PADDING, y1=40)
+        adjustment = adjuster.calculate_fit(LONG_TEXT, bbox, "helv", 14.0)
+
+        assert adjustment.is_truncated
+        assert adjustment.adjusted_font_size == FONT_SIZE
+        assert adjustment.truncated_text.endswith(FontAdjuster.ELLIPSIS)
+        for position in adjustment.line_breaks:
+            assert adjustment.truncated_text[position] == "\n"
@@ -0,0 +1,22 @@
+"""Tests for source language detection."""
+
+from services.language_detector import LanguageDetector
+
+
+BULGARIAN = "Това е пример за текст на български език, който трябва да бъде разпознат правилно."
+RUSSIAN = "Это пример текста на русском языке, который должен быть правильно распознан системой."
+
+
+class TestDetectFromText:
+    """Tests for languages outside the offered target list."""
+
+    def test_unoffered_language_is_not_mapped_to_a_neighbour(self):
+        detector = LanguageDetector()
+
+        result = detector.detect_from_text(BULGARIAN)
+
+        assert result.primary_language == "bg"
+        assert detector.get_language_name(result.primary_language) == "Bulgarian"
+
+    def test_offered_language_is_still_detected(self):
+        assert LanguageDetector().detect_from_text(RUSSIAN).primary_language == "ru"
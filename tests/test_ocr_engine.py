@@ -0,0 +1,60 @@
+"""Tests for OCREngine construction."""
+
+import sys
+import types
+
+import pytest
+
+from services.ocr_engine import OCREngine
+
+
+class RecordingPaddleOCR:
+    """PaddleOCR double recording the options it is built with."""
+
+    instances = []
+
+    def __init__(self, **options):
+        self.options = options
+        RecordingPaddleOCR.instances.append(self)
+
+
+@pytest.fixture
+def paddle_ocr(monkeypatch):
+    RecordingPaddleOCR.instances = []
+    monkeypatch.setitem(sys.modules, "paddleocr", types.SimpleNamespace(PaddleOCR=RecordingPaddleOCR))
+    return RecordingPaddleOCR
+
+
+def build(monkeypatch, gpu_available, **kwargs):
+    monkeypatch.setattr(OCREngine, "is_gpu_available", lambda self: gpu_available)
+    engine = OCREngine(use_gpu=True, **kwargs)
+    engine._initialize_ocr()
+    return engine
+
+
+class TestRecognitionBatchSize:
+    """
+    Tests for the rec_batch_num passed to PaddleOCR.
+
+    These stand in for a peak-memory assertion: the recognizer's arena size
+    follows from rec_batch_num, which is the part OCREngine controls.
+    """
+
+    def test_cpu_recognizes_one_crop_per_call(self, monkeypatch, paddle_ocr):
+        build(monkeypatch, gpu_available=False)
+
+        options = paddle_ocr.instances[-1].options
+        assert options["use_gpu"] is False
+        assert options["rec_batch_num"] == OCREngine.CPU_REC_BATCH_NUM == 1
+
+    def test_gpu_uses_the_large_batch(self, monkeypatch, paddle_ocr):
+        build(monkeypatch, gpu_available=True)
+
+        options = paddle_ocr.instances[-1].options
+        assert options["use_gpu"] is True
+        assert options["rec_batch_num"] == OCREngine.REC_BATCH_NUM
+
+    def test_explicit_batch_size_overrides_the_default(self, monkeypatch, paddle_ocr):
+        build(monkeypatch, gpu_available=False, rec_batch_num=8)
+
+        assert paddle_ocr.instances[-1].options["rec_batch_num"] == 8
@@ -0,0 +1,121 @@
+"""Tests for the SQLite translation memory."""
+
+import sqlite3
+import threading
+import time
+
+from services.translation_memory import TranslationMemory
+
+
+MODEL = "gemini-2.5-pro"
+
+
+def key(text, source="en", target="es"):
+    return TranslationMemory.key(MODEL, target, source, text)
+
+
+class TestKey:
+    """Tests for request keys."""
+
+    def test_whitespace_is_normalized(self):
+        assert key("Hello   world") == key(" Hello\nworld\t")
+
+    def test_request_fields_are_part_of_the_key(self):
+        base = key("Hello")
+        assert key("Hello", source="fr") != base
+        assert key("Hello", target="de") != base
+        assert TranslationMemory.key("other-model", "es", "en", "Hello") != base
+        assert key("hello") != base
+
+    def test_key_is_16_bytes(self):
+        assert len(key("Hello")) == 16
+
+
+class TestStoreAndLookup:
+    """Tests for storing and fetching translations."""
+
+    def test_round_trip(self, tmp_path):
+        memory = TranslationMemory(str(tmp_path / "tm.db"))
+        memory.store([(key("Hello"), "Hola"), (key("Bye"), "Adiós")], "es", MODEL)
+
+        assert memory.lookup([key("Hello"), key("Bye"), key("Missing")]) == {
+            key("Hello"): "Hola",
+            key("Bye"): "Adiós",
+        }
+        memory.close()
+
+    def test_lookup_spans_several_chunks(self, tmp_path):
+        memory = TranslationMemory(str(tmp_path / "tm.db"))
+        entries = [(key(f"text {i}"), f"texto {i}") for i in range(TranslationMemory.LOOKUP_CHUNK_SIZE * 2 + 1)]
+        memory.store(entries, "es", MODEL)
+
+        assert memory.lookup([k for k, _ in entries]) == dict(entries)
+        memory.close()
+
+    def test_store_replaces_existing_entry(self, tmp_path):
+        memory = TranslationMemory(str(tmp_path / "tm.db"))
+        memory.store([(key("Hello"), "Hola")], "es", MODEL)
+        memory.store([(key("Hello"), "Buenas")], "es", MODEL)
+
+        assert memory.lookup([key("Hello")]) == {key("Hello"): "Buenas"}
+        memory.close()
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        path = str(tmp_path / "tm.db")
+        first = TranslationMemory(path)
+        first.store([(key("Hello"), "Hola")], "es", MODEL)
+        first.close()
+
+        second = TranslationMemory(path)
+        assert second.lookup([key("Hello")]) == {key("Hello"): "Hola"}
+        second.close()
+
+    def test_prune_removes_old_entries(self, tmp_path):
+        memory = TranslationMemory(str(tmp_path / "tm.db"))
+        memory.store([(key("Hello"), "Hola")], "es", MODEL)
+
+        assert memory.prune(time.time() + 1) == 1
+        assert memory.lookup([key("Hello")]) == {}
+        memory.close()
+
+
+class TestConcurrentAccess:
+    """Tests for sharing one database file."""
+
+    def test_database_uses_wal(self, tmp_path):
+        path = str(tmp_path / "tm.db")
+        TranslationMemory(path).close()
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        conn.close()
+
+    def test_concurrent_writers(self, tmp_path):
+        path = str(tmp_path / "tm.db")
+        shared = TranslationMemory(path)
+        errors = []
+
+        def write(worker, memory):
+            try:
+                for i in range(50):
+                    memory.store([(key(f"{worker}-{i}"), f"t{worker}-{i}")], "es", MODEL)
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        # Two threads on one instance plus a second instance on the same file
+        other = TranslationMemory(path)
+        threads = [
+            threading.Thread(target=write, args=(0, shared)),
+            threading.Thread(target=write, args=(1, shared)),
+            threading.Thread(target=write, args=(2, other)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        keys = [key(f"{worker}-{i}") for worker in range(3) for i in range(50)]
+        assert len(other.lookup(keys)) == 150
+        shared.close()
+        other.close()
@@ -0,0 +1,205 @@
+"""Tests for TranslationService prompt and response handling."""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("google.generativeai")
+
+from services import translation_service
+from services.translation_service import TranslationRequest, TranslationService
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    """GenerativeModel double answering every prompt with a fixed response."""
+
+    def __init__(self, text):
+        self.text = text
+        self.calls = []
+
+    async def generate_content_async(self, prompt, **kwargs):
+        self.calls.append((prompt, kwargs))
+        return FakeResponse(self.text)
+
+
+class TranslatingModel:
+    """GenerativeModel double prefixing every text of the JSON prompt with "es:"."""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def generate_content_async(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        texts = json.loads(prompt.split("Texts to translate:\n", 1)[1].split("\n\nRespond", 1)[0])
+        return FakeResponse(json.dumps({"translations": [f"es:{text}" for text in texts]}))
+
+
+class RecordingAsyncClient:
+    """GenerativeServiceAsyncClient double recording its key and event loop."""
+
+    def __init__(self, client_options):
+        self.api_key = client_options["api_key"]
+        self.loop = asyncio.get_running_loop()
+        self.transport = self
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def make_requests(*texts):
+    return [
+        TranslationRequest(text=text, source_lang="en", target_lang="es", block_id=f"text_{i}")
+        for i, text in enumerate(texts)
+    ]
+
+
+@pytest.fixture
+def service():
+    return TranslationService(api_key="test-api-key", target_lang="es")
+
+
+class TestParseTranslationResponse:
+    """Tests for JSON responses and the numbered-line fallback."""
+
+    def test_json_response(self, service):
+        response = json.dumps({"translations": [" hola ", "mundo"]})
+        assert service._parse_translation_response(response, 2) == ["hola", "mundo"]
+
+    def test_json_response_is_padded_and_truncated(self, service):
+        short = json.dumps({"translations": ["uno"]})
+        long = json.dumps({"translations": ["uno", "dos", "tres"]})
+        assert service._parse_translation_response(short, 3) == ["uno", "", ""]
+        assert service._parse_translation_response(long, 2) == ["uno", "dos"]
+
+    def test_json_non_string_entries_are_empty(self, service):
+        response = json.dumps({"translations": ["uno", None, 3]})
+        assert service._parse_translation_response(response, 3) == ["uno", "", ""]
+
+    def test_numbered_fallback(self, service):
+        response = "[1] hola\n[2] mundo\ncontinuado\n\n[3] adiós"
+        assert service._parse_translation_response(response, 3) == [
+            "hola", "mundo continuado", "adiós",
+        ]
+
+    def test_json_without_translations_falls_back(self, service):
+        assert service._parse_translation_response('{"text": "hola"}', 1) == [""]
+        assert service._parse_translation_response('{"translations": "hola"}', 1) == [""]
+
+
+class TestCallGeminiApi:
+    """Tests for the request sent to Gemini."""
+
+    def test_requests_json_schema(self, service):
+        model = FakeModel(json.dumps({"translations": ["hola", "mundo"]}))
+        service._model = model
+
+        result = asyncio.run(service._call_gemini_api_async(["hello", "world"], "es", "en"))
+
+        assert result == ["hola", "mundo"]
+        prompt, kwargs = model.calls[0]
+        assert kwargs["generation_config"] == TranslationService.GENERATION_CONFIG
+        assert json.dumps(["hello", "world"]) in prompt
+
+
+class TestMakeBatches:
+    """Tests for splitting requests into API calls."""
+
+    def test_batches_split_on_source_language(self, service):
+        requests = [
+            TranslationRequest(text=text, source_lang=source, target_lang="es", block_id=f"text_{i}")
+            for i, (text, source) in enumerate([("a", "en"), ("b", "en"), ("c", "fr"), ("d", "en")])
+        ]
+
+        batches = service._make_batches(requests)
+
+        assert [[req.text for req in batch] for batch in batches] == [["a", "b"], ["c"], ["d"]]
+
+    def test_each_prompt_names_its_source_language(self):
+        requests = [
+            TranslationRequest(text="Hello", source_lang="en", target_lang="es", block_id="text_0"),
+            TranslationRequest(text="Bonjour", source_lang="fr", target_lang="es", block_id="text_1"),
+        ]
+
+        with TranslationService("test-api-key", "es") as service:
+            model = TranslatingModel()
+            service._model = model
+            results = service.translate_batch(requests)
+
+        assert [result.translated_text for result in results] == ["es:Hello", "es:Bonjour"]
+        assert len(model.prompts) == 2
+        assert any("from en" in prompt and '"Hello"' in prompt for prompt in model.prompts)
+        assert any("from fr" in prompt and '"Bonjour"' in prompt for prompt in model.prompts)
+
+
+class TestTranslationMemory:
+    """Tests for translate_batch with a persistent translation memory."""
+
+    def test_stored_translations_skip_the_api(self, tmp_path):
+        cache_path = str(tmp_path / "tm.db")
+
+        with TranslationService("test-api-key", "es", cache_path=cache_path) as first:
+            first._model = TranslatingModel()
+            results = first.translate_batch(make_requests("Hello", "World"))
+        assert [result.translated_text for result in results] == ["es:Hello", "es:World"]
+
+        with TranslationService("test-api-key", "es", cache_path=cache_path) as second:
+            model = TranslatingModel()
+            second._model = model
+            results = second.translate_batch(make_requests("Hello", "New", "World"))
+
+        assert [result.translated_text for result in results] == ["es:Hello", "es:New", "es:World"]
+        assert [result.block_id for result in results] == ["text_0", "text_1", "text_2"]
+        assert len(model.prompts) == 1
+        assert json.dumps(["New"]) in model.prompts[0]
+
+    def test_failed_translations_are_not_stored(self, tmp_path):
+        cache_path = str(tmp_path / "tm.db")
+
+        with TranslationService("test-api-key", "es", cache_path=cache_path) as first:
+            first._model = FakeModel(json.dumps({"translations": []}))
+            first.translate_batch(make_requests("Hello"))
+
+        with TranslationService("test-api-key", "es", cache_path=cache_path) as second:
+            model = TranslatingModel()
+            second._model = model
+            results = second.translate_batch(make_requests("Hello"))
+
+        assert results[0].translated_text == "es:Hello"
+        assert len(model.prompts) == 1
+
+
+class TestClientOwnership:
+    """Tests for the per-service Gemini client."""
+
+    @pytest.fixture(autouse=True)
+    def recording_client(self, monkeypatch):
+        monkeypatch.setattr(translation_service.glm, "GenerativeServiceAsyncClient", RecordingAsyncClient)
+
+        def fail_configure(**kwargs):
+            raise AssertionError("genai.configure() shares clients across services")
+
+        monkeypatch.setattr(translation_service.genai, "configure", fail_configure)
+
+    def test_each_service_owns_a_client_on_its_loop(self):
+        with TranslationService("key-a", "es") as first, TranslationService("key-b", "es") as second:
+            clients = [first._async_client, second._async_client]
+
+            assert [client.api_key for client in clients] == ["key-a", "key-b"]
+            assert clients[0].loop is first._loop
+            assert clients[1].loop is second._loop
+            assert first._model._async_client is clients[0]
+            assert second._model._async_client is clients[1]
+
+    def test_close_closes_the_client(self):
+        with TranslationService("key-a", "es") as service:
+            client = service._async_client
+
+        assert client.closed
+        assert service._async_client is None